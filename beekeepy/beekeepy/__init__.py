@@ -14,6 +14,8 @@ __all__ = [
     "PackedAsyncBeekeeper",
     "InterfaceSettings",
     "Beekeeper",
+    "BeekeeperPool",
+    "BeekeeperSpares",
     "PackedSyncBeekeeper",
     "Session",
     "InterfaceSettings",
@@ -37,6 +39,8 @@ if TYPE_CHECKING:
         Wallet,
     )
     from beekeepy._interface.settings import InterfaceSettings
+    from beekeepy._interface.synchronous.beekeeper_pool import BeekeeperPool
+    from beekeepy._interface.synchronous.beekeeper_spares import BeekeeperSpares
     from beekeepy._runnable_handle.beekeeper_utilities import close_already_running_beekeeper, find_running_beekeepers
 
 __getattr__ = lazy_module_factory(
@@ -61,4 +65,6 @@ __getattr__ = lazy_module_factory(
     ("beekeepy._runnable_handle.beekeeper_utilities", "close_already_running_beekeeper"),
     ("beekeepy._runnable_handle.beekeeper_utilities", "find_running_beekeepers"),
     ("beekeepy._interface.settings", "InterfaceSettings"),
+    ("beekeepy._interface.synchronous.beekeeper_pool", "BeekeeperPool"),
+    ("beekeepy._interface.synchronous.beekeeper_spares", "BeekeeperSpares"),
 )
@@ -4,7 +4,7 @@ import re
 from abc import ABC
 from collections import defaultdict
 from enum import IntEnum
-from functools import wraps
+from functools import cache, wraps
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -42,6 +42,31 @@ def _convert_pascal_case_to_sneak_case(pascal_case_input: str) -> str:
     return re.sub(r"(?<!^)(?=[A-Z])", "_", pascal_case_input).lower()
 
 
+def _return_type_resolver(wrapped_function: Callable[..., Any]) -> Callable[[], Any]:
+    """Returns function, which resolves return type of given function on first call and caches it.
+
+    Note: Resolving cannot be done at decoration time, because annotations may refer to not yet defined names.
+    """
+
+    @cache
+    def resolve() -> Any:
+        return get_type_hints(wrapped_function)["return"]
+
+    return resolve
+
+
+@cache
+def _get_json_dumps(serialization_type: Literal["hf26", "legacy"], *, is_testnet: bool) -> Callable[[Any], str]:
+    from schemas.encoders import get_hf26_encoder, get_legacy_encoder, get_legacy_encoder_testnet
+
+    encoder = (
+        get_hf26_encoder()
+        if serialization_type == "hf26"
+        else (get_legacy_encoder_testnet() if is_testnet else get_legacy_encoder())
+    )
+    return lambda x: encoder.encode(x).decode()
+
+
 class AbstractApi(ABC, Generic[HandleT]):
     """Base class for apis."""
 
@@ -53,14 +78,9 @@ class AbstractApi(ABC, Generic[HandleT]):
         return _convert_pascal_case_to_sneak_case(method.__qualname__.split(".")[0])
 
     def json_dumps(self) -> Callable[[Any], str]:
-        from schemas.encoders import get_hf26_encoder, get_legacy_encoder, get_legacy_encoder_testnet
-
-        encoder = (
-            get_hf26_encoder()
-            if self._serialize_type() == "hf26"
-            else (get_legacy_encoder_testnet() if self._owner.is_testnet() else get_legacy_encoder())
-        )
-        return lambda x: encoder.encode(x).decode()
+        serialization_type = self._serialize_type()
+        is_testnet = serialization_type == "legacy" and self._owner.is_testnet()
+        return _get_json_dumps(serialization_type, is_testnet=is_testnet)
 
     def _serialize_params(self, arguments: ApiArgumentsToSerialize) -> str:
         """Return serialized given params. Can be overloaded."""
@@ -152,11 +172,12 @@ class AbstractSyncApi(AbstractApi[SyncSendable]):
         wrapped_function_name = wrapped_function.__name__
         api_name = cls._get_api_name_from_method(wrapped_function)
         cls._register_method(api=api_name, endpoint=wrapped_function_name, sync=True)
+        endpoint = f"{api_name}.{wrapped_function_name}"
+        expected_type = _return_type_resolver(wrapped_function)
 
         @wraps(wrapped_function)
         def impl(this: AbstractSyncApi, *args: P.args, **kwargs: P.kwargs) -> R:
             this._verify_positional_keyword_args(args, kwargs)
-            endpoint = f"{api_name}.{wrapped_function_name}"
             args_, kwargs_ = this._additional_arguments_actions(endpoint, (args, kwargs))
             data = build_json_rpc_call(
                 method=endpoint,
@@ -165,7 +186,7 @@ class AbstractSyncApi(AbstractApi[SyncSendable]):
             )
             return this._owner._send(  # type: ignore[no-any-return]
                 method="POST",
-                expected_type=get_type_hints(wrapped_function)["return"],
+                expected_type=expected_type(),
                 serialization_type=this._serialize_type(),
                 data=data,
             ).result
@@ -193,11 +214,12 @@ class AbstractAsyncApi(AbstractApi[AsyncSendable]):
         wrapped_function_name = wrapped_function.__name__
         api_name = cls._get_api_name_from_method(wrapped_function)  # type: ignore[arg-type]
         cls._register_method(api=api_name, endpoint=wrapped_function_name, sync=False)
+        endpoint = f"{api_name}.{wrapped_function_name}"
+        expected_type = _return_type_resolver(wrapped_function)
 
         @wraps(wrapped_function)
         async def impl(this: AbstractAsyncApi, *args: P.args, **kwargs: P.kwargs) -> R:
             this._verify_positional_keyword_args(args, kwargs)
-            endpoint = f"{api_name}.{wrapped_function_name}"
             args_, kwargs_ = await this._additional_arguments_actions(endpoint, (args, kwargs))
             data = build_json_rpc_call(
                 method=endpoint,
@@ -207,7 +229,7 @@ class AbstractAsyncApi(AbstractApi[AsyncSendable]):
             return (  # type: ignore[no-any-return]
                 await this._owner._async_send(
                     method="POST",
-                    expected_type=get_type_hints(wrapped_function)["return"],
+                    expected_type=expected_type(),
                     serialization_type=this._serialize_type(),
                     data=data,
                 )
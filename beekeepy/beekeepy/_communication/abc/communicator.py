@@ -17,10 +17,14 @@ from beekeepy._communication.abc.communicator_models import (
     SyncCallback,
 )
 from beekeepy._communication.settings import CommunicationSettings
+from beekeepy._communication.tracing import COMMUNICATOR_SEND_SPAN, NOT_TRACED, request_attributes, trace
 from beekeepy._utilities.settings_holder import SharedSettingsHolder
 from beekeepy.exceptions import TimeoutExceededError
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from beekeepy._communication.tracing import Span
     from beekeepy._communication.url import HttpUrl
 
 
@@ -134,29 +138,34 @@ class AbstractCommunicator(SharedSettingsHolder[CommunicationSettings], ABC):
         callbacks: Callbacks,
         data: str | None = None,
     ) -> str:
-        request = self._prepare_request(url, method, data)
-        if self.__is_available(callbacks.prepare_request):
-            request = self.__call_callback(callbacks.prepare_request, Request, callbacks.request_error, request=request)
+        with self.__trace_send(url, method, data) as span:
+            request = self._prepare_request(url, method, data)
+            if self.__is_available(callbacks.prepare_request):
+                request = self.__call_callback(
+                    callbacks.prepare_request, Request, callbacks.request_error, request=request
+                )
 
-        try:
-            response = self._send(request)
-        except Exception as error:
-            if self.__is_available(callbacks.communicator_error):
-                self.__call_callback(
-                    callbacks.communicator_error, type(None), None, request=request, response=None, exception=error
+            try:
+                response = self._send(request)
+            except Exception as error:
+                if self.__is_available(callbacks.communicator_error):
+                    self.__call_callback(
+                        callbacks.communicator_error, type(None), None, request=request, response=None, exception=error
+                    )
+                else:
+                    raise
+
+            if self.__is_available(callbacks.process_response):
+                response = self.__call_callback(
+                    callbacks.process_response,
+                    Response,
+                    callbacks.response_error,
+                    request=request,
+                    response=response,
                 )
-            else:
-                raise
-
-        if self.__is_available(callbacks.process_response):
-            response = self.__call_callback(
-                callbacks.process_response,
-                Response,
-                callbacks.response_error,
-                request=request,
-                response=response,
-            )
 
+            if span is not None:
+                self.__describe_response(span, response)
         return response.body
 
     async def __async_send(
@@ -166,41 +175,53 @@ class AbstractCommunicator(SharedSettingsHolder[CommunicationSettings], ABC):
         callbacks: AsyncCallbacks,
         data: str | None = None,
     ) -> str:
-        request = self._prepare_request(url, method, data)
-        if self.__is_available(callbacks.prepare_request):
-            request = await self.__call_async_callback(
-                cast(AsyncCallback, callbacks.prepare_request),
-                Request,
-                cast(AsyncErrorCallback | ErrorCallback, callbacks.request_error),
-                request=request,
-            )
+        with self.__trace_send(url, method, data) as span:
+            request = self._prepare_request(url, method, data)
+            if self.__is_available(callbacks.prepare_request):
+                request = await self.__call_async_callback(
+                    cast(AsyncCallback, callbacks.prepare_request),
+                    Request,
+                    cast(AsyncErrorCallback | ErrorCallback, callbacks.request_error),
+                    request=request,
+                )
 
-        try:
-            response = await self._async_send(request)
-        except Exception as error:
-            if self.__is_available(callbacks.communicator_error):
-                await self.__call_async_callback(
-                    cast(AsyncCallback, callbacks.communicator_error),
-                    type(None),
-                    None,
+            try:
+                response = await self._async_send(request)
+            except Exception as error:
+                if self.__is_available(callbacks.communicator_error):
+                    await self.__call_async_callback(
+                        cast(AsyncCallback, callbacks.communicator_error),
+                        type(None),
+                        None,
+                        request=request,
+                        response=None,
+                        exception=error,
+                    )
+                else:
+                    raise
+
+            if self.__is_available(callbacks.process_response):
+                response = await self.__call_async_callback(
+                    cast(AsyncCallback, callbacks.process_response),
+                    Response,
+                    cast(AsyncErrorCallback | ErrorCallback, callbacks.response_error),
                     request=request,
-                    response=None,
-                    exception=error,
+                    response=response,
                 )
-            else:
-                raise
-
-        if self.__is_available(callbacks.process_response):
-            response = await self.__call_async_callback(
-                cast(AsyncCallback, callbacks.process_response),
-                Response,
-                cast(AsyncErrorCallback | ErrorCallback, callbacks.response_error),
-                request=request,
-                response=response,
-            )
 
+            if span is not None:
+                self.__describe_response(span, response)
         return response.body
 
+    def __trace_send(self, url: HttpUrl, method: Methods, data: str | None) -> AbstractContextManager[Span | None]:
+        if (tracer := self._settings.tracer) is None:
+            return NOT_TRACED
+        return trace(tracer, COMMUNICATOR_SEND_SPAN, request_attributes(url=url, method=method, data=data))
+
+    def __describe_response(self, span: Span, response: Response) -> None:
+        span.set_attribute("http.response.status_code", response.status_code)
+        span.set_attribute("http.response.body.size", len(response.body))
+
     def __call_callback(
         self,
         callback: SyncCallback,
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Sequence
 
 from beekeepy._communication.abc.rules import ContinueMode
+from beekeepy._communication.load_balancer import LoadBalancer
+from beekeepy._communication.metrics import RETRIES_TOTAL, endpoint_label
+from beekeepy._communication.retry_policy import RetryPolicy
+from beekeepy._communication.tracing import (
+    NOT_TRACED,
+    OVERSEER_SEND_SPAN,
+    RESPONSE_PARSE_SPAN,
+    RETRY_EVENT,
+    request_attributes,
+    trace,
+)
 from beekeepy._utilities.context import SelfContextSync
+from beekeepy._utilities.json_codec import JSON_DECODE_ERRORS, json_loads
 from beekeepy.exceptions import GroupedErrorsError, Json, UnknownDecisionPathError
 
 if TYPE_CHECKING:
+    from datetime import timedelta
     from types import TracebackType
 
     from beekeepy._communication.abc.communicator import AbstractCommunicator
     from beekeepy._communication.abc.communicator_models import AsyncCallbacks, Callbacks, Methods
     from beekeepy._communication.abc.rules import Rules, RulesClassifier
+    from beekeepy._communication.circuit_breaker import CircuitBreaker
+    from beekeepy._communication.metrics import MetricsSink
+    from beekeepy._communication.tracing import Span
     from beekeepy._communication.url import HttpUrl
     from beekeepy.exceptions import OverseerError
 
@@ -32,16 +48,21 @@ class _OverseerExceptionManager(SelfContextSync):
     EXIT_LOOP: ClassVar[bool] = False
     CONTINUE_LOOP: ClassVar[bool] = True
 
-    def __init__(self, owner: AbstractOverseer, rules: Rules) -> None:
+    def __init__(self, owner: AbstractOverseer, rules: Rules, url: HttpUrl, span: Span | None = None) -> None:
         super().__init__()
         self._owner = owner
         self._rules = rules
+        self._url = url
+        self._span = span
         self._exception_rules = rules.grouped_exceptions()
         self._exceptions: Sequence[OverseerError] = []
         self._last_status = ContinueMode.INF
         self._counter = 0
         self._last_parsed_response: Json | list[Json] | Exception = {}
         self._response_read_or_exception_occurred = False
+        self._started_at = time.monotonic()
+        self._retries = 0
+        self._infinite_retries = 0
         self._reset_counter()
 
     @property
@@ -54,16 +75,20 @@ class _OverseerExceptionManager(SelfContextSync):
         return list(self._exceptions)
 
     def update(self, response: str) -> None:
-        self._last_parsed_response = self._owner._parse(response)
+        with self._owner._trace_parse(response):
+            self._last_parsed_response = self._owner._parse(response)
         self._exceptions, self._last_status = self._owner._oversee(
             rules=self._rules,
             response=self._last_parsed_response,
             response_raw=response,
         )
+        if self._exceptions and self.__is_retry_planned() and not self.__is_retry_allowed():
+            self._last_status = ContinueMode.BREAK
 
     def continue_loop(self) -> bool:
         if self._last_status == ContinueMode.INF:
             self._reset_counter()
+            self.__record_retry()
             return self.CONTINUE_LOOP
 
         if self._last_status == ContinueMode.BREAK:
@@ -77,12 +102,16 @@ class _OverseerExceptionManager(SelfContextSync):
 
         if self._counter < 0:
             self.__raise()
+        self.__record_retry()
         return self.CONTINUE_LOOP
 
     def should_sleep(self) -> bool:
         if len(self._exceptions) == 0:
             # No exceptions, no need to sleep
             return False
+        if self._last_status == ContinueMode.BREAK:
+            # Exception will be raised, no need to sleep
+            return False
         for exception in self._exceptions:
             if type(exception) in self._exception_rules.preliminary:
                 # Preliminary exception, no need to sleep
@@ -92,6 +121,11 @@ class _OverseerExceptionManager(SelfContextSync):
                 return False
         return True
 
+    def next_retry_period(self) -> timedelta:
+        period = self._owner._retry_policy.period(self._owner.communicator._settings, self._retries)
+        self._retries += 1
+        return period
+
     def _finally(self) -> None:
         if not self._response_read_or_exception_occurred:
             if self._exceptions:
@@ -102,14 +136,40 @@ class _OverseerExceptionManager(SelfContextSync):
         self._response_read_or_exception_occurred = True
         return super()._handle_exception(ex, tb)
 
+    def __record_retry(self) -> None:
+        if not self._exceptions:
+            return
+        reason = type(self._exceptions[0]).__name__
+        if self._owner.metrics is not None:
+            self._owner.metrics.increment(
+                RETRIES_TOTAL, labels={"endpoint": endpoint_label(self._url), "reason": reason}
+            )
+        if self._span is not None:
+            self._span.add_event(RETRY_EVENT, {"reason": reason, "mode": self._last_status.name})
+
     def __raise(self) -> None:
         raise self._exceptions[0] from self.__grouped_error()
 
     def __grouped_error(self) -> GroupedErrorsError:
         return GroupedErrorsError(self._exceptions)
 
+    def __is_retry_planned(self) -> bool:
+        return self._last_status == ContinueMode.INF or (
+            self._last_status == ContinueMode.CONTINUE and self._counter > 0
+        )
+
+    def __is_retry_allowed(self) -> bool:
+        settings = self._owner.communicator._settings
+        if self._last_status == ContinueMode.INF:
+            self._infinite_retries += 1
+            if settings.max_infinite_retries is not None and self._infinite_retries > settings.max_infinite_retries:
+                return False
+
+        policy = self._owner._retry_policy
+        return not policy.is_time_exceeded(settings, self._started_at) and policy.acquire(settings)
+
     def _reset_counter(self) -> None:
-        self._counter = self._owner.communicator.settings.max_retries
+        self._counter = self._owner.communicator._settings.max_retries
 
 
 class AbstractOverseer(ABC):
@@ -117,49 +177,111 @@ class AbstractOverseer(ABC):
         self,
         *args: Any,
         communicator: AbstractCommunicator,
-        json_loads: Callable[[str], Json | list[Json]] = json.loads,
+        json_loads: Callable[[str], Json | list[Json]] = json_loads,
+        circuit_breaker: CircuitBreaker | None = None,
+        load_balancer: LoadBalancer | None = None,
+        metrics: MetricsSink | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.communicator = communicator
+        self.circuit_breaker = circuit_breaker
+        self.load_balancer = load_balancer
+        self.metrics = metrics
         self._json_loads = json_loads
+        self._retry_policy = RetryPolicy()
 
     def send(
         self, url: HttpUrl, method: Methods, data: str | None = None, callbacks: Callbacks | None = None
     ) -> Json | list[Json]:
-        with _OverseerExceptionManager(owner=self, rules=self.__rules(url=url, request=data)) as mgr:
+        request = self.__parse_request(data)
+        endpoint = None if self.load_balancer is None else self.load_balancer.select(request)
+        url = url if endpoint is None else LoadBalancer.route(url, endpoint)
+        with (
+            self.__trace_send(url=url, method=method, data=data, request=request) as span,
+            _OverseerExceptionManager(
+                owner=self, rules=self.__rules(url=url, request=request), url=url, span=span
+            ) as mgr,
+        ):
             while mgr.continue_loop():
-                response = self.communicator.send(url=url, method=method, data=data, callbacks=callbacks)
+                with self.__circuit_guard(url=url, data=data), self.__load_balancer_guard(endpoint):
+                    response = self.communicator.send(url=url, method=method, data=data, callbacks=callbacks)
                 mgr.update(response)
                 if mgr.should_sleep():
-                    self._sleep_for_retry()
-            return mgr.response
+                    self._sleep_for_retry(mgr.next_retry_period())
+            return self.__learn(endpoint, request, mgr.response)
         raise self._unknown_decision_path_after_exiting_context("send")
 
     async def async_send(
         self, url: HttpUrl, method: Methods, data: str | None = None, callbacks: AsyncCallbacks | None = None
     ) -> Json | list[Json]:
-        with _OverseerExceptionManager(owner=self, rules=self.__rules(url=url, request=data)) as mgr:
+        request = self.__parse_request(data)
+        endpoint = None if self.load_balancer is None else await self.load_balancer.async_select(request)
+        url = url if endpoint is None else LoadBalancer.route(url, endpoint)
+        with (
+            self.__trace_send(url=url, method=method, data=data, request=request) as span,
+            _OverseerExceptionManager(
+                owner=self, rules=self.__rules(url=url, request=request), url=url, span=span
+            ) as mgr,
+        ):
             while mgr.continue_loop():
-                response = await self.communicator.async_send(url=url, method=method, data=data, callbacks=callbacks)
+                with self.__circuit_guard(url=url, data=data), self.__load_balancer_guard(endpoint):
+                    response = await self.communicator.async_send(
+                        url=url, method=method, data=data, callbacks=callbacks
+                    )
                 mgr.update(response)
                 if mgr.should_sleep():
-                    await self._async_sleep_for_retry()
-            return mgr.response
+                    await self._async_sleep_for_retry(mgr.next_retry_period())
+            return self.__learn(endpoint, request, mgr.response)
         raise self._unknown_decision_path_after_exiting_context("async_send")
 
     @abstractmethod
     def _rules(self) -> RulesClassifier: ...
 
-    def __rules(self, url: HttpUrl, request: str | None) -> Rules:
-        return self._rules().instantiate(url=url, request=self._json_loads(request) if request else None)
+    def __trace_send(
+        self, url: HttpUrl, method: Methods, data: str | None, request: Json | list[Json] | None
+    ) -> AbstractContextManager[Span | None]:
+        if (tracer := self.communicator._settings.tracer) is None:
+            return NOT_TRACED
+        return trace(tracer, OVERSEER_SEND_SPAN, request_attributes(url=url, method=method, data=data, request=request))
+
+    def _trace_parse(self, response: str) -> AbstractContextManager[Span | None]:
+        if (tracer := self.communicator._settings.tracer) is None:
+            return NOT_TRACED
+        return trace(tracer, RESPONSE_PARSE_SPAN, {"http.response.body.size": len(response)})
+
+    def __circuit_guard(self, url: HttpUrl, data: str | None) -> AbstractContextManager[None]:
+        if self.circuit_breaker is None:
+            return nullcontext()
+        return self.circuit_breaker.guard(url=url, request=data)
+
+    def __load_balancer_guard(self, endpoint: HttpUrl | None) -> AbstractContextManager[None]:
+        if self.load_balancer is None or endpoint is None:
+            return nullcontext()
+        return self.load_balancer.track(endpoint)
+
+    def __learn(
+        self, endpoint: HttpUrl | None, request: Json | list[Json] | None, response: Json | list[Json]
+    ) -> Json | list[Json]:
+        if self.load_balancer is not None and endpoint is not None:
+            self.load_balancer.learn(endpoint, request, response)
+        return response
+
+    def __parse_request(self, data: str | None) -> Json | list[Json] | None:
+        return self._json_loads(data) if data else None
+
+    def __rules(self, url: HttpUrl, request: Json | list[Json] | None) -> Rules:
+        return self._rules().instantiate(url=url, request=request)
 
     def _oversee(
         self, rules: Rules, response: Json | list[Json] | Exception, response_raw: str
     ) -> tuple[list[OverseerError], ContinueMode]:
         exceptions: list[OverseerError] = []
+        matched_lookups = rules.matched_lookups(response)
 
         for rule, status in rules.resolved_rules():
+            if rule.LOOKUP_PATTERNS and type(rule) not in matched_lookups:
+                continue
             exceptions_to_add = rule.check(response=response, response_raw=response_raw)
             exceptions.extend(exceptions_to_add)
             for ex in exceptions_to_add:
@@ -176,7 +298,7 @@ class AbstractOverseer(ABC):
         error_from_parsing: Exception | None = None
         try:
             response_parsed = self._json_loads(response)
-        except json.JSONDecodeError as error:
+        except JSON_DECODE_ERRORS as error:
             error_from_parsing = error
 
         response_for_rules = response_parsed or error_from_parsing
@@ -193,10 +315,10 @@ class AbstractOverseer(ABC):
             f"any exception nor returning any value in {type(self)}:{func}"
         )
 
-    async def _async_sleep_for_retry(self) -> None:
+    async def _async_sleep_for_retry(self, period: timedelta) -> None:
         """Sleeps using asyncio.sleep (for asynchronous implementations)."""
-        await asyncio.sleep(self.communicator.settings.period_between_retries.total_seconds())
+        await asyncio.sleep(period.total_seconds())
 
-    def _sleep_for_retry(self) -> None:
+    def _sleep_for_retry(self, period: timedelta) -> None:
         """Sleeps using time.sleep (for synchronous implementations)."""
-        time.sleep(self.communicator.settings.period_between_retries.total_seconds())
+        time.sleep(period.total_seconds())
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import TYPE_CHECKING, Iterator, Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Mapping, Sequence
+
+import msgspec
 
 if TYPE_CHECKING:
     from beekeepy._communication.url import HttpUrl
@@ -28,13 +32,28 @@ class RulesClassifier:
     """Checks if response is ok just settings.max_retries, after this rethrows."""
 
     def instantiate(self, url: HttpUrl, request: Json | list[Json] | None) -> Rules:
+        request_index = build_request_index(request)
+
+        def create(rule_cls: type[OverseerRule]) -> OverseerRule:
+            return rule_cls(url=url, request=request, request_index=request_index)
+
         return Rules(
-            preliminary=[rule_cls(url=url, request=request) for rule_cls in self.preliminary],
-            infinitely_repeatable=[rule_cls(url=url, request=request) for rule_cls in self.infinitely_repeatable],
-            finitely_repeatable=[rule_cls(url=url, request=request) for rule_cls in self.finitely_repeatable],
+            preliminary=[create(rule_cls) for rule_cls in self.preliminary],
+            infinitely_repeatable=[create(rule_cls) for rule_cls in self.infinitely_repeatable],
+            finitely_repeatable=[create(rule_cls) for rule_cls in self.finitely_repeatable],
         )
 
 
+def build_request_index(request: Json | list[Json] | None) -> Mapping[Any, Json]:
+    """Maps ids of requests in batch to requests, if id repeats first occurrence wins. Empty for singular request."""
+    request_index: dict[Any, Json] = {}
+    if isinstance(request, list):
+        for req in request:
+            if isinstance(req, dict):
+                request_index.setdefault(req.get("id", {}), req)
+    return request_index
+
+
 @dataclass(kw_only=True)
 class RulesExceptions:
     preliminary: Sequence[type[OverseerError]]
@@ -71,6 +90,30 @@ class Rules:
         assert fallback_rule is not None, "ErrorInResponse rule was not found among rules"
         yield fallback_rule
 
+    def matched_lookups(self, response: Json | list[Json] | Exception) -> set[type[OverseerRule]]:
+        """Scans `error` parts of response once against lookup patterns of all rules.
+
+        Returns types of rules which patterns were found, rules with lookup patterns not present here can be skipped.
+        """
+        if isinstance(response, Exception):
+            return set()
+
+        lookup = _compile_lookup(tuple(type(rule) for rule in self.all()))
+        if lookup is None:
+            return set()
+
+        matched: set[type[OverseerRule]] = set()
+        for item in response if isinstance(response, list) else [response]:
+            if isinstance(item, dict) and "error" in item:
+                rendered = OverseerRule.render_error(item)
+                matched.update(lookup.owners[match.lastgroup] for match in lookup.pattern.finditer(rendered))  # type: ignore[index]
+        return matched
+
+    def all(self) -> Iterator[OverseerRule]:
+        yield from self.preliminary
+        yield from self.infinitely_repeatable
+        yield from self.finitely_repeatable
+
     def grouped_exceptions(self) -> RulesExceptions:
         return RulesExceptions(
             preliminary=[rule.expected_exception() for rule in self.preliminary],
@@ -79,10 +122,40 @@ class Rules:
         )
 
 
+@dataclass(kw_only=True, frozen=True)
+class _CompiledLookup:
+    pattern: re.Pattern[str]
+    """Alternation of lookup patterns of all rules, each one wrapped in lookahead with named group."""
+
+    owners: Mapping[str, type[OverseerRule]]
+    """Maps group names from `pattern` to rules which declared them."""
+
+
+@cache
+def _compile_lookup(rule_types: tuple[type[OverseerRule], ...]) -> _CompiledLookup | None:
+    alternatives: list[str] = []
+    owners: dict[str, type[OverseerRule]] = {}
+    for rule_type in rule_types:
+        for pattern in rule_type.LOOKUP_PATTERNS:
+            group_name = f"lookup{len(alternatives)}"
+            alternatives.append(f"(?=(?P<{group_name}>{pattern.pattern}))")
+            owners[group_name] = rule_type
+
+    if not alternatives:
+        return None
+    return _CompiledLookup(pattern=re.compile("|".join(alternatives)), owners=owners)
+
+
 class OverseerRule(ABC):
-    def __init__(self, url: HttpUrl, request: Json | list[Json] | None) -> None:
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = ()
+    """Patterns searched in `error` part of response, if set rule is checked only when one of them is found."""
+
+    def __init__(
+        self, url: HttpUrl, request: Json | list[Json] | None, request_index: Mapping[Any, Json] | None = None
+    ) -> None:
         self.url = url
         self.request = request or {}  # if None, then this is REST request
+        self._request_index = build_request_index(request) if request_index is None else request_index
 
     def check(self, response: Json | list[Json] | Exception, response_raw: str) -> list[OverseerError]:
         """Call to verify response."""
@@ -110,13 +183,17 @@ class OverseerRule(ABC):
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
         """Overload this method to verify response in case of singular response."""
 
+    @staticmethod
+    def render_error(parsed_response: Json) -> str:
+        """Renders `error` part of response as json text, empty string if there is no error."""
+        if (error := parsed_response.get("error")) is None:
+            return ""
+        return msgspec.json.encode(error).decode()
+
     def _get_matching_request(self, request_id: int) -> Json:
         """Searches for request of given id in case of array (batch) result. In case of singular request, returns it."""
-        if isinstance(self.request, list):
-            for req in self.request:
-                assert isinstance(req, dict), "All items in batch request has to be json objects"
-                if req.get("id", {}) == request_id:
-                    return req
+        if isinstance(self.request, list) and (req := self._request_index.get(request_id)) is not None:
+            return req
         assert isinstance(self.request, dict), f"self.request is not a dict, nor list, but is `{type(self.request)}`"
         return self.request
 
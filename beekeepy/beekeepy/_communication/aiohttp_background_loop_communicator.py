@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from beekeepy._communication.aiohttp_communicator import AioHttpCommunicator
+from beekeepy._utilities.event_loop_thread import EventLoopThread
+
+if TYPE_CHECKING:
+    from beekeepy._communication.abc.communicator_models import Request, Response
+    from beekeepy._communication.settings import CommunicationSettings
+
+
+class AioHttpBackgroundLoopCommunicator(AioHttpCommunicator):
+    """Provides support for aiohttp library for both sync and async callers.
+
+    Every request is executed on single, long-lived event loop running in background thread, so aiohttp session
+    (and its keep-alive connection pool) is shared between synchronous and asynchronous callers.
+    """
+
+    def __init__(self, *args: Any, settings: CommunicationSettings, **kwargs: Any) -> None:
+        super().__init__(*args, settings=settings, **kwargs)
+        self.__loop_thread = EventLoopThread(name=f"{type(self).__name__}-{id(self):x}")
+
+    def _send(self, request: Request) -> Response:
+        return self.__loop_thread.run(super()._async_send(request))
+
+    async def _async_send(self, request: Request) -> Response:
+        return await self.__loop_thread.async_run(super()._async_send(request))
+
+    def teardown(self) -> None:
+        if self.__loop_thread.is_running():
+            self.__loop_thread.run(self._close_session())
+        self.__loop_thread.close()
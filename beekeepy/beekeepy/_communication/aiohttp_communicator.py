@@ -25,9 +25,24 @@ class AioHttpCommunicator(AbstractCommunicator):
     @property
     async def session(self) -> aiohttp.ClientSession:
         if self.__session is None:
-            self.__session = aiohttp.ClientSession()
+            self.__session = aiohttp.ClientSession(connector=self._create_connector())
         return self.__session
 
+    def _create_connector(self) -> aiohttp.BaseConnector:
+        if self.settings.unix_socket_path is not None:
+            return aiohttp.UnixConnector(
+                path=self.settings.unix_socket_path.as_posix(),
+                limit=self.settings.max_connections,
+                limit_per_host=self.settings.max_connections_per_host,
+                keepalive_timeout=self.settings.keepalive_timeout.total_seconds(),
+            )
+        return aiohttp.TCPConnector(
+            limit=self.settings.max_connections,
+            limit_per_host=self.settings.max_connections_per_host,
+            keepalive_timeout=self.settings.keepalive_timeout.total_seconds(),
+            ttl_dns_cache=int(self.settings.dns_cache_ttl.total_seconds()),
+        )
+
     async def _async_send(self, request: Request) -> Response:
         """Sends to given url given data asynchronously."""
         try:
@@ -51,4 +66,9 @@ class AioHttpCommunicator(AbstractCommunicator):
 
     def teardown(self) -> None:
         if self.__session is not None:
-            self._asyncio_run(self.__session.close())
+            self._asyncio_run(self._close_session())
+
+    async def _close_session(self) -> None:
+        if self.__session is not None:
+            session, self.__session = self.__session, None
+            await session.close()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from beekeepy.exceptions import CircuitOpenError, CommunicationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from beekeepy._communication.url import HttpUrl
+
+__all__ = ["CircuitBreaker", "CircuitState"]
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    """Requests are sent normally."""
+
+    OPEN = "open"
+    """Requests fail immediately with CircuitOpenError."""
+
+    HALF_OPEN = "half_open"
+    """Single probe request is sent, its result decides whether circuit will be closed or opened again."""
+
+
+@dataclass(kw_only=True)
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+
+
+class CircuitBreaker:
+    """Tracks failures of communication per endpoint and fails fast while endpoint is considered unavailable.
+
+    Only communication errors (connection errors, timeouts) are counted as failures, error responses are not.
+    Instance is thread-safe and is not copied together with settings, so it can be shared by many handles.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, probe_interval: timedelta = timedelta(seconds=5)) -> None:
+        assert failure_threshold > 0, "failure_threshold has to be positive"
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.__circuits: dict[HttpUrl, _Circuit] = {}
+        self.__lock = Lock()
+
+    def state(self, url: HttpUrl) -> CircuitState:
+        with self.__lock:
+            circuit = self.__circuits.get(url)
+            return CircuitState.CLOSED if circuit is None else circuit.state
+
+    def before_request(self, url: HttpUrl, request: str | None) -> None:
+        """Raises CircuitOpenError if request to given url should not be sent."""
+        with self.__lock:
+            circuit = self.__circuits.get(url)
+            if circuit is None or circuit.state == CircuitState.CLOSED:
+                return
+
+            retry_after = circuit.opened_at + self.probe_interval.total_seconds() - time.monotonic()
+            if circuit.state == CircuitState.OPEN and retry_after <= 0:
+                circuit.state = CircuitState.HALF_OPEN
+                return
+
+        raise CircuitOpenError(url=url, request=request or "", retry_after=max(retry_after, 0.0))
+
+    def record_success(self, url: HttpUrl) -> None:
+        with self.__lock:
+            self.__circuits.pop(url, None)
+
+    def record_failure(self, url: HttpUrl) -> None:
+        with self.__lock:
+            circuit = self.__circuits.setdefault(url, _Circuit())
+            circuit.failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Closes all circuits."""
+        with self.__lock:
+            self.__circuits.clear()
+
+    @contextmanager
+    def guard(self, url: HttpUrl, request: str | None) -> Iterator[None]:
+        """Wraps sending of single request, records its result."""
+        self.before_request(url=url, request=request)
+        try:
+            yield
+        except CommunicationError:
+            self.record_failure(url)
+            raise
+        except BaseException:
+            self.__abandon_probe(url)
+            raise
+        self.record_success(url)
+
+    def __abandon_probe(self, url: HttpUrl) -> None:
+        """Probe ended without telling anything about endpoint, next one will be allowed after probe_interval."""
+        with self.__lock:
+            circuit = self.__circuits.get(url)
+            if circuit is not None and circuit.state == CircuitState.HALF_OPEN:
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import count
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from beekeepy._communication.is_url_reachable import async_is_url_reachable, sync_is_url_reachable
+from beekeepy._communication.url import HttpUrl
+from beekeepy.exceptions import CommunicationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from typing_extensions import Self
+
+    from beekeepy.exceptions import Json
+
+__all__ = ["LoadBalancer", "LoadBalancingStrategy"]
+
+LoadBalancingStrategy = Literal["round_robin", "least_outstanding", "latency"]
+
+
+def _as_list(content: Json | list[Json] | None) -> list[Json]:
+    if content is None:
+        return []
+    return content if isinstance(content, list) else [content]
+
+
+@dataclass(kw_only=True)
+class _EndpointState:
+    url: HttpUrl
+    outstanding: int = 0
+    latency: float | None = None
+    """Exponentially weighted moving average of response time in seconds."""
+    healthy: bool = True
+    checked_at: float = 0.0
+
+
+class LoadBalancer:
+    """Distributes requests between many endpoints serving the same service.
+
+    Requests carrying session token are always sent to endpoint on which such session has been created.
+    Endpoint which failed with communication error is skipped until it passes health check,
+    performed not more often than once per `health_check_interval`.
+
+    Note: Instance is thread-safe and is not copied together with settings, so it can be shared by many handles.
+    """
+
+    SESSION_CREATING_METHODS: ClassVar[frozenset[str]] = frozenset({"beekeeper_api.create_session"})
+    SESSION_CLOSING_METHODS: ClassVar[frozenset[str]] = frozenset({"beekeeper_api.close_session"})
+
+    def __init__(
+        self,
+        endpoints: Sequence[HttpUrl],
+        *,
+        strategy: LoadBalancingStrategy = "round_robin",
+        health_check_interval: timedelta = timedelta(seconds=5),
+        latency_smoothing: float = 0.2,
+    ) -> None:
+        assert endpoints, "At least one endpoint is required"
+        assert 0.0 < latency_smoothing <= 1.0, "latency_smoothing has to be in range (0, 1]"
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+        self.latency_smoothing = latency_smoothing
+        self.__states = {endpoint: _EndpointState(url=endpoint) for endpoint in endpoints}
+        self.__sessions: dict[str, HttpUrl] = {}
+        self.__round_robin = count()
+        self.__lock = Lock()
+
+    @property
+    def endpoints(self) -> list[HttpUrl]:
+        return list(self.__states)
+
+    def healthy_endpoints(self) -> list[HttpUrl]:
+        with self.__lock:
+            return [state.url for state in self.__states.values() if state.healthy]
+
+    def outstanding(self, endpoint: HttpUrl) -> int:
+        with self.__lock:
+            return self.__states[endpoint].outstanding
+
+    def pinned(self, token: str) -> HttpUrl | None:
+        """Returns endpoint on which session with given token has been created, if known."""
+        with self.__lock:
+            return self.__sessions.get(token)
+
+    def pin(self, token: str, endpoint: HttpUrl) -> None:
+        with self.__lock:
+            self.__sessions[token] = endpoint
+
+    def unpin(self, token: str) -> None:
+        with self.__lock:
+            self.__sessions.pop(token, None)
+
+    def select(self, request: Json | list[Json] | None) -> HttpUrl:
+        """Chooses endpoint for given request, unhealthy endpoints due for health check are checked synchronously."""
+        for state in self.__due_for_health_check():
+            self.__set_health(state, is_healthy=sync_is_url_reachable(state.url))
+        return self.__select(request)
+
+    async def async_select(self, request: Json | list[Json] | None) -> HttpUrl:
+        """Chooses endpoint for given request, unhealthy endpoints due for health check are checked asynchronously."""
+        due = self.__due_for_health_check()
+        results = await asyncio.gather(*(async_is_url_reachable(state.url) for state in due))
+        for state, is_healthy in zip(due, results, strict=True):
+            self.__set_health(state, is_healthy=is_healthy)
+        return self.__select(request)
+
+    def check_health(self) -> None:
+        """Checks all endpoints synchronously."""
+        for state in self.__states.values():
+            self.__set_health(state, is_healthy=sync_is_url_reachable(state.url))
+
+    async def async_check_health(self) -> None:
+        """Checks all endpoints concurrently."""
+        states = list(self.__states.values())
+        results = await asyncio.gather(*(async_is_url_reachable(state.url) for state in states))
+        for state, is_healthy in zip(states, results, strict=True):
+            self.__set_health(state, is_healthy=is_healthy)
+
+    @staticmethod
+    def route(url: HttpUrl, endpoint: HttpUrl) -> HttpUrl:
+        """Returns url with path and query from `url`, directed to `endpoint`."""
+        return HttpUrl.factory(
+            address=endpoint.address, port=endpoint.port, path=url.path, query=url.query, protocol=endpoint.protocol
+        )
+
+    @contextmanager
+    def track(self, endpoint: HttpUrl) -> Iterator[None]:
+        """Wraps sending of single request to endpoint, gathers statistics used by strategies."""
+        state = self.__states[endpoint]
+        with self.__lock:
+            state.outstanding += 1
+        started_at = time.monotonic()
+        try:
+            yield
+        except CommunicationError:
+            self.__set_health(state, is_healthy=False)
+            raise
+        else:
+            self.__update_latency(state, time.monotonic() - started_at)
+        finally:
+            with self.__lock:
+                state.outstanding -= 1
+
+    def learn(self, endpoint: HttpUrl, request: Json | list[Json] | None, response: Json | list[Json]) -> None:
+        """Pins sessions created by request to endpoint, forgets closed ones."""
+        requests = _as_list(request)
+        responses = _as_list(response)
+        responses_by_id = {item.get("id"): item for item in responses if isinstance(item, dict)}
+        for item in requests:
+            if not isinstance(item, dict):
+                continue
+            method = item.get("method")
+            if method in self.SESSION_CREATING_METHODS:
+                result = (responses_by_id.get(item.get("id")) or {}).get("result")
+                if isinstance(result, dict) and isinstance(token := result.get("token"), str):
+                    self.pin(token, endpoint)
+            elif method in self.SESSION_CLOSING_METHODS and (token := self.find_token(item)) is not None:
+                self.unpin(token)
+
+    @staticmethod
+    def find_token(request: Json | list[Json] | None) -> str | None:
+        """Returns first session token found in params of request."""
+        for item in _as_list(request):
+            if (
+                isinstance(item, dict)
+                and isinstance(params := item.get("params"), dict)
+                and isinstance(token := params.get("token"), str)
+            ):
+                return token
+        return None
+
+    def __select(self, request: Json | list[Json] | None) -> HttpUrl:
+        with self.__lock:
+            if (token := self.find_token(request)) is not None and (endpoint := self.__sessions.get(token)) is not None:
+                return endpoint
+
+            candidates = [state for state in self.__states.values() if state.healthy] or list(self.__states.values())
+            if self.strategy == "least_outstanding":
+                return min(candidates, key=lambda state: state.outstanding).url
+            if self.strategy == "latency":
+                return min(candidates, key=lambda state: (state.latency or 0.0) * (state.outstanding + 1)).url
+            return candidates[next(self.__round_robin) % len(candidates)].url
+
+    def __due_for_health_check(self) -> list[_EndpointState]:
+        deadline = time.monotonic() - self.health_check_interval.total_seconds()
+        with self.__lock:
+            return [state for state in self.__states.values() if not state.healthy and state.checked_at <= deadline]
+
+    def __set_health(self, state: _EndpointState, *, is_healthy: bool) -> None:
+        with self.__lock:
+            state.healthy = is_healthy
+            state.checked_at = time.monotonic()
+
+    def __update_latency(self, state: _EndpointState, seconds: float) -> None:
+        with self.__lock:
+            state.latency = (
+                seconds if state.latency is None else state.latency + self.latency_smoothing * (seconds - state.latency)
+            )
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
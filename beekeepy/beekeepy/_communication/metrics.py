@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from typing_extensions import Self
+
+    from beekeepy._communication.abc.communicator_models import Methods
+    from beekeepy._communication.url import HttpUrl
+
+__all__ = ["Histogram", "InMemoryMetrics", "MetricsSink"]
+
+REQUEST_DURATION_SECONDS: Final[str] = "beekeepy_request_duration_seconds"
+"""Histogram of time spent on sending request by handle (retries included), labels: endpoint, method, outcome."""
+
+RETRIES_TOTAL: Final[str] = "beekeepy_retries_total"
+"""Counter of retries performed by overseer, labels: endpoint, reason."""
+
+BATCH_SIZE: Final[str] = "beekeepy_batch_size"
+"""Histogram of amount of requests sent by single batch, labels: endpoint."""
+
+BATCH_ERRORS_TOTAL: Final[str] = "beekeepy_batch_errors_total"
+"""Counter of requests in batches which ended with error, labels: endpoint, error."""
+
+_JSONRPC_METHOD: Final[re.Pattern[str]] = re.compile(r'"method"\s*:\s*"([^"]*)"')
+_PROMETHEUS_QUANTILES: Final[tuple[float, ...]] = (0.5, 0.9, 0.99)
+
+
+class MetricsSink(ABC):
+    """Receives metrics emitted by handles, overseers and batches.
+
+    Implementations have to be thread-safe, they are called from all threads and event loops which use handle.
+    Instance is not copied together with settings, so it can be shared by many handles.
+    """
+
+    @abstractmethod
+    def increment(self, name: str, *, labels: Mapping[str, str], amount: float = 1.0) -> None:
+        """Increases value of counter with given name and labels."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, *, labels: Mapping[str, str]) -> None:
+        """Records single value in histogram with given name and labels."""
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+
+class Histogram:
+    """Log-linear histogram with bounded relative error, in the spirit of HdrHistogram.
+
+    Values are counted in buckets which width grows with magnitude of value, so memory usage depends only
+    on range of recorded values, while error of reported percentiles stays below 2 ** -(precision_bits - 1).
+
+    Note: Not thread-safe on its own, InMemoryMetrics guards access to it.
+    """
+
+    def __init__(self, *, precision_bits: int = 8, resolution: float = 1e-6) -> None:
+        """Creates empty histogram.
+
+        Args:
+            precision_bits: amount of bits of value kept exactly, 8 gives error below 1%.
+            resolution: smallest distinguishable value, lower values are counted as 0.
+        """
+        assert precision_bits > 1, "precision_bits has to be greater than 1"
+        assert resolution > 0, "resolution has to be positive"
+        self.precision_bits = precision_bits
+        self.resolution = resolution
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.__buckets: dict[int, int] = {}
+
+    def record(self, value: float) -> None:
+        key = self.__bucket_key(max(0, int(value / self.resolution)))
+        self.__buckets[key] = self.__buckets.get(key, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, quantile: float) -> float:
+        """Returns value below or equal to which given fraction (0-1) of recorded values are, NaN if empty."""
+        assert 0.0 <= quantile <= 1.0, "quantile has to be in range [0, 1]"
+        if self.count == 0:
+            return math.nan
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for key in sorted(self.__buckets):
+            seen += self.__buckets[key]
+            if seen >= rank:
+                return min(max(self.__bucket_middle(key), self.min), self.max)
+        return self.max
+
+    def __bucket_key(self, units: int) -> int:
+        magnitude = max(0, units.bit_length() - self.precision_bits)
+        return (magnitude << self.precision_bits) | (units >> magnitude)
+
+    def __bucket_middle(self, key: int) -> float:
+        magnitude = key >> self.precision_bits
+        lowest = (key & ((1 << self.precision_bits) - 1)) << magnitude
+        return (lowest + ((1 << magnitude) - 1) / 2) * self.resolution
+
+
+class InMemoryMetrics(MetricsSink):
+    """Keeps counters and histograms in memory, they can be read directly or exported in Prometheus text format.
+
+    Example:
+        ```
+        metrics = InMemoryMetrics()
+        settings = RemoteHandleSettings(http_endpoint=url, metrics=metrics)
+        ...
+        duration = metrics.histogram("beekeepy_request_duration_seconds", method="beekeeper_api.sign_digest", ...)
+        print(metrics.export_prometheus())
+        ```
+    """
+
+    def __init__(self, *, precision_bits: int = 8) -> None:
+        self.__precision_bits = precision_bits
+        self.__counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self.__histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        self.__lock = Lock()
+
+    def increment(self, name: str, *, labels: Mapping[str, str], amount: float = 1.0) -> None:
+        key = (name, self.__labels_key(labels))
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, *, labels: Mapping[str, str]) -> None:
+        key = (name, self.__labels_key(labels))
+        with self.__lock:
+            if (histogram := self.__histograms.get(key)) is None:
+                histogram = self.__histograms[key] = Histogram(precision_bits=self.__precision_bits)
+            histogram.record(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Returns value of counter, 0 if it has not been incremented yet."""
+        with self.__lock:
+            return self.__counters.get((name, self.__labels_key(labels)), 0.0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        """Returns histogram, None if nothing has been observed yet."""
+        with self.__lock:
+            return self.__histograms.get((name, self.__labels_key(labels)))
+
+    def export_prometheus(self) -> str:
+        """Serializes counters as Prometheus counters and histograms as summaries (with quantiles, sum and count)."""
+        lines: list[str] = []
+        with self.__lock:
+            for name in sorted({name for name, _ in self.__counters}):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(
+                    f"{name}{self.__format_labels(labels)} {value!r}"
+                    for (counter_name, labels), value in sorted(self.__counters.items())
+                    if counter_name == name
+                )
+            for name in sorted({name for name, _ in self.__histograms}):
+                lines.append(f"# TYPE {name} summary")
+                for (histogram_name, labels), histogram in sorted(self.__histograms.items(), key=lambda item: item[0]):
+                    if histogram_name != name:
+                        continue
+                    lines.extend(
+                        f"{name}{self.__format_labels((*labels, ('quantile', str(quantile))))} "
+                        f"{histogram.percentile(quantile)!r}"
+                        for quantile in _PROMETHEUS_QUANTILES
+                    )
+                    lines.append(f"{name}_sum{self.__format_labels(labels)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{self.__format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    @staticmethod
+    def __labels_key(labels: Mapping[str, str]) -> tuple[tuple[str, str], ...]:
+        return tuple(sorted(labels.items()))
+
+    @staticmethod
+    def __format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def endpoint_label(url: HttpUrl) -> str:
+    return url.as_string()
+
+
+def request_method_label(data: str | None, method: Methods) -> str:
+    """Returns name of called jsonrpc method, `batch` for jsonrpc batches and http method for other requests."""
+    if data is None:
+        return method
+    if data.startswith("["):
+        return "batch"
+    if (match := _JSONRPC_METHOD.search(data)) is not None:
+        return match.group(1)
+    return method
+
+
+@contextmanager
+def measure_request(metrics: MetricsSink, *, url: HttpUrl, data: str | None, method: Methods) -> Iterator[None]:
+    """Observes duration of request, outcome is `ok` or name of raised exception class."""
+    outcome = "ok"
+    started_at = time.perf_counter()
+    try:
+        yield
+    except BaseException as error:
+        outcome = type(error).__name__
+        raise
+    finally:
+        metrics.observe(
+            REQUEST_DURATION_SECONDS,
+            time.perf_counter() - started_at,
+            labels={"endpoint": endpoint_label(url), "method": request_method_label(data, method), "outcome": outcome},
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from beekeepy._communication.abc.communicator import (
     AbstractCommunicator,
 )
+from beekeepy._communication.unix_socket_adapter import UnixSocketHTTPAdapter
 from beekeepy.exceptions import CommunicationError
 
 if TYPE_CHECKING:
@@ -20,6 +23,8 @@ class RequestCommunicator(AbstractCommunicator):
     def __init__(self, *args: Any, settings: CommunicationSettings, **kwargs: Any) -> None:
         super().__init__(*args, settings=settings, **kwargs)
         self.__session: requests.Session | None = None
+        self.__session_lock = Lock()
+        """Chunks of batch are sent from many threads, so only one of them may create the session."""
 
     async def _async_send(self, request: Request) -> Response:
         raise NotImplementedError
@@ -27,9 +32,23 @@ class RequestCommunicator(AbstractCommunicator):
     @property
     def session(self) -> requests.Session:
         if self.__session is None:
-            self.__session = requests.Session()
+            with self.__session_lock:
+                if self.__session is None:
+                    self.__session = self.__create_session()
         return self.__session
 
+    def __create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = self._create_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _create_adapter(self) -> HTTPAdapter:
+        if self.settings.unix_socket_path is not None:
+            return UnixSocketHTTPAdapter(self.settings.unix_socket_path, pool_maxsize=self.settings.pool_maxsize)
+        return HTTPAdapter(pool_connections=self.settings.pool_connections, pool_maxsize=self.settings.pool_maxsize)
+
     def _send(self, request: Request) -> Response:
         try:
             response: requests.Response = self.session.request(
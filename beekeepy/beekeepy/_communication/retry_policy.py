@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+from threading import Lock
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from beekeepy._communication.settings import CommunicationSettings
+
+__all__ = ["RetryPolicy"]
+
+_MAX_BACKOFF_EXPONENT: Final[int] = 64
+"""Prevents float overflow while computing backoff for very long retry sequences."""
+
+
+class RetryPolicy:
+    """Computes periods between retries and limits amount of them with token bucket.
+
+    Instance is shared by all requests sent by single overseer, so retry budget is per handle.
+    Parameters are taken from settings on each call, so changes in settings are respected immediately.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__tokens: float | None = None
+        self.__last_refill = time.monotonic()
+
+    def period(self, settings: CommunicationSettings, retry_number: int) -> timedelta:
+        """Returns time to wait before given retry (counted from 0), with exponential backoff and jitter applied."""
+        base = settings.period_between_retries.total_seconds()
+        limit = max(base, settings.max_period_between_retries.total_seconds())
+        period = min(base * settings.backoff_factor ** min(retry_number, _MAX_BACKOFF_EXPONENT), limit)
+        jitter = min(max(settings.retry_jitter, 0.0), 1.0)
+        return timedelta(seconds=period - period * jitter * random.random())  # noqa: S311
+
+    @classmethod
+    def is_time_exceeded(cls, settings: CommunicationSettings, started_at: float) -> bool:
+        """Checks is max_retry_time has passed since `started_at` (value of time.monotonic)."""
+        if settings.max_retry_time is None:
+            return False
+        return time.monotonic() - started_at >= settings.max_retry_time.total_seconds()
+
+    def acquire(self, settings: CommunicationSettings) -> bool:
+        """Takes single retry from budget, returns False if budget is exhausted."""
+        if settings.retry_budget is None:
+            return True
+
+        with self.__lock:
+            now = time.monotonic()
+            tokens = settings.retry_budget if self.__tokens is None else self.__tokens
+            tokens = min(
+                float(settings.retry_budget), tokens + (now - self.__last_refill) * settings.retry_budget_refill_rate
+            )
+            self.__last_refill = now
+            if tokens < 1.0:
+                self.__tokens = tokens
+                return False
+            self.__tokens = tokens - 1.0
+            return True
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import re
-from typing import TYPE_CHECKING, ClassVar, Final
+from typing import TYPE_CHECKING, ClassVar, Final, Sequence
 
 from beekeepy._communication.abc.rules import OverseerRule
+from beekeepy._utilities.json_codec import JSON_DECODE_ERRORS
 from beekeepy.exceptions import (
     ApiNotFoundError,
     DifferenceBetweenAmountOfRequestsAndResponsesError,
@@ -32,9 +32,10 @@ REGEX_FOR_PATH_WITH_CAPTURE_GROUP_ON_WALLET_NAME: Final[str] = r"\/(?:(?:[^\/]+\
 
 class UnableToAcquireDatabaseLock(OverseerRule):
     LOOKUP_MESSAGE: ClassVar[str] = "Unable to acquire database lock"
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (re.compile(re.escape(LOOKUP_MESSAGE)),)
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        if self.LOOKUP_MESSAGE in str(parsed_response):
+        if self.LOOKUP_MESSAGE in self.render_error(parsed_response):
             return [
                 self._construct_exception(
                     request_id=parsed_response.get("id"),
@@ -52,9 +53,10 @@ class UnableToAcquireDatabaseLock(OverseerRule):
 
 class UnableToAcquireForkdbLock(OverseerRule):
     LOOKUP_MESSAGE: ClassVar[str] = "Unable to acquire forkdb lock"
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (re.compile(re.escape(LOOKUP_MESSAGE)),)
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        if self.LOOKUP_MESSAGE in str(parsed_response):
+        if self.LOOKUP_MESSAGE in self.render_error(parsed_response):
             return [
                 self._construct_exception(
                     message=f"Found `{self.LOOKUP_MESSAGE}` in response",
@@ -105,9 +107,10 @@ class ApiNotFound(OverseerRule):
     _API_NOT_FOUND_REGEX: ClassVar[re.Pattern[str]] = re.compile(
         pattern=r"Assert Exception:api_itr != data\._registered_apis\.end\(\): Could not find API (\w+_api)"
     )
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (_API_NOT_FOUND_REGEX,)
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        search_result = self._API_NOT_FOUND_REGEX.search(str(parsed_response))
+        search_result = self._API_NOT_FOUND_REGEX.search(self.render_error(parsed_response))
         if search_result is not None:
             return [
                 self._construct_exception(
@@ -125,8 +128,11 @@ class ApiNotFound(OverseerRule):
 
 
 class JussiResponse(OverseerRule):
+    LOOKUP_MESSAGE: ClassVar[str] = "jussi_request_id"
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (re.compile(LOOKUP_MESSAGE),)
+
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        if "jussi_request_id" in str(parsed_response):
+        if self.LOOKUP_MESSAGE in self.render_error(parsed_response):
             return [
                 self._construct_exception(
                     message="Jussi responded instead of target service",
@@ -144,7 +150,7 @@ class JussiResponse(OverseerRule):
 
 class UnparsableResponse(OverseerRule):
     def _check_non_json_response(self, parsed_response: Exception, response_raw: str) -> list[OverseerError]:
-        if isinstance(parsed_response, json.JSONDecodeError):
+        if isinstance(parsed_response, JSON_DECODE_ERRORS):
             return [
                 self._construct_exception(
                     message=(
@@ -225,8 +231,11 @@ class ErrorInResponse(OverseerRule):
 
 
 class UnlockIsNotAccessible(OverseerRule):
+    LOOKUP_MESSAGE: ClassVar[str] = "unlock is not accessible"
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (re.compile(LOOKUP_MESSAGE),)
+
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        if "unlock is not accessible" in str(parsed_response):
+        if self.LOOKUP_MESSAGE in self.render_error(parsed_response):
             return [
                 self._construct_exception(
                     message="You tried to unlock wallet too fast",
@@ -247,10 +256,12 @@ class WalletIsAlreadyUnlocked(OverseerRule):
         re.compile(r"_itr->is_locked\(\): Wallet with name: '([\w-]+)' is already unlocked"),
         re.compile(r"_itr->is_locked\(\): Wallet is already unlocked: ([\w-]+)rethrow"),
     ]
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = _WALLET_IS_ALREADY_UNLOCKED_REGEXES
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
+        rendered_error = self.render_error(parsed_response)
         for regex in self._WALLET_IS_ALREADY_UNLOCKED_REGEXES:
-            if (match := regex.search(str(parsed_response))) is not None:
+            if (match := regex.search(rendered_error)) is not None:
                 return [
                     self._construct_exception(
                         message=f"You tried to unlock already unlocked wallet: `{match.group(1)}`",
@@ -271,9 +282,10 @@ class UnableToOpenWallet(OverseerRule):
         r"_new_item->load_wallet_file\(\): "
         r"Unable to open file: " + REGEX_FOR_PATH_WITH_CAPTURE_GROUP_ON_WALLET_NAME + r"(?:rethrow)?"
     )
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (_UNABLE_TO_OPEN_WALLET_REGEX,)
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
-        if (match := self._UNABLE_TO_OPEN_WALLET_REGEX.search(str(parsed_response))) is not None:
+        if (match := self._UNABLE_TO_OPEN_WALLET_REGEX.search(self.render_error(parsed_response))) is not None:
             return [
                 self._construct_exception(
                     message=f"No such wallet: {match.group(1)}",
@@ -293,6 +305,7 @@ class InvalidPassword(OverseerRule):
     _INVALID_PASSWORD_REGEX: ClassVar[re.Pattern[str]] = re.compile(
         r"false: Invalid password for wallet: '" + REGEX_FOR_PATH_WITH_CAPTURE_GROUP_ON_WALLET_NAME + r"' (?:rethrow)?"
     )
+    LOOKUP_PATTERNS: ClassVar[Sequence[re.Pattern[str]]] = (_INVALID_PASSWORD_REGEX,)
 
     def _check_single(self, parsed_response: Json, whole_response: Json | list[Json]) -> list[OverseerError]:
         if (
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from datetime import timedelta
 from os import environ
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from typing_extensions import Self
 
+from beekeepy._communication.tracing import Tracer  # noqa: TCH001
 from schemas._preconfigured_base_model import PreconfiguredBaseModel
 from schemas.base import field
 from schemas.decoders import get_hf26_decoder
@@ -19,11 +21,35 @@ class CommunicationSettings(PreconfiguredBaseModel):
         TIMEOUT: ClassVar[str] = "HELPY_COMMUNICATION_MAX_RETRIES"
         PERIOD_BETWEEN_RETRIES: ClassVar[str] = "HELPY_COMMUNICATION_TIMEOUT_SECS"
         RETRIES: ClassVar[str] = "HELPY_COMMUNICATION_PERIOD_BETWEEN_RETRIES_SECS"
+        MAX_CONNECTIONS: ClassVar[str] = "HELPY_COMMUNICATION_MAX_CONNECTIONS"
+        MAX_CONNECTIONS_PER_HOST: ClassVar[str] = "HELPY_COMMUNICATION_MAX_CONNECTIONS_PER_HOST"
+        KEEPALIVE_TIMEOUT: ClassVar[str] = "HELPY_COMMUNICATION_KEEPALIVE_TIMEOUT_SECS"
+        DNS_CACHE_TTL: ClassVar[str] = "HELPY_COMMUNICATION_DNS_CACHE_TTL_SECS"
+        POOL_CONNECTIONS: ClassVar[str] = "HELPY_COMMUNICATION_POOL_CONNECTIONS"
+        POOL_MAXSIZE: ClassVar[str] = "HELPY_COMMUNICATION_POOL_MAXSIZE"
+        UNIX_SOCKET_PATH: ClassVar[str] = "HELPY_COMMUNICATION_UNIX_SOCKET_PATH"
+        BACKOFF_FACTOR: ClassVar[str] = "HELPY_COMMUNICATION_BACKOFF_FACTOR"
+        MAX_PERIOD_BETWEEN_RETRIES: ClassVar[str] = "HELPY_COMMUNICATION_MAX_PERIOD_BETWEEN_RETRIES_SECS"
+        RETRY_JITTER: ClassVar[str] = "HELPY_COMMUNICATION_RETRY_JITTER"
+        MAX_RETRY_TIME: ClassVar[str] = "HELPY_COMMUNICATION_MAX_RETRY_TIME_SECS"
+        RETRY_BUDGET: ClassVar[str] = "HELPY_COMMUNICATION_RETRY_BUDGET"
+        RETRY_BUDGET_REFILL_RATE: ClassVar[str] = "HELPY_COMMUNICATION_RETRY_BUDGET_REFILL_RATE"
+        MAX_INFINITE_RETRIES: ClassVar[str] = "HELPY_COMMUNICATION_MAX_INFINITE_RETRIES"
 
     class Defaults:
         TIMEOUT: ClassVar[timedelta] = timedelta(seconds=5)
         PERIOD_BETWEEN_RETRIES: ClassVar[timedelta] = timedelta(seconds=0.2)
         RETRIES: ClassVar[int] = 5
+        MAX_CONNECTIONS: ClassVar[int] = 100
+        MAX_CONNECTIONS_PER_HOST: ClassVar[int] = 0
+        KEEPALIVE_TIMEOUT: ClassVar[timedelta] = timedelta(seconds=15)
+        DNS_CACHE_TTL: ClassVar[timedelta] = timedelta(seconds=10)
+        POOL_CONNECTIONS: ClassVar[int] = 10
+        POOL_MAXSIZE: ClassVar[int] = 10
+        BACKOFF_FACTOR: ClassVar[float] = 2.0
+        MAX_PERIOD_BETWEEN_RETRIES: ClassVar[timedelta] = timedelta(seconds=2)
+        RETRY_JITTER: ClassVar[float] = 1.0
+        RETRY_BUDGET_REFILL_RATE: ClassVar[float] = 1.0
 
         @staticmethod
         def default_factory(env_name: str, default_factory: Callable[[str | None], Any]) -> Any:
@@ -48,8 +74,106 @@ class CommunicationSettings(PreconfiguredBaseModel):
     )
     """Period between failed request and next retry."""
 
+    max_connections: int = Defaults.default_factory(
+        EnvironNames.MAX_CONNECTIONS,
+        lambda x: (CommunicationSettings.Defaults.MAX_CONNECTIONS if x is None else int(x)),
+    )
+    """Maximum amount of simultaneously opened connections (async communicator), 0 means no limit."""
+
+    max_connections_per_host: int = Defaults.default_factory(
+        EnvironNames.MAX_CONNECTIONS_PER_HOST,
+        lambda x: (CommunicationSettings.Defaults.MAX_CONNECTIONS_PER_HOST if x is None else int(x)),
+    )
+    """Maximum amount of simultaneously opened connections to single host (async communicator), 0 means no limit."""
+
+    keepalive_timeout: timedelta = Defaults.default_factory(
+        EnvironNames.KEEPALIVE_TIMEOUT,
+        lambda x: (CommunicationSettings.Defaults.KEEPALIVE_TIMEOUT if x is None else timedelta(seconds=float(x))),
+    )
+    """How long idle connection is kept open for reuse (async communicator)."""
+
+    dns_cache_ttl: timedelta = Defaults.default_factory(
+        EnvironNames.DNS_CACHE_TTL,
+        lambda x: (CommunicationSettings.Defaults.DNS_CACHE_TTL if x is None else timedelta(seconds=float(x))),
+    )
+    """How long resolved host addresses are cached (async communicator)."""
+
+    pool_connections: int = Defaults.default_factory(
+        EnvironNames.POOL_CONNECTIONS,
+        lambda x: (CommunicationSettings.Defaults.POOL_CONNECTIONS if x is None else int(x)),
+    )
+    """Amount of per-host connection pools to cache (sync communicator)."""
+
+    pool_maxsize: int = Defaults.default_factory(
+        EnvironNames.POOL_MAXSIZE,
+        lambda x: (CommunicationSettings.Defaults.POOL_MAXSIZE if x is None else int(x)),
+    )
+    """Maximum amount of connections kept in single pool (sync communicator)."""
+
+    unix_socket_path: Path | None = Defaults.default_factory(
+        EnvironNames.UNIX_SOCKET_PATH,
+        lambda x: (None if x is None else Path(x)),
+    )
+    """If set, requests are sent through given unix domain socket, host from url is used only as Host header."""
+
+    backoff_factor: float = Defaults.default_factory(
+        EnvironNames.BACKOFF_FACTOR,
+        lambda x: (CommunicationSettings.Defaults.BACKOFF_FACTOR if x is None else float(x)),
+    )
+    """Multiplier applied to period between retries after each retry, 1 means constant period."""
+
+    max_period_between_retries: timedelta = Defaults.default_factory(
+        EnvironNames.MAX_PERIOD_BETWEEN_RETRIES,
+        lambda x: (
+            CommunicationSettings.Defaults.MAX_PERIOD_BETWEEN_RETRIES if x is None else timedelta(seconds=float(x))
+        ),
+    )
+    """Upper limit for period between retries growing because of backoff_factor."""
+
+    retry_jitter: float = Defaults.default_factory(
+        EnvironNames.RETRY_JITTER,
+        lambda x: (CommunicationSettings.Defaults.RETRY_JITTER if x is None else float(x)),
+    )
+    """Randomized fraction of period between retries, 1 means full jitter (random value from 0 to period)."""
+
+    max_retry_time: timedelta | None = Defaults.default_factory(
+        EnvironNames.MAX_RETRY_TIME,
+        lambda x: (None if x is None else timedelta(seconds=float(x))),
+    )
+    """If set, no more retries are attempted after given time since request was sent for the first time."""
+
+    retry_budget: int | None = Defaults.default_factory(
+        EnvironNames.RETRY_BUDGET,
+        lambda x: (None if x is None else int(x)),
+    )
+    """If set, maximum amount of retries which single overseer can perform in burst (token bucket capacity)."""
+
+    retry_budget_refill_rate: float = Defaults.default_factory(
+        EnvironNames.RETRY_BUDGET_REFILL_RATE,
+        lambda x: (CommunicationSettings.Defaults.RETRY_BUDGET_REFILL_RATE if x is None else float(x)),
+    )
+    """Amount of retries restored to retry_budget per second."""
+
+    max_infinite_retries: int | None = Defaults.default_factory(
+        EnvironNames.MAX_INFINITE_RETRIES,
+        lambda x: (None if x is None else int(x)),
+    )
+    """If set, limits retries caused by errors which otherwise are retried indefinitely (e.g. database lock)."""
+
+    tracer: Tracer | None = None
+    """
+    If set, spans are opened around sending, retries, parsing and validation of responses and translation of errors.
+
+    Note: Instance is not copied together with settings and is skipped by export_settings.
+    """
+
+    @classmethod
+    def _runtime_only_fields(cls) -> set[str]:
+        """Returns names of fields holding live objects shared between handles, they are skipped by export."""
+        return {"tracer"}
+
     def export_settings(self) -> str:
-        return self.json()
+        return self.copy(exclude=self._runtime_only_fields()).json()
 
     @classmethod
     def import_settings(cls, settings: str) -> Self:
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Final
+from weakref import WeakKeyDictionary
+
+from beekeepy._utilities.json_codec import JSON_DECODE_ERRORS, json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from contextlib import AbstractContextManager
+
+    from typing_extensions import Self
+
+    from beekeepy._communication.abc.communicator_models import Methods
+    from beekeepy._communication.url import HttpUrl
+    from beekeepy.exceptions import Json
+
+__all__ = ["InMemoryTracer", "RecordedSpan", "Span", "Tracer"]
+
+AttributeValue = str | int | float | bool
+
+COMMUNICATOR_SEND_SPAN: Final[str] = "beekeepy.communicator.send"
+"""Sending request over network by communicator (callbacks included)."""
+
+OVERSEER_SEND_SPAN: Final[str] = "beekeepy.overseer.send"
+"""Whole request handled by overseer, retries are recorded as `retry` events."""
+
+RESPONSE_PARSE_SPAN: Final[str] = "beekeepy.response.parse"
+"""Parsing json of response received by overseer."""
+
+RESPONSE_VALIDATION_SPAN: Final[str] = "beekeepy.response.validate"
+"""Building response model (get_response_model) by handle."""
+
+ERROR_TRANSLATION_SPAN: Final[str] = "beekeepy.error.translate"
+"""Checking if error should be translated by DetectableError."""
+
+RETRY_EVENT: Final[str] = "retry"
+
+NOT_TRACED: Final[nullcontext[None]] = nullcontext()
+"""Shared context used in place of span when tracer is not set."""
+
+_TRACER_ATTRIBUTE: Final[str] = "_beekeepy_tracer"
+
+
+class Span(ABC):
+    """Single timed operation, mirrors subset of OpenTelemetry span interface."""
+
+    @abstractmethod
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+    @abstractmethod
+    def add_event(self, name: str, attributes: Mapping[str, AttributeValue] | None = None) -> None: ...
+
+    @abstractmethod
+    def record_exception(self, exception: BaseException) -> None: ...
+
+
+class Tracer(ABC):
+    """Creates spans around communication stages, can be used as adapter to OpenTelemetry.
+
+    Example:
+        ```
+        class OtelTracer(Tracer):
+            def start_span(self, name, *, attributes):
+                return otel_tracer.start_as_current_span(name, attributes=attributes, record_exception=False)
+        ```
+
+    Note: Instance is not copied together with settings, so it can be shared by many handles.
+    """
+
+    @abstractmethod
+    def start_span(self, name: str, *, attributes: Mapping[str, AttributeValue]) -> AbstractContextManager[Span]:
+        """Returns context in which span is active, nested spans should become its children."""
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+
+@dataclass(kw_only=True)
+class RecordedSpan:
+    name: str
+    parent: RecordedSpan | None
+    attributes: dict[str, AttributeValue]
+    events: list[tuple[str, dict[str, AttributeValue]]] = field(default_factory=list)
+    exception: BaseException | None = None
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+    @property
+    def duration(self) -> float:
+        assert self.finished_at is not None, "Span has not been finished yet"
+        return self.finished_at - self.started_at
+
+
+class _RecordingSpan(Span):
+    def __init__(self, recorded: RecordedSpan) -> None:
+        self.__recorded = recorded
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.__recorded.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Mapping[str, AttributeValue] | None = None) -> None:
+        self.__recorded.events.append((name, dict(attributes or {})))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.__recorded.exception = exception
+
+
+_CURRENT_SPANS: Final[ContextVar[WeakKeyDictionary[InMemoryTracer, RecordedSpan | None]]] = ContextVar(
+    "in_memory_tracer_current_spans",
+    default=WeakKeyDictionary(),
+)
+"""Current span of each tracer, shared by all tracers, as context variables are never garbage collected."""
+
+
+class InMemoryTracer(Tracer):
+    """Keeps finished spans in memory, parents are tracked separately for every thread and task."""
+
+    def __init__(self) -> None:
+        self.__spans: list[RecordedSpan] = []
+        self.__lock = Lock()
+
+    @property
+    def spans(self) -> list[RecordedSpan]:
+        """Returns finished spans in order of finishing."""
+        with self.__lock:
+            return list(self.__spans)
+
+    @contextmanager
+    def start_span(self, name: str, *, attributes: Mapping[str, AttributeValue]) -> Iterator[Span]:
+        recorded = RecordedSpan(name=name, parent=_CURRENT_SPANS.get().get(self), attributes=dict(attributes))
+        self.__set_current(recorded)
+        try:
+            yield _RecordingSpan(recorded)
+        finally:
+            recorded.finished_at = time.perf_counter()
+            self.__set_current(recorded.parent)
+            with self.__lock:
+                self.__spans.append(recorded)
+
+    def __set_current(self, span: RecordedSpan | None) -> None:
+        """Mapping is replaced (never modified in place), so threads and tasks do not see spans of each other."""
+        current_spans = WeakKeyDictionary(_CURRENT_SPANS.get())
+        current_spans[self] = span
+        _CURRENT_SPANS.set(current_spans)
+
+
+@contextmanager
+def trace(tracer: Tracer, name: str, attributes: Mapping[str, AttributeValue]) -> Iterator[Span]:
+    """Opens span and records exception passing through it, so DetectableError can find tracer later."""
+    with tracer.start_span(name, attributes=attributes) as span:
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            if tracer_of(error) is None:
+                setattr(error, _TRACER_ATTRIBUTE, tracer)
+            raise
+
+
+def tracer_of(error: BaseException) -> Tracer | None:
+    """Returns tracer of span through which given error has been raised."""
+    return getattr(error, _TRACER_ATTRIBUTE, None)
+
+
+def request_attributes(
+    *, url: HttpUrl, method: Methods, data: str | None, request: Json | list[Json] | None = None
+) -> dict[str, AttributeValue]:
+    """Describes request with OpenTelemetry semantic names, data is parsed only if request is not given."""
+    attributes: dict[str, AttributeValue] = {"url.full": url.as_string(), "http.request.method": method}
+    if data is None:
+        return attributes
+    attributes["http.request.body.size"] = len(data) if data.isascii() else len(data.encode("utf-8"))
+    if request is None:
+        try:
+            request = json_loads(data)
+        except JSON_DECODE_ERRORS:
+            return attributes
+    attributes.update(jsonrpc_attributes(request))
+    return attributes
+
+
+def jsonrpc_attributes(message: Json | list[Json] | Any) -> dict[str, AttributeValue]:
+    """Describes jsonrpc request or response: method and id for singular ones, size for batches."""
+    if isinstance(message, list):
+        return {"rpc.system": "jsonrpc", "rpc.method": "batch", "beekeepy.batch_size": len(message)}
+    if not isinstance(message, dict):
+        return {}
+    attributes: dict[str, AttributeValue] = {"rpc.system": "jsonrpc"}
+    if isinstance(method := message.get("method"), str):
+        attributes["rpc.method"] = method
+    if (request_id := message.get("id")) is not None:
+        attributes["rpc.jsonrpc.request_id"] = str(request_id)
+    return attributes
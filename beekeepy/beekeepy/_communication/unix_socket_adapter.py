@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import socket
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from requests import PreparedRequest
+
+__all__ = ["UnixSocketHTTPAdapter"]
+
+
+class _UnixSocketHTTPConnection(HTTPConnection):
+    """Http connection which connects to unix domain socket instead of tcp host."""
+
+    def __init__(self, *args: Any, socket_path: Path, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.__socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.__socket_path.as_posix())
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _UnixSocketHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixSocketHTTPConnection
+
+    def __init__(self, *args: Any, socket_path: Path, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.conn_kw["socket_path"] = socket_path
+
+
+class UnixSocketHTTPAdapter(HTTPAdapter):
+    """Transport adapter for requests library, which sends all http requests through unix domain socket.
+
+    Host part of requested url is used only as value of Host header.
+    """
+
+    def __init__(self, socket_path: Path, *, pool_maxsize: int, **kwargs: Any) -> None:
+        self.__socket_path = socket_path
+        self.__pool_maxsize = pool_maxsize
+        self.__pool: _UnixSocketHTTPConnectionPool | None = None
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+
+    def get_connection_with_tls_context(
+        self,
+        request: PreparedRequest,  # noqa: ARG002
+        verify: Any,  # noqa: ARG002
+        proxies: Mapping[str, str] | None = None,  # noqa: ARG002
+        cert: Any = None,  # noqa: ARG002
+    ) -> HTTPConnectionPool:
+        if self.__pool is None:
+            self.__pool = _UnixSocketHTTPConnectionPool(
+                "localhost", maxsize=self.__pool_maxsize, socket_path=self.__socket_path
+            )
+        return self.__pool
+
+    def request_url(self, request: PreparedRequest, proxies: Any) -> str:  # noqa: ARG002
+        return request.path_url
+
+    def close(self) -> None:
+        super().close()
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool = None
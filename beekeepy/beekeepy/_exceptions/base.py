@@ -3,11 +3,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from beekeepy._communication.tracing import ERROR_TRANSLATION_SPAN, NOT_TRACED, trace, tracer_of
 from beekeepy._utilities.context import ContextSync
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from types import TracebackType
 
+    from beekeepy._communication.tracing import Span
     from beekeepy._communication.url import Url
 
 Json = dict[str, Any]
@@ -59,10 +62,20 @@ class DetectableError(ContextSync[None], BeekeeperInterfaceError, ABC):
         return None
 
     def _handle_exception(self, ex: BaseException, tb: TracebackType | None) -> bool:
-        if self._is_exception_handled(ex):
+        with self.__trace_translation(ex) as span:
+            is_handled = self._is_exception_handled(ex)
+            if span is not None:
+                span.set_attribute("beekeepy.translated", is_handled)
+        if is_handled:
             raise self from ex
         return super()._handle_exception(ex, tb)
 
+    def __trace_translation(self, ex: BaseException) -> AbstractContextManager[Span | None]:
+        if (tracer := tracer_of(ex)) is None:
+            return NOT_TRACED
+        attributes = {"beekeepy.detector": type(self).__name__, "beekeepy.source_error": type(ex).__name__}
+        return trace(tracer, ERROR_TRANSLATION_SPAN, attributes)
+
 
 class SchemaDetectableError(DetectableError, ABC):
     """Base class for errors that bases on schema exceptions."""
@@ -148,6 +148,15 @@ class TimeoutExceededError(CommunicationError):
         self.total_wait_time = total_wait_time
 
 
+class CircuitOpenError(CommunicationError):
+    """Raised without sending request, if circuit breaker considers endpoint as unavailable."""
+
+    def __init__(self, url: str | Url[Any], request: CommunicationResponseT | bytes, *, retry_after: float) -> None:
+        """Constructor."""
+        super().__init__(url, request, message=f"Circuit is open, next probe allowed in: {retry_after:.3f}s")
+        self.retry_after = retry_after
+
+
 class UnknownValueForBooleanConversionError(BeekeepyError):
     """Raised if value is not convertible to boolean."""
 
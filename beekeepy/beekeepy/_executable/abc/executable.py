@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import os
 import signal
 import subprocess
@@ -14,6 +15,7 @@ from beekeepy._executable.abc.arguments import Arguments
 from beekeepy._executable.abc.config import Config
 from beekeepy._executable.abc.streams import StreamsHolder
 from beekeepy._utilities.context import ContextSync
+from beekeepy._utilities.listening_ports import listening_ports
 from beekeepy.exceptions import ExecutableIsNotRunningError, FailedToStartExecutableError, TimeoutReachWhileCloseError
 
 if TYPE_CHECKING:
@@ -244,13 +246,14 @@ class Executable(Closeable, Generic[ConfigT, ArgumentT]):
     def version(self) -> str:
         return self.run_and_get_output(arguments=self.__arguments.just_get_version())
 
-    def reserved_ports(self, *, timeout_seconds: int = 10) -> list[int]:
-        if not self.is_running():
-            raise FailedToStartExecutableError("Executable is not running, cannot get reserved ports")
+    def reserved_ports(self, *, timeout_seconds: float = 10, poll_interval_seconds: float = 0.01) -> list[int]:
+        """Waits until executable starts listening on any port and returns all ports it listens on."""
         start = time.perf_counter()
         while start + timeout_seconds >= time.perf_counter():
-            connections = psutil.net_connections("inet4")
-            reserved_ports = [connection.laddr[1] for connection in connections if connection.pid == self.pid]  # type: ignore[misc]
-            if reserved_ports:
-                return reserved_ports
+            if not self.is_running():
+                raise FailedToStartExecutableError("Executable is not running, cannot get reserved ports")
+            with contextlib.suppress(psutil.Error, OSError):
+                if reserved_ports := listening_ports(self.pid):
+                    return reserved_ports
+            time.sleep(poll_interval_seconds)
         raise TimeoutError
@@ -18,7 +18,7 @@ class BeekeeperConfig(Config):
     unlock_interval: int = BeekeeperDefaults.DEFAULT_UNLOCK_INTERVAL
     log_json_rpc: Path | None = BeekeeperDefaults.DEFAULT_LOG_JSON_RPC
     webserver_http_endpoint: HttpUrl | None = field(default_factory=http_webserver_default)
-    webserver_unix_endpoint: HttpUrl | None = None
+    webserver_unix_endpoint: Path | None = None
     webserver_ws_endpoint: WsUrl | None = None
     webserver_ws_deflate: int = 0
     webserver_thread_pool_size: int = 1
@@ -6,7 +6,10 @@ from typing import TYPE_CHECKING, TypeAlias, overload
 from beekeepy._utilities.context import ContextSync
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from beekeepy._interface.abc.synchronous.wallet import UnlockedWallet, Wallet
+    from beekeepy.exceptions import BeekeepyError
     from schemas.apis.beekeeper_api import GetInfo
     from schemas.fields.basic import PublicKey
     from schemas.fields.hex import Signature
@@ -46,6 +49,13 @@ class Session(ContextSync["Session"], ABC):
     @abstractmethod
     def sign_digest(self, *, sig_digest: str, key: str) -> Signature: ...
 
+    @abstractmethod
+    def sign_digests(self, *, sig_digests_and_keys: Sequence[tuple[str, str]]) -> list[Signature | BeekeepyError]:
+        """Signs many digests with single (chunked) batch request.
+
+        Returns signatures in order of given (digest, key) pairs, errors of single items are returned in their place.
+        """
+
     @property
     @abstractmethod
     def wallets(self) -> list[Wallet]: ...
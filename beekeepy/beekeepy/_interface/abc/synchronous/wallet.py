@@ -8,8 +8,10 @@ from beekeepy._utilities.context import ContextSync
 from schemas.fields.basic import PublicKey
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
+    from beekeepy.exceptions import BeekeepyError
     from schemas.fields.hex import Signature
 
 
@@ -49,6 +51,13 @@ class UnlockedWallet(Wallet, ContextSync["UnlockedWallet"], ABC):
     @abstractmethod
     def sign_digest(self, *, sig_digest: str, key: str) -> Signature: ...
 
+    @abstractmethod
+    def sign_digests(self, *, sig_digests_and_keys: Sequence[tuple[str, str]]) -> list[Signature | BeekeepyError]:
+        """Signs many digests with single (chunked) batch request.
+
+        Returns signatures in order of given (digest, key) pairs, errors of single items are returned in their place.
+        """
+
     @abstractmethod
     def has_matching_private_key(self, *, key: str) -> bool: ...
 
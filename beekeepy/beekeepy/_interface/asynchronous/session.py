@@ -9,6 +9,8 @@ from beekeepy._interface.asynchronous.wallet import (
     UnlockedWallet,
     Wallet,
 )
+from beekeepy._interface.bulk_signing import collect_signatures, validate_sign_digests_input
+from beekeepy._interface.session_state import ALL_WALLETS, SessionState
 from beekeepy._interface.validators import validate_digest, validate_public_keys, validate_timeout
 from beekeepy._utilities.state_invalidator import StateInvalidator
 from beekeepy.exceptions import (
@@ -21,6 +23,8 @@ from beekeepy.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from beekeepy._interface.abc.asynchronous.wallet import (
         UnlockedWallet as UnlockedWalletInterface,
     )
@@ -30,7 +34,9 @@ if TYPE_CHECKING:
     from beekeepy._interface.settings import InterfaceSettings
     from beekeepy._remote_handle.async_beekeeper import AsyncBeekeeper as AsynchronousRemoteBeekeeperHandle
     from beekeepy._utilities.delay_guard import AsyncDelayGuard
+    from beekeepy.exceptions import BeekeepyError
     from schemas.apis.beekeeper_api import GetInfo
+    from schemas.apis.beekeeper_api.fundaments_of_responses import WalletDetails
     from schemas.fields.basic import PublicKey
     from schemas.fields.hex import Signature
 
@@ -50,9 +56,12 @@ class Session(SessionInterface, StateInvalidator):
         self.__session_token = use_session_token or ""
         self.__guard = guard
         self.__default_session_close_callback = default_session_close_callback
+        self.__state = SessionState()
 
     async def get_info(self) -> GetInfo:
-        return await self.__beekeeper.api.get_info(token=await self.token)
+        info = await self.__fetch_info()
+        self.__state.update_info(info)
+        return info
 
     async def create_wallet(  # type: ignore[override]
         self, *, name: str, password: str | None = None
@@ -61,28 +70,33 @@ class Session(SessionInterface, StateInvalidator):
             create_result = await self.__beekeeper.api.create(
                 wallet_name=name, password=password, token=await self.token
             )
+        self.__state.on_create(name)
         wallet = await self.__construct_unlocked_wallet(name)
         return wallet if password is not None else (wallet, create_result.password)
 
     async def open_wallet(self, *, name: str) -> WalletInterface:
         with NoWalletWithSuchNameError(name), InvalidWalletError(wallet_name=name):
             await self.__beekeeper.api.open(wallet_name=name, token=await self.token)
+        self.__state.on_open(name)
         return await self.__construct_wallet(name=name)
 
     async def close_session(self) -> None:
         if self.__beekeeper.is_session_token_set():
             await self.__beekeeper.api.close_session(token=await self.token)
+            self.__state.invalidate()
             if self.__default_session_close_callback is not None:
                 self.__default_session_close_callback()
             self.invalidate(InvalidatedStateByClosingSessionError())
 
     async def lock_all(self) -> list[WalletInterface]:
         await self.__beekeeper.api.lock_all(token=await self.token)
+        self.__state.on_lock_all()
         return await self.wallets
 
     async def set_timeout(self, seconds: int) -> None:
         validate_timeout(time=seconds)
         await self.__beekeeper.api.set_timeout(seconds=seconds, token=await self.token)
+        self.__state.on_timeout_changed()
 
     async def sign_digest(self, *, sig_digest: str, key: str) -> Signature:
         validate_public_keys(key=key)
@@ -93,9 +107,21 @@ class Session(SessionInterface, StateInvalidator):
             ).signature
         raise UnknownDecisionPathError
 
+    async def sign_digests(self, *, sig_digests_and_keys: Sequence[tuple[str, str]]) -> list[Signature | BeekeepyError]:
+        validate_sign_digests_input(sig_digests_and_keys)
+        if not sig_digests_and_keys:
+            return []
+        token = await self.token
+        async with await self.__beekeeper.batch(delay_error_on_data_access=True, session_token=token) as batch:
+            responses = [
+                await batch.api.beekeeper.sign_digest(sig_digest=sig_digest, public_key=key, token=token)
+                for sig_digest, key in sig_digests_and_keys
+            ]
+        return collect_signatures(sig_digests_and_keys, responses)
+
     @property
     async def public_keys(self) -> list[PublicKey]:
-        return [item.public_key for item in (await self.__beekeeper.api.get_public_keys(token=await self.token)).keys]
+        return list(await self.__state.async_public_keys(ALL_WALLETS, self.__fetch_info, self.__fetch_public_keys))
 
     @property
     async def wallets_unlocked(self) -> list[UnlockedWalletInterface]:
@@ -121,34 +147,59 @@ class Session(SessionInterface, StateInvalidator):
         )
 
     async def __construct_unlocked_wallet(self, name: str) -> UnlockedWallet:
-        wallet = UnlockedWallet(
-            name=name, beekeeper=self.__beekeeper, session_token=await self.token, guard=self.__guard
-        )
-        self.register_invalidable(wallet)
+        if (wallet := self.__state.interned_wallet(UnlockedWallet, name)) is None:
+            wallet = self.__state.intern_wallet(
+                UnlockedWallet(
+                    name=name,
+                    beekeeper=self.__beekeeper,
+                    session_token=await self.token,
+                    guard=self.__guard,
+                    state=self.__state,
+                )
+            )
+            self.register_invalidable(wallet)
         return wallet
 
     async def __construct_wallet(self, name: str) -> WalletInterface:
-        wallet = Wallet(name=name, beekeeper=self.__beekeeper, session_token=await self.token, guard=self.__guard)
-        self.register_invalidable(wallet)
+        if (wallet := self.__state.interned_wallet(Wallet, name)) is None:
+            wallet = self.__state.intern_wallet(
+                Wallet(
+                    name=name,
+                    beekeeper=self.__beekeeper,
+                    session_token=await self.token,
+                    guard=self.__guard,
+                    state=self.__state,
+                )
+            )
+            self.register_invalidable(wallet)
         return wallet
 
     async def __list_wallets(self) -> list[WalletInterface]:
         return await asyncio.gather(
-            *[
-                self.__construct_wallet(name=wallet.name)
-                for wallet in (await self.__beekeeper.api.list_wallets(token=await self.token)).wallets
-            ]
+            *[self.__construct_wallet(name=wallet.name) for wallet in await self.__cached_wallets()]
         )
 
     async def __list_unlocked_wallets(self) -> list[UnlockedWalletInterface]:
         return await asyncio.gather(
             *[
                 self.__construct_unlocked_wallet(name=wallet.name)
-                for wallet in (await self.__beekeeper.api.list_wallets(token=await self.token)).wallets
+                for wallet in await self.__cached_wallets()
                 if wallet.unlocked
             ]
         )
 
+    async def __cached_wallets(self) -> list[WalletDetails]:
+        return await self.__state.async_wallets(self.__fetch_info, self.__fetch_wallets)
+
+    async def __fetch_info(self) -> GetInfo:
+        return await self.__beekeeper.api.get_info(token=await self.token)
+
+    async def __fetch_wallets(self) -> list[WalletDetails]:
+        return (await self.__beekeeper.api.list_wallets(token=await self.token)).wallets
+
+    async def __fetch_public_keys(self) -> list[PublicKey]:
+        return [item.public_key for item in (await self.__beekeeper.api.get_public_keys(token=await self.token)).keys]
+
     async def _aenter(self) -> SessionInterface:
         return self
 
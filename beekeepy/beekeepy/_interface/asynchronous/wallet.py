@@ -8,6 +8,7 @@ from beekeepy._interface.abc.asynchronous.wallet import (
 from beekeepy._interface.abc.asynchronous.wallet import (
     Wallet as WalletInterface,
 )
+from beekeepy._interface.bulk_signing import collect_signatures, validate_sign_digests_input
 from beekeepy._interface.settings import InterfaceSettings
 from beekeepy._interface.validators import validate_digest, validate_private_keys, validate_public_keys
 from beekeepy._interface.wallets_common import WalletCommons
@@ -24,8 +25,12 @@ from beekeepy.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from datetime import datetime
 
+    from beekeepy.exceptions import BeekeepyError
+    from schemas.apis.beekeeper_api import GetInfo
+    from schemas.apis.beekeeper_api.fundaments_of_responses import WalletDetails
     from schemas.fields.basic import PublicKey
     from schemas.fields.hex import Signature
 
@@ -35,10 +40,7 @@ class Wallet(
 ):
     @property
     async def public_keys(self) -> list[PublicKey]:
-        return [
-            key.public_key
-            for key in (await self._beekeeper.api.get_public_keys(wallet_name=self.name, token=self.session_token)).keys
-        ]
+        return list(await self._state.async_public_keys(self.name, self._fetch_info, self._fetch_public_keys))
 
     @property
     async def unlocked(self) -> UnlockedWallet | None:
@@ -56,20 +58,40 @@ class Wallet(
                         await self._beekeeper.api.unlock(
                             wallet_name=self.name, password=password, token=self.session_token
                         )
+            self._state.on_unlock(self.name)
         return self.__construct_unlocked_wallet()
 
     async def is_unlocked(self) -> bool:
         return self._is_wallet_unlocked(
             wallet_name=self.name,
-            wallets=(await self._beekeeper.api.list_wallets(token=self.session_token)).wallets,
+            wallets=await self._state.async_wallets(self._fetch_info, self.__fetch_wallets),
         )
 
+    async def _fetch_info(self) -> GetInfo:
+        return await self._beekeeper.api.get_info(token=self.session_token)
+
+    async def __fetch_wallets(self) -> list[WalletDetails]:
+        return (await self._beekeeper.api.list_wallets(token=self.session_token)).wallets
+
+    async def _fetch_public_keys(self) -> list[PublicKey]:
+        return [
+            key.public_key
+            for key in (await self._beekeeper.api.get_public_keys(wallet_name=self.name, token=self.session_token)).keys
+        ]
+
     def __construct_unlocked_wallet(self) -> UnlockedWallet:
-        wallet = UnlockedWallet(
-            name=self.name, beekeeper=self._beekeeper, session_token=self.session_token, guard=self._guard
-        )
+        if (wallet := self._state.interned_wallet(UnlockedWallet, self.name)) is None:
+            wallet = self._state.intern_wallet(
+                UnlockedWallet(
+                    name=self.name,
+                    beekeeper=self._beekeeper,
+                    session_token=self.session_token,
+                    guard=self._guard,
+                    state=self._state,
+                )
+            )
+            self.register_invalidable(wallet)
         wallet._last_lock_state = False
-        self.register_invalidable(wallet)
         return wallet
 
 
@@ -80,11 +102,13 @@ class UnlockedWallet(Wallet, UnlockedWalletInterface):
     async def import_key(self, *, private_key: str) -> PublicKey:
         validate_private_keys(private_key=private_key)
         with InvalidPrivateKeyError(wifs=private_key):
-            return (
+            public_key = (
                 await self._beekeeper.api.import_key(
                     wallet_name=self.name, wif_key=private_key, token=self.session_token
                 )
             ).public_key
+            self._state.on_keys_imported(self.name)
+            return public_key
         raise UnknownDecisionPathError
 
     @wallet_unlocked
@@ -92,13 +116,15 @@ class UnlockedWallet(Wallet, UnlockedWalletInterface):
         validate_private_keys(**{f"private_key_{i}": private_key for i, private_key in enumerate(private_keys)})
 
         with InvalidPrivateKeyError(wifs=private_keys):
-            return (
+            public_keys = (
                 await self._beekeeper.api.import_keys(
                     wallet_name=self.name,
                     wif_keys=private_keys,
                     token=self.session_token,
                 )
             ).public_keys
+            self._state.on_keys_imported(self.name)
+            return public_keys
         raise UnknownDecisionPathError
 
     @wallet_unlocked
@@ -108,10 +134,12 @@ class UnlockedWallet(Wallet, UnlockedWalletInterface):
             public_keys=key
         ):
             await self._beekeeper.api.remove_key(wallet_name=self.name, public_key=key, token=self.session_token)
+        self._state.on_key_removed(self.name, key)
 
     @wallet_unlocked
     async def lock(self) -> None:
         await self._beekeeper.api.lock(wallet_name=self.name, token=self.session_token)
+        self._state.on_lock(self.name)
 
     @wallet_unlocked
     async def sign_digest(self, *, sig_digest: str, key: str) -> Signature:
@@ -127,18 +155,32 @@ class UnlockedWallet(Wallet, UnlockedWalletInterface):
             ).signature
         raise UnknownDecisionPathError
 
+    @wallet_unlocked
+    async def sign_digests(self, *, sig_digests_and_keys: Sequence[tuple[str, str]]) -> list[Signature | BeekeepyError]:
+        validate_sign_digests_input(sig_digests_and_keys)
+        if not sig_digests_and_keys:
+            return []
+        async with await self._beekeeper.batch(
+            delay_error_on_data_access=True, session_token=self.session_token
+        ) as batch:
+            responses = [
+                await batch.api.beekeeper.sign_digest(
+                    sig_digest=sig_digest, public_key=key, wallet_name=self.name, token=self.session_token
+                )
+                for sig_digest, key in sig_digests_and_keys
+            ]
+        return collect_signatures(sig_digests_and_keys, responses)
+
     @wallet_unlocked
     async def has_matching_private_key(self, *, key: str) -> bool:
         validate_public_keys(key=key)
-        return (
-            await self._beekeeper.api.has_matching_private_key(
-                wallet_name=self.name, public_key=key, token=self.session_token
-            )
-        ).exists
+        return key in await self._state.async_public_keys(self.name, self._fetch_info, self._fetch_public_keys)
 
     @property
     async def lock_time(self) -> datetime:
-        return (await self._beekeeper.api.get_info(token=self.session_token)).timeout_time
+        info = await self._fetch_info()
+        self._state.update_info(info)
+        return info.timeout_time
 
     @wallet_unlocked
     async def encrypt_data(self, *, from_key: PublicKey, to_key: PublicKey, content: str, nonce: int = 0) -> str:
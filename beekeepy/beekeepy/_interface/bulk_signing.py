@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from beekeepy._interface.validators import validate_digest, validate_public_keys
+from beekeepy.exceptions import (
+    BeekeepyError,
+    InvalidPublicKeyError,
+    MissingSTMPrefixError,
+    NotExistingKeyError,
+    UnknownDecisionPathError,
+    UnlockIsNotAccessibleError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from schemas.apis.beekeeper_api import SignDigest
+    from schemas.fields.hex import Signature
+
+__all__ = ["collect_signatures", "validate_sign_digests_input"]
+
+
+def validate_sign_digests_input(sig_digests_and_keys: Sequence[tuple[str, str]]) -> None:
+    """Validates all digests and keys before anything is sent, raises on first invalid one."""
+    validate_digest(**{f"sig_digest_{i}": sig_digest for i, (sig_digest, _) in enumerate(sig_digests_and_keys)})
+    validate_public_keys(**{f"key_{i}": key for i, (_, key) in enumerate(sig_digests_and_keys)})
+
+
+def collect_signatures(
+    sig_digests_and_keys: Sequence[tuple[str, str]], responses: Sequence[SignDigest]
+) -> list[Signature | BeekeepyError]:
+    """Reads delayed batch responses in order, errors of single items are returned in place of signatures.
+
+    Note: UnlockIsNotAccessibleError is raised, as it concerns whole wallet, not single item.
+    """
+    return [_read_signature(key, response) for (_, key), response in zip(sig_digests_and_keys, responses, strict=True)]
+
+
+def _read_signature(key: str, response: SignDigest) -> Signature | BeekeepyError:
+    try:
+        with MissingSTMPrefixError(public_key=key), InvalidPublicKeyError(public_keys=key), NotExistingKeyError(
+            public_key=key
+        ):
+            return response.signature
+    except UnlockIsNotAccessibleError:
+        raise
+    except BeekeepyError as error:
+        return error
+    raise UnknownDecisionPathError
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Final, TypeVar
+from weakref import WeakValueDictionary
+
+from schemas.apis.beekeeper_api.fundaments_of_responses import WalletDetails
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from beekeepy._interface.wallets_common import ContainsWalletName
+    from schemas.apis.beekeeper_api import GetInfo
+    from schemas.fields.basic import PublicKey
+
+__all__ = ["SessionState"]
+
+WalletT = TypeVar("WalletT", bound="ContainsWalletName")
+
+ALL_WALLETS: Final[None] = None
+"""Key of public keys cache holding keys from all unlocked wallets of session."""
+
+
+class SessionState:
+    """Locally cached state of single session: wallets with their lock state, public keys and unlock timeout.
+
+    Beekeeper locks all wallets of session when unlock timeout (reported by `get_info`) passes, so cached state
+    expires at that moment and is fetched again on next access. Deadline is fetched lazily, only when cached state
+    is about to be reused and it is not known yet, so cold access costs single call. Changes made through interface
+    objects of the same session are applied to cache immediately, changes made by other clients using the same token
+    are not seen until expiration.
+
+    Note: Not intended for public use, instance is shared by session and all wallets created from it.
+    """
+
+    def __init__(self) -> None:
+        self.__deadline: float | None = None
+        self.__info: GetInfo | None = None
+        self.__wallets: list[WalletDetails] | None = None
+        self.__public_keys: dict[str | None, dict[PublicKey, None]] = {}
+        """Insertion ordered sets of keys, so both listing and membership checks are local."""
+        self.__wallet_objects: WeakValueDictionary[tuple[type, str], ContainsWalletName] = WeakValueDictionary()
+        """Wallet objects created for this session, reused as long as anyone holds them."""
+
+    def is_expired(self) -> bool:
+        return self.__deadline is not None and time.monotonic() >= self.__deadline
+
+    def wallets(
+        self, fetch_info: Callable[[], GetInfo], fetch: Callable[[], list[WalletDetails]]
+    ) -> list[WalletDetails]:
+        self.__expire_if_needed(fetch_info, cached=self.__wallets is not None)
+        if self.__wallets is None:
+            self.__wallets = fetch()
+        return self.__wallets
+
+    async def async_wallets(
+        self, fetch_info: Callable[[], Awaitable[GetInfo]], fetch: Callable[[], Awaitable[list[WalletDetails]]]
+    ) -> list[WalletDetails]:
+        await self.__async_expire_if_needed(fetch_info, cached=self.__wallets is not None)
+        if self.__wallets is None:
+            self.__wallets = await fetch()
+        return self.__wallets
+
+    def public_keys(
+        self, wallet_name: str | None, fetch_info: Callable[[], GetInfo], fetch: Callable[[], list[PublicKey]]
+    ) -> dict[PublicKey, None]:
+        """Returns keys of given wallet (or of all unlocked wallets, if ALL_WALLETS is given) as ordered set."""
+        self.__expire_if_needed(fetch_info, cached=wallet_name in self.__public_keys)
+        if wallet_name not in self.__public_keys:
+            self.__public_keys[wallet_name] = dict.fromkeys(fetch())
+        return self.__public_keys[wallet_name]
+
+    async def async_public_keys(
+        self,
+        wallet_name: str | None,
+        fetch_info: Callable[[], Awaitable[GetInfo]],
+        fetch: Callable[[], Awaitable[list[PublicKey]]],
+    ) -> dict[PublicKey, None]:
+        """Returns keys of given wallet (or of all unlocked wallets, if ALL_WALLETS is given) as ordered set."""
+        await self.__async_expire_if_needed(fetch_info, cached=wallet_name in self.__public_keys)
+        if wallet_name not in self.__public_keys:
+            self.__public_keys[wallet_name] = dict.fromkeys(await fetch())
+        return self.__public_keys[wallet_name]
+
+    def interned_wallet(self, wallet_type: type[WalletT], name: str) -> WalletT | None:
+        """Returns wallet object of exactly given type created earlier for this session, if it is still alive."""
+        return self.__wallet_objects.get((wallet_type, name))  # type: ignore[return-value]
+
+    def intern_wallet(self, wallet: WalletT) -> WalletT:
+        self.__wallet_objects[(type(wallet), wallet.name)] = wallet
+        return wallet
+
+    def info(self, fetch: Callable[[], GetInfo]) -> GetInfo:
+        if self.is_expired():
+            self.invalidate()
+        if self.__info is None:
+            self.update_info(fetch())
+        assert self.__info is not None, "Info has to be set after update"
+        return self.__info
+
+    async def async_info(self, fetch: Callable[[], Awaitable[GetInfo]]) -> GetInfo:
+        if self.is_expired():
+            self.invalidate()
+        if self.__info is None:
+            self.update_info(await fetch())
+        assert self.__info is not None, "Info has to be set after update"
+        return self.__info
+
+    def update_info(self, info: GetInfo) -> None:
+        """Sets deadline of cached state basing on unlock timeout reported by beekeeper."""
+        self.__info = info
+        self.__deadline = time.monotonic() + (info.timeout_time - info.now).total_seconds()
+
+    def on_unlock(self, wallet_name: str) -> None:
+        self.__set_lock_state(wallet_name, unlocked=True)
+        self.__forget_keys(wallet_name)
+
+    def on_lock(self, wallet_name: str) -> None:
+        self.__set_lock_state(wallet_name, unlocked=False)
+        self.__forget_keys(wallet_name)
+
+    def on_lock_all(self) -> None:
+        if self.__wallets is not None:
+            self.__wallets = [WalletDetails(name=wallet.name, unlocked=False) for wallet in self.__wallets]
+        self.__public_keys.clear()
+
+    def on_create(self, wallet_name: str) -> None:
+        """Newly created wallet is unlocked."""
+        self.on_unlock(wallet_name)
+
+    def on_open(self, wallet_name: str) -> None:
+        if self.__wallets is not None and all(wallet.name != wallet_name for wallet in self.__wallets):
+            self.__wallets = None
+
+    def on_keys_imported(self, wallet_name: str) -> None:
+        """Keys are listed by beekeeper in its own order, so they are fetched again instead of being appended."""
+        self.__forget_keys(wallet_name)
+
+    def on_key_removed(self, wallet_name: str, public_key: str) -> None:
+        if (cached := self.__public_keys.get(wallet_name)) is not None:
+            cached.pop(public_key, None)
+        # the same key could be imported also to other unlocked wallet
+        self.__public_keys.pop(ALL_WALLETS, None)
+
+    def on_timeout_changed(self) -> None:
+        """Timeout could have been shortened, so deadline is recalculated on next access."""
+        self.__deadline = None
+        self.__info = None
+
+    def invalidate(self) -> None:
+        """Forgets whole state, next access will fetch it from beekeeper."""
+        self.__deadline = None
+        self.__info = None
+        self.__wallets = None
+        self.__public_keys.clear()
+
+    def __expire_if_needed(self, fetch_info: Callable[[], GetInfo], *, cached: bool) -> None:
+        """Deadline is needed only to trust cached value, so it is not fetched when value will be fetched anyway."""
+        if cached and self.__deadline is None:
+            self.update_info(fetch_info())
+        if self.is_expired():
+            self.invalidate()
+
+    async def __async_expire_if_needed(self, fetch_info: Callable[[], Awaitable[GetInfo]], *, cached: bool) -> None:
+        """Deadline is needed only to trust cached value, so it is not fetched when value will be fetched anyway."""
+        if cached and self.__deadline is None:
+            self.update_info(await fetch_info())
+        if self.is_expired():
+            self.invalidate()
+
+    def __set_lock_state(self, wallet_name: str, *, unlocked: bool) -> None:
+        if self.__wallets is None:
+            return
+        if all(wallet.name != wallet_name for wallet in self.__wallets):
+            self.__wallets = None
+            return
+        self.__wallets = [
+            WalletDetails(name=wallet.name, unlocked=unlocked) if wallet.name == wallet_name else wallet
+            for wallet in self.__wallets
+        ]
+
+    def __forget_keys(self, wallet_name: str) -> None:
+        self.__public_keys.pop(wallet_name, None)
+        self.__public_keys.pop(ALL_WALLETS, None)
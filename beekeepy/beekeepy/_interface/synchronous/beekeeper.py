@@ -7,6 +7,7 @@ from loguru import logger
 from beekeepy._interface.abc.packed_object import PackedSyncBeekeeper
 from beekeepy._interface.abc.synchronous.beekeeper import Beekeeper as BeekeeperInterface
 from beekeepy._interface.settings import InterfaceSettings
+from beekeepy._interface.synchronous.beekeeper_spares import BeekeeperSpares
 from beekeepy._interface.synchronous.session import Session
 from beekeepy._utilities.delay_guard import SyncDelayGuard
 from beekeepy._utilities.state_invalidator import StateInvalidator
@@ -88,8 +89,10 @@ class Beekeeper(BeekeeperInterface, StateInvalidator):
     @classmethod
     def _factory(cls, *, settings: InterfaceSettings | None = None) -> BeekeeperInterface:
         settings = settings or InterfaceSettings()
-        handle = cls.__create_local_handle(settings=settings)
-        handle.run()
+        handle = BeekeeperSpares.take_active(settings)
+        if handle is None:
+            handle = cls.__create_local_handle(settings=settings)
+            handle.run()
         return cls(handle=handle)
 
     @classmethod
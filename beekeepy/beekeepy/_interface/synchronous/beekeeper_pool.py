@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from queue import Queue
+from typing import TYPE_CHECKING
+
+from beekeepy._interface.abc.synchronous.beekeeper import Beekeeper
+from beekeepy._interface.settings import InterfaceSettings
+from beekeepy._utilities.context import SelfContextSync
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from pathlib import Path
+
+    from beekeepy._interface.abc.synchronous.session import Session
+    from beekeepy._interface.abc.synchronous.wallet import UnlockedWallet
+    from schemas.fields.basic import PublicKey
+    from schemas.fields.hex import Signature
+
+__all__ = ["BeekeeperPool"]
+
+
+@dataclass(kw_only=True)
+class _PoolWorker:
+    beekeeper: Beekeeper
+    session: Session
+    wallets: dict[str, UnlockedWallet]
+
+
+class BeekeeperPool(SelfContextSync):
+    """Runs many local beekeeper processes with the same wallets and spreads signing between them.
+
+    Every beekeeper works on its own copy of wallet files, so signing performed by pool scales with amount of cores.
+    Each worker is used by at most one thread at a time, call `sign_digest` from many threads or use `sign_digests`.
+
+    Example:
+        ```
+        with BeekeeperPool(size=4, wallets={"alice": "password"}, wallets_directory=path) as pool:
+            signatures = pool.sign_digests([(digest, key) for digest in digests])
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int,
+        wallets: Mapping[str, str],
+        wallets_directory: Path | None = None,
+        settings: InterfaceSettings | None = None,
+    ) -> None:
+        """Starts beekeepers and unlocks wallets in each of them.
+
+        Args:
+            size: amount of beekeeper processes to start.
+            wallets: names of wallets to unlock, mapped to their passwords.
+            wallets_directory: directory with `*.wallet` files copied to each beekeeper; if not given,
+                wallets are created empty in each beekeeper, so keys have to be added with `import_keys`.
+            settings: base settings, each beekeeper works in subdirectory of its working directory.
+        """
+        assert size > 0, "Pool size has to be positive"
+        self.__settings = settings or InterfaceSettings()
+        self.__wallets = dict(wallets)
+        self.__wallets_directory = wallets_directory
+        self.__workers: list[_PoolWorker] = []
+        self.__idle: Queue[_PoolWorker] = Queue()
+
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(self.__start_worker, index) for index in range(size)]
+
+        errors = [error for future in futures if (error := future.exception()) is not None]
+        for future in futures:
+            if future.exception() is None:
+                self.__workers.append(future.result())
+                self.__idle.put(future.result())
+        if errors:
+            self.teardown()
+            raise errors[0]
+
+    @property
+    def size(self) -> int:
+        return len(self.__workers)
+
+    @property
+    def beekeepers(self) -> list[Beekeeper]:
+        return [worker.beekeeper for worker in self.__workers]
+
+    def import_keys(self, *, wallet_name: str, private_keys: list[str]) -> list[PublicKey]:
+        """Imports keys to given wallet in every beekeeper of pool, returns public keys reported by all of them."""
+        imported = [worker.wallets[wallet_name].import_keys(private_keys=private_keys) for worker in self.__workers]
+        public_keys = imported[0]
+        assert all(
+            keys == public_keys for keys in imported
+        ), f"Beekeepers of pool reported different public keys: {imported}"
+        return public_keys
+
+    def sign_digest(self, *, sig_digest: str, key: str, wallet_name: str | None = None) -> Signature:
+        """Signs digest with first idle beekeeper, blocks if all of them are busy."""
+        with self.__acquire_worker() as worker:
+            return self.__sign(worker, sig_digest=sig_digest, key=key, wallet_name=wallet_name)
+
+    def sign_digests(
+        self, sig_digests_and_keys: Sequence[tuple[str, str]], *, wallet_name: str | None = None
+    ) -> list[Signature]:
+        """Signs all given (digest, key) pairs using all beekeepers in parallel, returns signatures in given order."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(
+                executor.map(
+                    lambda pair: self.sign_digest(sig_digest=pair[0], key=pair[1], wallet_name=wallet_name),
+                    sig_digests_and_keys,
+                )
+            )
+
+    def teardown(self) -> None:
+        for worker in self.__workers:
+            worker.beekeeper.teardown()
+        self.__workers.clear()
+
+    def _finally(self) -> None:
+        self.teardown()
+
+    def __start_worker(self, index: int) -> _PoolWorker:
+        settings = self.__settings.copy()
+        settings.working_directory = self.__settings.ensured_working_directory / f"beekeeper-{index}"
+        settings.working_directory.mkdir(parents=True, exist_ok=True)
+        if self.__wallets_directory is not None:
+            for wallet_file in self.__wallets_directory.glob("*.wallet"):
+                shutil.copy2(wallet_file, settings.working_directory / wallet_file.name)
+
+        beekeeper = Beekeeper.factory(settings=settings)
+        try:
+            session = beekeeper.create_session()
+            return _PoolWorker(
+                beekeeper=beekeeper,
+                session=session,
+                wallets={name: self.__unlock(session, name, password) for name, password in self.__wallets.items()},
+            )
+        except BaseException:
+            beekeeper.teardown()
+            raise
+
+    def __unlock(self, session: Session, name: str, password: str) -> UnlockedWallet:
+        if self.__wallets_directory is None:
+            return session.create_wallet(name=name, password=password)
+        return session.open_wallet(name=name).unlock(password)
+
+    @contextmanager
+    def __acquire_worker(self) -> Iterator[_PoolWorker]:
+        worker = self.__idle.get()
+        try:
+            yield worker
+        finally:
+            self.__idle.put(worker)
+
+    @classmethod
+    def __sign(cls, worker: _PoolWorker, *, sig_digest: str, key: str, wallet_name: str | None) -> Signature:
+        if wallet_name is None:
+            return worker.session.sign_digest(sig_digest=sig_digest, key=key)
+        return worker.wallets[wallet_name].sign_digest(sig_digest=sig_digest, key=key)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import itertools
+from threading import Condition, Lock, Thread
+from typing import TYPE_CHECKING, ClassVar
+
+from loguru import logger
+
+from beekeepy._interface.settings import InterfaceSettings
+from beekeepy._utilities.context import SelfContextSync
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+    from beekeepy._runnable_handle.runnable_sync_beekeeper import Beekeeper as SynchronousBeekeeperHandle
+
+__all__ = ["BeekeeperSpares"]
+
+
+class BeekeeperSpares(SelfContextSync):
+    """Keeps already started local beekeepers idle, so `Beekeeper.factory` can return one without waiting for startup.
+
+    Spares are started in background, each in its own subdirectory of `directory`. While spares are active,
+    `Beekeeper.factory` takes one of them if requested settings do not specify working directory and all other
+    fields are equal to settings given here; otherwise new beekeeper is started as usual.
+    After spare is taken, new one is started in background.
+
+    Example:
+        ```
+        with BeekeeperSpares(count=2):
+            for _ in range(10):
+                with Beekeeper.factory() as bk:  # returns immediately, if spare is ready
+                    ...
+        ```
+    """
+
+    __active: ClassVar[BeekeeperSpares | None] = None
+    __active_lock: ClassVar[Lock] = Lock()
+
+    def __init__(self, *, count: int, settings: InterfaceSettings | None = None, directory: Path | None = None) -> None:
+        """Prepares spares manager, spares are started by `start` or on entering context.
+
+        Args:
+            count: amount of idle beekeepers to keep.
+            settings: settings with which spares are started, `working_directory` field is ignored.
+            directory: parent directory of spares working directories, defaults to `spares` in working directory.
+        """
+        assert count > 0, "Amount of spares has to be positive"
+        self.__count = count
+        self.__template = self.__without_working_directory(settings or InterfaceSettings())
+        self.__directory = directory or (settings or InterfaceSettings()).ensured_working_directory / "spares"
+        self.__spares: list[SynchronousBeekeeperHandle[InterfaceSettings]] = []
+        self.__condition = Condition()
+        self.__stopped = True
+        self.__error: Exception | None = None
+        self.__thread: Thread | None = None
+        self.__numbers = itertools.count()
+
+    @property
+    def ready(self) -> int:
+        """Returns amount of spares which are started and waiting to be taken."""
+        with self.__condition:
+            return len(self.__spares)
+
+    def start(self) -> None:
+        """Activates spares for `Beekeeper.factory` and starts filling them in background."""
+        with BeekeeperSpares.__active_lock:
+            assert BeekeeperSpares.__active is None, "Other spares are already active"
+            BeekeeperSpares.__active = self
+        with self.__condition:
+            self.__stopped = False
+            self.__error = None
+        self.__thread = Thread(target=self.__refill, name=f"{type(self).__name__}-{id(self):x}", daemon=True)
+        self.__thread.start()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """Blocks until all spares are started, returns False on timeout or if spares have been stopped.
+
+        Raises:
+            Exception: error which occurred while starting spare, spares are deactivated after it.
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__stopped or len(self.__spares) >= self.__count, timeout=timeout)
+            if self.__error is not None:
+                raise self.__error
+            return not self.__stopped and len(self.__spares) >= self.__count
+
+    def take(self, settings: InterfaceSettings) -> SynchronousBeekeeperHandle[InterfaceSettings] | None:
+        """Returns started beekeeper matching given settings or None, if there is no such one ready."""
+        if settings.working_directory is not None or self.__without_working_directory(settings) != self.__template:
+            return None
+        with self.__condition:
+            if self.__stopped or not self.__spares:
+                return None
+            spare = self.__spares.pop(0)
+            self.__condition.notify_all()
+        logger.debug(f"Using spare beekeeper from {spare.settings.working_directory}")
+        return spare
+
+    def teardown(self) -> None:
+        """Deactivates spares and closes all which have not been taken."""
+        self.__deactivate()
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        with self.__condition:
+            spares, self.__spares = self.__spares, []
+        for spare in spares:
+            spare.teardown()
+
+    @classmethod
+    def take_active(cls, settings: InterfaceSettings) -> SynchronousBeekeeperHandle[InterfaceSettings] | None:
+        with cls.__active_lock:
+            active = cls.__active
+        return None if active is None else active.take(settings)
+
+    def _enter(self) -> Self:
+        self.start()
+        return self
+
+    def _finally(self) -> None:
+        self.teardown()
+
+    def __refill(self) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__stopped or len(self.__spares) < self.__count)
+                if self.__stopped:
+                    return
+
+            try:
+                spare = self.__start_spare()
+            except Exception as error:  # noqa: BLE001
+                logger.error(f"Failed to start spare beekeeper: {error}")
+                self.__deactivate()
+                with self.__condition:
+                    self.__stopped = True
+                    self.__error = error
+                    self.__condition.notify_all()
+                return
+
+            with self.__condition:
+                if not self.__stopped:
+                    self.__spares.append(spare)
+                    self.__condition.notify_all()
+                    continue
+            spare.teardown()
+            return
+
+    def __deactivate(self) -> None:
+        with BeekeeperSpares.__active_lock:
+            if BeekeeperSpares.__active is self:
+                BeekeeperSpares.__active = None
+
+    def __start_spare(self) -> SynchronousBeekeeperHandle[InterfaceSettings]:
+        from beekeepy._runnable_handle.runnable_sync_beekeeper import Beekeeper as SynchronousBeekeeperHandle
+
+        settings = self.__template.copy()
+        settings.working_directory = self.__next_working_directory()
+        handle: SynchronousBeekeeperHandle[InterfaceSettings] = SynchronousBeekeeperHandle(
+            settings=settings, logger=logger
+        )
+        handle.run()
+        return handle
+
+    def __next_working_directory(self) -> Path:
+        while (path := self.__directory / f"spare-{next(self.__numbers)}").exists():
+            pass
+        path.mkdir(parents=True)
+        return path
+
+    @classmethod
+    def __without_working_directory(cls, settings: InterfaceSettings) -> InterfaceSettings:
+        result = settings.copy()
+        result.working_directory = None
+        return result
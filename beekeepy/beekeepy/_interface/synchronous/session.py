@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from beekeepy._interface.abc.synchronous.session import Password
 from beekeepy._interface.abc.synchronous.session import Session as SessionInterface
+from beekeepy._interface.bulk_signing import collect_signatures, validate_sign_digests_input
+from beekeepy._interface.session_state import ALL_WALLETS, SessionState
 from beekeepy._interface.synchronous.wallet import (
     UnlockedWallet,
     Wallet,
@@ -20,6 +22,8 @@ from beekeepy.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from beekeepy._interface.abc.synchronous.wallet import (
         UnlockedWallet as UnlockedWalletInterface,
     )
@@ -29,7 +33,9 @@ if TYPE_CHECKING:
     from beekeepy._interface.settings import InterfaceSettings
     from beekeepy._remote_handle.sync_beekeeper import Beekeeper as SyncRemoteBeekeeper
     from beekeepy._utilities.delay_guard import SyncDelayGuard
+    from beekeepy.exceptions import BeekeepyError
     from schemas.apis.beekeeper_api import GetInfo
+    from schemas.apis.beekeeper_api.fundaments_of_responses import WalletDetails
     from schemas.fields.basic import PublicKey
     from schemas.fields.hex import Signature
 
@@ -49,37 +55,45 @@ class Session(SessionInterface, StateInvalidator):
         self.__session_token = use_session_token or ""
         self.__guard = guard
         self.__default_session_close_callback = default_session_close_callback
+        self.__state = SessionState()
 
     def get_info(self) -> GetInfo:
-        return self.__beekeeper.api.get_info(token=self.token)
+        info = self.__fetch_info()
+        self.__state.update_info(info)
+        return info
 
     def create_wallet(  # type: ignore[override]
         self, *, name: str, password: str | None = None
     ) -> UnlockedWalletInterface | tuple[UnlockedWalletInterface, Password]:
         with WalletWithSuchNameAlreadyExistsError(wallet_name=name), InvalidWalletError(wallet_name=name):
             create_result = self.__beekeeper.api.create(wallet_name=name, password=password, token=self.token)
+        self.__state.on_create(name)
         wallet = self.__construct_unlocked_wallet(name)
         return wallet if password is not None else (wallet, create_result.password)
 
     def open_wallet(self, *, name: str) -> WalletInterface:
         with NoWalletWithSuchNameError(name), InvalidWalletError(wallet_name=name):
             self.__beekeeper.api.open(wallet_name=name, token=self.token)
+        self.__state.on_open(name)
         return self.__construct_wallet(name=name)
 
     def close_session(self) -> None:
         if self.__session_token != "":
             self.__beekeeper.api.close_session(token=self.token)
+            self.__state.invalidate()
             if self.__default_session_close_callback is not None:
                 self.__default_session_close_callback()
             self.invalidate(InvalidatedStateByClosingSessionError())
 
     def lock_all(self) -> list[WalletInterface]:
         self.__beekeeper.api.lock_all(token=self.token)
+        self.__state.on_lock_all()
         return self.wallets
 
     def set_timeout(self, seconds: int) -> None:
         validate_timeout(time=seconds)
         self.__beekeeper.api.set_timeout(seconds=seconds, token=self.token)
+        self.__state.on_timeout_changed()
 
     def sign_digest(self, *, sig_digest: str, key: str) -> Signature:
         validate_public_keys(key=key)
@@ -88,6 +102,17 @@ class Session(SessionInterface, StateInvalidator):
             return self.__beekeeper.api.sign_digest(sig_digest=sig_digest, public_key=key, token=self.token).signature
         raise UnknownDecisionPathError
 
+    def sign_digests(self, *, sig_digests_and_keys: Sequence[tuple[str, str]]) -> list[Signature | BeekeepyError]:
+        validate_sign_digests_input(sig_digests_and_keys)
+        if not sig_digests_and_keys:
+            return []
+        with self.__beekeeper.batch(delay_error_on_data_access=True, session_token=self.token) as batch:
+            responses = [
+                batch.api.beekeeper.sign_digest(sig_digest=sig_digest, public_key=key, token=self.token)
+                for sig_digest, key in sig_digests_and_keys
+            ]
+        return collect_signatures(sig_digests_and_keys, responses)
+
     @property
     def wallets_unlocked(self) -> list[UnlockedWalletInterface]:
         return self.__list_unlocked_wallets()
@@ -111,31 +136,56 @@ class Session(SessionInterface, StateInvalidator):
 
     @property
     def public_keys(self) -> list[PublicKey]:
-        return [key.public_key for key in self.__beekeeper.api.get_public_keys(token=self.token).keys]
+        return list(self.__state.public_keys(ALL_WALLETS, self.__fetch_info, self.__fetch_public_keys))
 
     def __construct_unlocked_wallet(self, name: str) -> UnlockedWallet:
-        wallet = UnlockedWallet(name=name, beekeeper=self.__beekeeper, session_token=self.token, guard=self.__guard)
-        self.register_invalidable(wallet)
+        if (wallet := self.__state.interned_wallet(UnlockedWallet, name)) is None:
+            wallet = self.__state.intern_wallet(
+                UnlockedWallet(
+                    name=name,
+                    beekeeper=self.__beekeeper,
+                    session_token=self.token,
+                    guard=self.__guard,
+                    state=self.__state,
+                )
+            )
+            self.register_invalidable(wallet)
         return wallet
 
     def __construct_wallet(self, name: str) -> Wallet:
-        wallet = Wallet(name=name, beekeeper=self.__beekeeper, session_token=self.token, guard=self.__guard)
-        self.register_invalidable(wallet)
+        if (wallet := self.__state.interned_wallet(Wallet, name)) is None:
+            wallet = self.__state.intern_wallet(
+                Wallet(
+                    name=name,
+                    beekeeper=self.__beekeeper,
+                    session_token=self.token,
+                    guard=self.__guard,
+                    state=self.__state,
+                )
+            )
+            self.register_invalidable(wallet)
         return wallet
 
     def __list_wallets(self) -> list[WalletInterface]:
-        return [
-            self.__construct_wallet(name=wallet.name)
-            for wallet in self.__beekeeper.api.list_wallets(token=self.token).wallets
-        ]
+        return [self.__construct_wallet(name=wallet.name) for wallet in self.__cached_wallets()]
 
     def __list_unlocked_wallets(self) -> list[UnlockedWalletInterface]:
         return [
-            self.__construct_unlocked_wallet(name=wallet.name)
-            for wallet in self.__beekeeper.api.list_wallets(token=self.token).wallets
-            if wallet.unlocked
+            self.__construct_unlocked_wallet(name=wallet.name) for wallet in self.__cached_wallets() if wallet.unlocked
         ]
 
+    def __cached_wallets(self) -> list[WalletDetails]:
+        return self.__state.wallets(self.__fetch_info, self.__fetch_wallets)
+
+    def __fetch_info(self) -> GetInfo:
+        return self.__beekeeper.api.get_info(token=self.token)
+
+    def __fetch_wallets(self) -> list[WalletDetails]:
+        return self.__beekeeper.api.list_wallets(token=self.token).wallets
+
+    def __fetch_public_keys(self) -> list[PublicKey]:
+        return [key.public_key for key in self.__beekeeper.api.get_public_keys(token=self.token).keys]
+
     def _enter(self) -> SessionInterface:
         return self
 
@@ -6,6 +6,7 @@ from asyncio import iscoroutinefunction
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Generic, NoReturn, ParamSpec, TypeVar, overload
 
+from beekeepy._interface.session_state import SessionState
 from beekeepy._interface.settings import InterfaceSettings
 from beekeepy._remote_handle.async_beekeeper import AsyncBeekeeper as AsyncRemoteBeekeeper
 from beekeepy._remote_handle.sync_beekeeper import Beekeeper as SyncRemoteBeekeeper
@@ -36,11 +37,19 @@ class ContainsWalletName(ABC):
 
 class WalletCommons(ContainsWalletName, StateInvalidator, Generic[BeekeeperT, CallbackT, GuardT]):
     def __init__(
-        self, *args: Any, name: str, beekeeper: BeekeeperT, session_token: str, guard: GuardT, **kwargs: Any
+        self,
+        *args: Any,
+        name: str,
+        beekeeper: BeekeeperT,
+        session_token: str,
+        guard: GuardT,
+        state: SessionState | None = None,
+        **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.__name = name
         self.__beekeeper = beekeeper
+        self.__state = state or SessionState()
         self.__last_check_is_locked = True
         self.__wallet_close_callbacks: list[CallbackT] = []
         self.session_token = session_token
@@ -61,6 +70,10 @@ class WalletCommons(ContainsWalletName, StateInvalidator, Generic[BeekeeperT, Ca
     def _beekeeper(self) -> BeekeeperT:
         return self.__beekeeper
 
+    @property
+    def _state(self) -> SessionState:
+        return self.__state
+
     @property
     def _last_lock_state(self) -> bool:
         """Returns last save lock state.
@@ -101,6 +114,7 @@ class WalletCommons(ContainsWalletName, StateInvalidator, Generic[BeekeeperT, Ca
     async def _async_call_callback(self) -> None:
         assert isinstance(self._beekeeper, AsyncRemoteBeekeeper), "invalid beekeeper type, require synchronous"
 
+        self._state.invalidate()
         locked_wallets = self.__get_all_locked_wallets(
             (await self._beekeeper.api.list_wallets(token=self.session_token)).wallets
         )
@@ -117,6 +131,7 @@ class WalletCommons(ContainsWalletName, StateInvalidator, Generic[BeekeeperT, Ca
     def _sync_call_callback(self) -> None:
         assert isinstance(self._beekeeper, SyncRemoteBeekeeper), "invalid beekeeper type, require synchronous"
 
+        self._state.invalidate()
         locked_wallets = self.__get_all_locked_wallets(
             self._beekeeper.api.list_wallets(token=self.session_token).wallets
         )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import msgspec
+
+from beekeepy import exceptions
+from beekeepy._utilities.json_codec import json_loads
+
+if TYPE_CHECKING:
+    from beekeepy._remote_handle.abc.handle import AbstractAsyncHandle
+    from schemas.jsonrpc import ExpectResultT, JSONRPCResult
+
+
+@dataclass(kw_only=True)
+class _PendingCall:
+    request: exceptions.Json
+    expected_type: type[Any]
+    serialization_type: Literal["hf26", "legacy"]
+    future: asyncio.Future[JSONRPCResult[Any]]
+
+
+class AutoBatcher:
+    """Coalesces jsonrpc calls issued by async handle within short window into single batch request.
+
+    Note: This class should be considered as part of AbstractAsyncHandle, not intended for public use.
+    """
+
+    def __init__(self, owner: AbstractAsyncHandle[Any, Any]) -> None:
+        self.__owner = owner
+        self.__pending: list[_PendingCall] = []
+        self.__flush_timer: asyncio.TimerHandle | None = None
+        self.__in_flight: set[asyncio.Task[None]] = set()
+
+    async def send(
+        self, *, data: str, expected_type: type[ExpectResultT], serialization_type: Literal["hf26", "legacy"]
+    ) -> JSONRPCResult[ExpectResultT]:
+        loop = asyncio.get_running_loop()
+        call = _PendingCall(
+            request=json_loads(data),  # type: ignore[arg-type]
+            expected_type=expected_type,
+            serialization_type=serialization_type,
+            future=loop.create_future(),
+        )
+        self.__pending.append(call)
+
+        settings = self.__owner._settings
+        if len(self.__pending) >= settings.auto_batch_max_size:
+            self.__flush()
+        elif self.__flush_timer is None:
+            assert settings.auto_batch_window is not None, "Auto batching has been disabled while gathering calls"
+            self.__flush_timer = loop.call_later(settings.auto_batch_window.total_seconds(), self.__flush)
+
+        return await call.future
+
+    def teardown(self) -> None:
+        """Cancels all calls which has not been sent yet and batches which are still waiting for response."""
+        self.__cancel_timer()
+        pending, self.__pending = self.__pending, []
+        for call in pending:
+            call.future.cancel()
+        for task in list(self.__in_flight):
+            task.cancel()
+
+    def __cancel_timer(self) -> None:
+        if self.__flush_timer is not None:
+            self.__flush_timer.cancel()
+            self.__flush_timer = None
+
+    def __flush(self) -> None:
+        self.__cancel_timer()
+        calls, self.__pending = self.__pending, []
+        if not calls:
+            return
+        task = asyncio.ensure_future(self.__send_batch(calls))
+        self.__in_flight.add(task)
+        task.add_done_callback(self.__in_flight.discard)
+
+    async def __send_batch(self, calls: list[_PendingCall]) -> None:
+        try:
+            await self.__resolve_batch(calls)
+        except asyncio.CancelledError:
+            for call in calls:
+                call.future.cancel()
+            raise
+        except Exception as error:  # noqa: BLE001
+            self.__set_exception_for_all(calls, error)
+        finally:
+            self.__set_exception_for_all(
+                calls, exceptions.BatchRequestError("Response for request has not been received")
+            )
+
+    async def __resolve_batch(self, calls: list[_PendingCall]) -> None:
+        for request_id, call in enumerate(calls):
+            call.request["id"] = request_id
+        data = msgspec.json.encode([call.request for call in calls]).decode()
+
+        try:
+            responses = await self.__owner._async_send_raw(data=data)
+        except exceptions.OverseerError as error:
+            self.__set_grouped_errors(calls, error)
+            self.__set_exception_for_all(calls, error)
+            return
+        except Exception as error:  # noqa: BLE001
+            self.__set_exception_for_all(calls, error)
+            return
+
+        if not isinstance(responses, list):
+            self.__set_exception_for_all(
+                calls, exceptions.BatchRequestError(f"Expected list of responses for batch request, got: {responses}")
+            )
+            return
+
+        for response in responses:
+            self.__set_response(calls, response)
+
+    @classmethod
+    def __find_request_id(cls, calls: list[_PendingCall], response: Any) -> int | None:
+        """Returns id of call to which response belongs, None if response has no id or id is not known."""
+        request_id = response.get("id") if isinstance(response, dict) else None
+        if isinstance(request_id, bool) or not isinstance(request_id, int | str):
+            return None
+        try:
+            index = int(request_id)
+        except ValueError:
+            return None
+        return index if 0 <= index < len(calls) else None
+
+    def __set_response(self, calls: list[_PendingCall], response: exceptions.Json) -> None:
+        if (request_id := self.__find_request_id(calls, response)) is None:
+            return
+        call = calls[request_id]
+        if call.future.done():
+            return
+        try:
+            call.future.set_result(
+                self.__owner._validate_response(
+                    response=response,
+                    expected_type=call.expected_type,
+                    serialization_type=call.serialization_type,
+                    is_jsonrpc=True,
+                )
+            )
+        except Exception as error:  # noqa: BLE001
+            call.future.set_exception(error)
+
+    def __set_grouped_errors(self, calls: list[_PendingCall], error: exceptions.OverseerError) -> None:
+        grouped = error.cause
+        if not isinstance(error.whole_response, list) or not isinstance(grouped, exceptions.GroupedErrorsError):
+            return
+
+        for response in error.whole_response:
+            if (request_id := self.__find_request_id(calls, response)) is None:
+                continue
+            if (specific_error := grouped.get_exception_for(request_id=request_id)) is not None:
+                if not calls[request_id].future.done():
+                    calls[request_id].future.set_exception(specific_error)
+            else:
+                self.__set_response(calls, response)
+
+    @classmethod
+    def __set_exception_for_all(cls, calls: list[_PendingCall], error: BaseException) -> None:
+        for call in calls:
+            if not call.future.done():
+                call.future.set_exception(error)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from abc import ABC
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from beekeepy import exceptions
 from beekeepy._apis.abc.sendable import AsyncSendable, SyncSendable
+from beekeepy._communication.metrics import BATCH_ERRORS_TOTAL, BATCH_SIZE, endpoint_label
 from beekeepy._utilities.context import ContextAsync, ContextSync, EnterReturnT
-from schemas.jsonrpc import ExpectResultT, JSONRPCResult, get_response_model
+from beekeepy._utilities.json_codec import build_response_model
+from schemas.jsonrpc import ExpectResultT, JSONRPCResult
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -54,7 +57,7 @@ class _DelayedResponseWrapper:
 
     def _set_response(self, **kwargs: Any) -> None:
         expected_type = super().__getattribute__("_expected_type")
-        response = get_response_model(expected_type, json.dumps(kwargs), "hf26")
+        response = build_response_model(expected_type, kwargs, "hf26")
         assert isinstance(response, JSONRPCResult), "Expected JSONRPCResult, model cannot be found."
         super().__setattr__("_response", response.result)
 
@@ -84,6 +87,7 @@ class _PostRequestManager(ContextSync["_PostRequestManager"]):
         self, request_id: int, response: exceptions.OverseerError | exceptions.Json
     ) -> None:
         if isinstance(response, exceptions.OverseerError):
+            self.__owner._record_batch_error(response)
             self.__owner._get_batch_delayed_result(request_id)._set_exception(response)
             if not self.__owner._delay_error_on_data_access:
                 raise response
@@ -131,16 +135,20 @@ class _PostRequestManager(ContextSync["_PostRequestManager"]):
 
 
 class _BatchHandle(ContextSync[EnterReturnT], ContextAsync[EnterReturnT], Generic[EnterReturnT], ABC):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: HttpUrl,
         overseer: AbstractOverseer,
         *args: Any,
         delay_error_on_data_access: bool = False,
         is_testnet: bool = False,
+        max_batch_size: int | None = None,
+        max_in_flight: int = 1,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
+        assert max_batch_size is None or max_batch_size > 0, "max_batch_size has to be positive"
+        assert max_in_flight > 0, "max_in_flight has to be positive"
         self.__url = url
         self.__overseer = overseer
         self._delay_error_on_data_access = delay_error_on_data_access
@@ -148,6 +156,8 @@ class _BatchHandle(ContextSync[EnterReturnT], ContextAsync[EnterReturnT], Generi
         self.__batch: list[_BatchRequestResponseItem] = []
 
         self.__is_testnet: bool = is_testnet
+        self.__max_batch_size = max_batch_size
+        self.__max_in_flight = max_in_flight
 
     def _next_id_for_request(self) -> int:
         """Returns next id for request."""
@@ -163,23 +173,66 @@ class _BatchHandle(ContextSync[EnterReturnT], ContextAsync[EnterReturnT], Generi
         return DummyResponse(result=delayed_result)  # type: ignore[return-value]
 
     def __sync_evaluate(self) -> None:
-        query = self.__prepare_request()
-
-        with _PostRequestManager(self) as mgr:
-            mgr.set_responses(self.__overseer.send(url=self.__url, method="POST", data=query))
+        self.__record_batch_size()
+        queries = self.__prepare_requests()
+
+        if len(queries) == 1:
+            with _PostRequestManager(self) as mgr:
+                mgr.set_responses(self.__overseer.send(url=self.__url, method="POST", data=queries[0]))
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.__max_in_flight, len(queries))) as executor:
+            futures = [
+                executor.submit(self.__overseer.send, url=self.__url, method="POST", data=query) for query in queries
+            ]
+        for future in futures:
+            with _PostRequestManager(self) as mgr:
+                mgr.set_responses(future.result())
 
     async def __async_evaluate(self) -> None:
-        query = self.__prepare_request()
-
-        with _PostRequestManager(self) as mgr:
-            mgr.set_responses(await self.__overseer.async_send(url=self.__url, method="POST", data=query))
-
-    def __prepare_request(self) -> str:
-        return "[" + ",".join([x.request for x in self.__batch]) + "]"
+        self.__record_batch_size()
+        queries = self.__prepare_requests()
+
+        if len(queries) == 1:
+            with _PostRequestManager(self) as mgr:
+                mgr.set_responses(await self.__overseer.async_send(url=self.__url, method="POST", data=queries[0]))
+            return
+
+        in_flight = asyncio.Semaphore(self.__max_in_flight)
+
+        async def send_chunk(query: str) -> exceptions.Json | list[exceptions.Json]:
+            async with in_flight:
+                return await self.__overseer.async_send(url=self.__url, method="POST", data=query)
+
+        results = await asyncio.gather(*[send_chunk(query) for query in queries], return_exceptions=True)
+        for result in results:
+            with _PostRequestManager(self) as mgr:
+                if isinstance(result, BaseException):
+                    raise result
+                mgr.set_responses(result)
+
+    def __prepare_requests(self) -> list[str]:
+        chunk_size = self.__max_batch_size or len(self.__batch)
+        return [
+            "[" + ",".join([x.request for x in self.__batch[i : i + chunk_size]]) + "]"
+            for i in range(0, len(self.__batch), chunk_size)
+        ]
 
     def _get_batch_delayed_result(self, request_id: int) -> _DelayedResponseWrapper:
         return self.__batch[request_id].delayed_result
 
+    def _record_batch_error(self, exception: exceptions.OverseerError) -> None:
+        if self.__overseer.metrics is not None:
+            self.__overseer.metrics.increment(
+                BATCH_ERRORS_TOTAL, labels={"endpoint": endpoint_label(self.__url), "error": type(exception).__name__}
+            )
+
+    def __record_batch_size(self) -> None:
+        if self.__overseer.metrics is not None:
+            self.__overseer.metrics.observe(
+                BATCH_SIZE, len(self.__batch), labels={"endpoint": endpoint_label(self.__url)}
+            )
+
     def __is_anything_to_send(self) -> bool:
         return bool(self.__batch)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import json
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from loguru import logger as loguru_logger
@@ -12,13 +12,17 @@ from beekeepy._apis.abc.api_collection import (
 )
 from beekeepy._apis.abc.sendable import AsyncSendable, SyncSendable
 from beekeepy._communication.communicator_getter import get_communicator_cls
+from beekeepy._communication.metrics import measure_request
+from beekeepy._communication.tracing import NOT_TRACED, RESPONSE_VALIDATION_SPAN, jsonrpc_attributes, trace
 from beekeepy._communication.url import HttpUrl
+from beekeepy._remote_handle.abc.auto_batcher import AutoBatcher
 from beekeepy._remote_handle.settings import RemoteHandleSettings
 from beekeepy._utilities.context import SelfContextAsync, SelfContextSync
+from beekeepy._utilities.json_codec import build_response_model
 from beekeepy._utilities.settings_holder import UniqueSettingsHolder
 from beekeepy._utilities.stopwatch import Stopwatch
 from beekeepy.exceptions import CommunicationError
-from schemas.jsonrpc import ExpectResultT, JSONRPCResult, get_response_model
+from schemas.jsonrpc import ExpectResultT, JSONRPCResult
 
 if TYPE_CHECKING:
     from loguru import Logger
@@ -26,6 +30,7 @@ if TYPE_CHECKING:
     from beekeepy._communication.abc.communicator import AbstractCommunicator
     from beekeepy._communication.abc.communicator_models import AsyncCallbacks, Callbacks, Methods
     from beekeepy._communication.abc.overseer import AbstractOverseer
+    from beekeepy._communication.tracing import Span
     from beekeepy._remote_handle.abc.batch_handle import AsyncBatchHandle, SyncBatchHandle
     from beekeepy.exceptions import Json
 
@@ -129,10 +134,37 @@ class AbstractHandle(UniqueSettingsHolder[RemoteSettingsT], ABC, Generic[RemoteS
             assert isinstance(response, dict), f"Expected dict as response, got: {response=}"
         else:
             response = {"result": response, "jsonrpc": "2.0", "id": 0}
-        serialized_data = get_response_model(expected_type, json.dumps(response), serialization_type)
+        serialized_data = build_response_model(expected_type, response, serialization_type)
         assert isinstance(serialized_data, JSONRPCResult)
         return serialized_data
 
+    def _validate_response(
+        self,
+        response: Json | list[Json],
+        expected_type: type[ExpectResultT],
+        serialization_type: Literal["hf26", "legacy"],
+        *,
+        is_jsonrpc: bool,
+    ) -> JSONRPCResult[ExpectResultT]:
+        """Same as `_response_handle`, but traced if tracer is set."""
+        with self.__trace_validation(response, expected_type, serialization_type):
+            return self._response_handle(
+                response=response,
+                expected_type=expected_type,
+                serialization_type=serialization_type,
+                is_jsonrpc=is_jsonrpc,
+            )
+
+    def __trace_validation(
+        self, response: Json | list[Json], expected_type: type[Any], serialization_type: str
+    ) -> AbstractContextManager[Span | None]:
+        if (tracer := self._settings.tracer) is None:
+            return NOT_TRACED
+        attributes = jsonrpc_attributes(response)
+        attributes["beekeepy.expected_type"] = getattr(expected_type, "__name__", str(expected_type))
+        attributes["beekeepy.serialization_type"] = serialization_type
+        return trace(tracer, RESPONSE_VALIDATION_SPAN, attributes)
+
     def __configure_logger(self, logger: Logger | None) -> Logger:
         # credit for lazy=True: https://github.com/Delgan/loguru/issues/402#issuecomment-2028011786
         return (logger or loguru_logger).opt(lazy=True).bind(**self._logger_extras())
@@ -147,20 +179,26 @@ class AbstractHandle(UniqueSettingsHolder[RemoteSettingsT], ABC, Generic[RemoteS
         self.logger.trace(
             "sending to `{}` data: `{}`",
             url.as_string,
-            lambda: self._sanitize_data(request or ""),  # to reduce deepcopy
+            lambda: self._sanitize_data(request or ""),  # sanitized only if any sink formats the message
         )
 
     def _log_response(self, seconds_delta: float, response: Json | list[Json]) -> None:
         self.logger.trace(
-            f"got response in {seconds_delta :.5f}s from " + "`{}`: `{}`",
+            "got response in {:.5f}s from `{}`: `{}`",
+            lambda: seconds_delta,
             self.http_endpoint.as_string,
-            lambda: self._sanitize_data(response),  # to reduce deepcopy
+            lambda: self._sanitize_data(response),  # sanitized only if any sink formats the message
         )
 
     def is_testnet(self) -> bool:
         """Returns if handle is connected to testnet."""
         return False
 
+    def _measure_request(self, url: HttpUrl, data: str | None, method: Methods) -> AbstractContextManager[None]:
+        if (metrics := self._overseer.metrics) is None:
+            return nullcontext()
+        return measure_request(metrics, url=url, data=data, method=method)
+
     def _merge_url(self, query_url: HttpUrl | None) -> HttpUrl:
         """Merges given url with path."""
         return HttpUrl.factory(
@@ -182,6 +220,16 @@ class AbstractHandle(UniqueSettingsHolder[RemoteSettingsT], ABC, Generic[RemoteS
 class AbstractAsyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextAsync, AsyncSendable, ABC):
     """Base class for service handlers that uses asynchronous communication."""
 
+    def __init__(
+        self,
+        *args: Any,
+        settings: RemoteSettingsT,
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.__auto_batcher_instance: AutoBatcher | None = None
+        super().__init__(*args, settings=settings, logger=logger, **kwargs)
+
     async def _async_send(  # noqa: PLR0913
         self,
         *,
@@ -193,11 +241,37 @@ class AbstractAsyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextAsyn
         callbacks: AsyncCallbacks | None = None,
     ) -> JSONRPCResult[ExpectResultT]:
         """Sends data asynchronously to handled service basing on jsonrpc."""
+        if data is not None and self.__should_auto_batch(data=data, url=url, callbacks=callbacks):
+            return await self.__auto_batcher.send(
+                data=data, expected_type=expected_type, serialization_type=serialization_type
+            )
+
+        response = await self._async_send_raw(method=method, data=data, url=url, callbacks=callbacks)
+        return self._validate_response(
+            response=response,
+            expected_type=expected_type,
+            serialization_type=serialization_type,
+            is_jsonrpc=self._is_jsonrpc(data),
+        )
+
+    async def _async_send_raw(
+        self,
+        *,
+        method: Methods = "POST",
+        data: str | None = None,
+        url: HttpUrl | None = None,
+        callbacks: AsyncCallbacks | None = None,
+    ) -> Json | list[Json]:
+        """Sends data asynchronously to handled service and returns parsed, but not validated response."""
         from beekeepy._utilities.error_logger import ErrorLogger
 
         final_url = self._merge_url(url)
         self._log_request(final_url, data)
-        with Stopwatch() as record, ErrorLogger(self.logger, CommunicationError):
+        with (
+            Stopwatch() as record,
+            ErrorLogger(self.logger, CommunicationError),
+            self._measure_request(final_url, data, method),
+        ):
             response = await self._overseer.async_send(
                 url=final_url,
                 method=method,
@@ -205,13 +279,23 @@ class AbstractAsyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextAsyn
                 callbacks=callbacks,
             )
         self._log_response(record.seconds_delta, response)
-        return self._response_handle(
-            response=response,
-            expected_type=expected_type,
-            serialization_type=serialization_type,
-            is_jsonrpc=self._is_jsonrpc(data),
+        return response
+
+    def __should_auto_batch(self, *, data: str, url: HttpUrl | None, callbacks: AsyncCallbacks | None) -> bool:
+        return (
+            self._settings.auto_batch_window is not None
+            and url is None
+            and callbacks is None
+            and data.startswith("{")
+            and self._is_jsonrpc(data)
         )
 
+    @property
+    def __auto_batcher(self) -> AutoBatcher:
+        if self.__auto_batcher_instance is None:
+            self.__auto_batcher_instance = AutoBatcher(owner=self)
+        return self.__auto_batcher_instance
+
     def _is_synchronous(self) -> bool:
         return False
 
@@ -222,6 +306,11 @@ class AbstractAsyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextAsyn
     async def batch(self, *, delay_error_on_data_access: bool = False) -> AsyncBatchHandle[Any]:
         """Returns async batch handle."""
 
+    def teardown(self) -> None:
+        if self.__auto_batcher_instance is not None:
+            self.__auto_batcher_instance.teardown()
+        super().teardown()
+
     async def _afinally(self) -> None:
         self.teardown()
 
@@ -244,7 +333,11 @@ class AbstractSyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextSync,
 
         final_url = self._merge_url(url)
         self._log_request(final_url, data)
-        with Stopwatch() as record, ErrorLogger(self.logger, CommunicationError):
+        with (
+            Stopwatch() as record,
+            ErrorLogger(self.logger, CommunicationError),
+            self._measure_request(final_url, data, method),
+        ):
             response = self._overseer.send(
                 url=final_url,
                 method=method,
@@ -252,7 +345,7 @@ class AbstractSyncHandle(AbstractHandle[RemoteSettingsT, ApiT], SelfContextSync,
                 callbacks=callbacks,
             )
         self._log_response(record.seconds_delta, response)
-        return self._response_handle(
+        return self._validate_response(
             response=response,
             expected_type=expected_type,
             serialization_type=serialization_type,
@@ -70,14 +70,19 @@ class AsyncBeekeeper(AbstractAsyncHandle[RemoteSettingsT, BeekeeperAsyncApiColle
     def _target_service(self) -> str:
         return handle_target_service_name
 
-    async def batch(self, *, delay_error_on_data_access: bool = False) -> AsyncBatchHandle[BeekeeperAsyncApiCollection]:
+    async def batch(
+        self, *, delay_error_on_data_access: bool = False, session_token: str | None = None
+    ) -> AsyncBatchHandle[BeekeeperAsyncApiCollection]:
+        """Returns batch handle, calls are sent with `session_token` if given, otherwise with token of this handle."""
         return _AsyncSessionBatchHandle(
             url=self.http_endpoint,
             overseer=self._overseer,
             api=lambda o: BeekeeperAsyncApiCollection(owner=o),
             delay_error_on_data_access=delay_error_on_data_access,
-            session_token=(await self.session).token,
+            session_token=session_token or (await self.session).token,
             is_testnet=self.is_testnet(),
+            max_batch_size=self._settings.batch_max_size,
+            max_in_flight=self._settings.batch_max_in_flight,
         )
 
     async def _acquire_session_token(self) -> str:
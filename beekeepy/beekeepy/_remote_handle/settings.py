@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta  # noqa: TCH003
 from typing import TYPE_CHECKING, ClassVar
 
 from beekeepy._communication.abc.overseer import AbstractOverseer
@@ -10,12 +11,17 @@ if TYPE_CHECKING:
     from beekeepy._communication.abc.communicator import (
         AbstractCommunicator,
     )
+    from beekeepy._communication.circuit_breaker import CircuitBreaker
+    from beekeepy._communication.load_balancer import LoadBalancer
+    from beekeepy._communication.metrics import MetricsSink
     from beekeepy._communication.url import HttpUrl
 
 
 class RemoteHandleSettings(CommunicationSettings):
     class Defaults(CommunicationSettings.Defaults):
         OVERSEER: ClassVar[type[AbstractOverseer]] = CommonOverseer
+        AUTO_BATCH_MAX_SIZE: ClassVar[int] = 100
+        BATCH_MAX_IN_FLIGHT: ClassVar[int] = 4
 
     http_endpoint: HttpUrl | None = None
     """
@@ -35,6 +41,49 @@ class RemoteHandleSettings(CommunicationSettings):
     during communication
     """
 
+    circuit_breaker: CircuitBreaker | None = None
+    """
+    If set, requests to endpoint considered unavailable fail immediately with CircuitOpenError.
+
+    Note: Instance is not copied together with settings, pass the same one to many handles to share endpoint state.
+    Used only if overseer is given as class.
+    """
+
+    load_balancer: LoadBalancer | None = None
+    """
+    If set, requests are distributed between endpoints of load balancer, sessions stay on endpoint they were created on.
+
+    Note: http_endpoint is still required, but only path and query are taken from it.
+    Instance is not copied together with settings. Used only if overseer is given as class.
+    """
+
+    metrics: MetricsSink | None = None
+    """
+    If set, handles, overseer and batches emit request durations, retries and batch errors to it.
+
+    Note: Instance is not copied together with settings. Used only if overseer is given as class.
+    """
+
+    auto_batch_window: timedelta | None = None
+    """
+    If set, asynchronous handles gather jsonrpc calls issued within given window and send them as single batch request.
+
+    Note: Disabled by default, calls with custom url or callbacks are never batched.
+    """
+
+    auto_batch_max_size: int = Defaults.AUTO_BATCH_MAX_SIZE
+    """Maximum amount of calls gathered by automatic batching, when reached batch is sent without waiting for window."""
+
+    batch_max_size: int | None = None
+    """If set, requests gathered by batch handles are split into chunks of at most given size."""
+
+    batch_max_in_flight: int = Defaults.BATCH_MAX_IN_FLIGHT
+    """Maximum amount of batch chunks sent simultaneously, has effect only if batch_max_size is set."""
+
+    @classmethod
+    def _runtime_only_fields(cls) -> set[str]:
+        return super()._runtime_only_fields() | {"circuit_breaker", "load_balancer", "metrics"}
+
     def try_get_communicator_instance(
         self, settings: CommunicationSettings | None = None
     ) -> AbstractCommunicator | None:
@@ -73,4 +122,9 @@ class RemoteHandleSettings(CommunicationSettings):
         """
         if isinstance(self.overseer, AbstractOverseer):
             return self.overseer
-        return self.overseer(communicator=communicator)
+        return self.overseer(
+            communicator=communicator,
+            circuit_breaker=self.circuit_breaker,
+            load_balancer=self.load_balancer,
+            metrics=self.metrics,
+        )
@@ -70,14 +70,19 @@ class Beekeeper(AbstractSyncHandle[RemoteSettingsT, BeekeeperSyncApiCollection],
     def _target_service(self) -> str:
         return handle_target_service_name
 
-    def batch(self, *, delay_error_on_data_access: bool = False) -> SyncBatchHandle[BeekeeperSyncApiCollection]:
+    def batch(
+        self, *, delay_error_on_data_access: bool = False, session_token: str | None = None
+    ) -> SyncBatchHandle[BeekeeperSyncApiCollection]:
+        """Returns batch handle, calls are sent with `session_token` if given, otherwise with token of this handle."""
         return _SyncSessionBatchHandle(
             url=self.http_endpoint,
             overseer=self._overseer,
             api=lambda o: BeekeeperSyncApiCollection(owner=o),
             delay_error_on_data_access=delay_error_on_data_access,
-            session_token=self.session.token,
+            session_token=session_token or self.session.token,
             is_testnet=self.is_testnet(),
+            max_batch_size=self._settings.batch_max_size,
+            max_in_flight=self._settings.batch_max_in_flight,
         )
 
     def _acquire_session_token(self) -> str:
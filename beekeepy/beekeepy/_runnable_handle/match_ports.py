@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-import socket
+import asyncio
+import contextlib
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeVar
 
 from beekeepy._communication.url import HttpUrl, P2PUrl, WsUrl
 
-__all__ = ["PortMatchingResult", "match_ports"]
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+__all__ = ["PortMatchingResult", "async_match_ports", "match_ports"]
+
+T = TypeVar("T")
 
 # https://http.cat/status/426
 WEBSERVER_SPECIFIC_RESPONSE: Final[bytes] = b"426 Upgrade Required"
 
+PROBE_TIMEOUT_SECONDS: Final[float] = 1.0
+HTTP_PROBE_REQUEST: Final[bytes] = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+PortKind = Literal["http", "https", "websocket", "p2p"]
+
 
 @dataclass
 class PortMatchingResult:
@@ -24,55 +36,97 @@ class PortMatchingResult:
         return self.http is not None
 
 
-def verify_is_http_endpoint(address: HttpUrl) -> bool:
-    assert address.port is not None, "HTTP CHECK: Port has to be set"
+async def _send_probe(port: int, *, address: str, tls: bool) -> bytes | None:
+    """Sends plain GET request to port and returns beginning of response, None if nothing could be read."""
+    context = ssl.create_default_context() if tls else None
+    writer: asyncio.StreamWriter | None = None
+    try:
+        async with asyncio.timeout(PROBE_TIMEOUT_SECONDS):
+            reader, writer = await asyncio.open_connection(
+                address, port, ssl=context, server_hostname="localhost" if tls else None
+            )
+            writer.write(HTTP_PROBE_REQUEST)
+            await writer.drain()
+            return await reader.read(1024)
+    except (OSError, TimeoutError, ssl.SSLError):
+        return None
+    finally:
+        if writer is not None:
+            writer.close()
+            with contextlib.suppress(OSError, TimeoutError, ssl.SSLError):
+                await asyncio.wait_for(writer.wait_closed(), PROBE_TIMEOUT_SECONDS)
+
+
+async def async_classify_port(port: int, *, address: str = "127.0.0.1") -> PortKind:
+    """Classifies port using single plain connection, TLS connection is opened only if plain one gets no HTTP response.
+
+    Webservers answer `426 Upgrade Required` on plain request sent to websocket-only endpoint,
+    so such port is classified as websocket without sending separate upgrade request.
+    """
+    response = await _send_probe(port, address=address, tls=False)
+    if response is not None and response.startswith(b"HTTP"):
+        return "websocket" if WEBSERVER_SPECIFIC_RESPONSE in response else "http"
+
+    response = await _send_probe(port, address=address, tls=True)
+    if response is not None and response.startswith(b"HTTP") and WEBSERVER_SPECIFIC_RESPONSE not in response:
+        return "https"
+    return "p2p"
+
+
+async def async_match_ports(
+    ports: list[int], *, address: str = "127.0.0.1", stop_at_http: bool = False
+) -> PortMatchingResult:
+    """Probes all ports concurrently.
+
+    If more than one port matches category, first one from given list is chosen.
+
+    Args:
+        ports: ports to classify.
+        address: address on which ports are reserved.
+        stop_at_http: if set, result is returned as soon as any http endpoint is found and remaining probes
+            are cancelled, so other categories contain only ports classified until then.
+    """
+    pending = {asyncio.create_task(async_classify_port(port, address=address)): port for port in ports}
+    kinds: dict[int, PortKind] = {}
     try:
-        with socket.create_connection((address.address, address.port), timeout=1) as sock:
-            sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-            response = sock.recv(1024)
-            return response.startswith(b"HTTP") and WEBSERVER_SPECIFIC_RESPONSE not in response
-    except (OSError, socket.timeout, ConnectionRefusedError):
-        return False
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                kinds[pending.pop(task)] = task.result()
+            if stop_at_http and "http" in kinds.values():
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+    return _categorize(ports, kinds, address=address)
 
 
-def verify_is_https_endpoint(address: HttpUrl) -> bool:
-    assert address.port is not None, "HTTPS CHECK: Port has to be set"
-    try:
-        context = ssl.create_default_context()
-        with socket.create_connection((address.address, address.port), timeout=1) as sock, context.wrap_socket(
-            sock, server_hostname="localhost"
-        ) as ssl_sock:
-            ssl_sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-            response = ssl_sock.recv(1024)
-            return response.startswith(b"HTTP") and WEBSERVER_SPECIFIC_RESPONSE not in response
-    except (OSError, socket.timeout, ConnectionRefusedError, ssl.SSLError):
-        return False
-
-
-def verify_is_websocket_endpoint(address: WsUrl) -> bool:
-    assert address.port is not None, "WS CHECK: Port has to be set"
-    try:
-        with socket.create_connection((address.address, address.port), timeout=1) as sock:
-            sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n\r\n")
-            response = sock.recv(1024)
-            return WEBSERVER_SPECIFIC_RESPONSE in response
-    except (OSError, socket.timeout, ConnectionRefusedError):
-        return False
+def match_ports(ports: list[int], *, address: str = "127.0.0.1", stop_at_http: bool = False) -> PortMatchingResult:
+    """Synchronous version of `async_match_ports`, can be called also when event loop is running in current thread."""
+    return _run(async_match_ports(ports, address=address, stop_at_http=stop_at_http))
 
 
-def match_ports(ports: list[int], *, address: str = "127.0.0.1") -> PortMatchingResult:
+def _categorize(ports: list[int], kinds: dict[int, PortKind], *, address: str) -> PortMatchingResult:
     categories = PortMatchingResult()
     for port in ports:
-        http_result = HttpUrl.factory(port=port, address=address)
-        if categories.http is None and verify_is_http_endpoint(http_result):
-            categories.http = http_result
-        elif categories.https is None and verify_is_https_endpoint(http_result):
-            categories.https = http_result
-        elif categories.websocket is None and verify_is_websocket_endpoint(
-            ws_result := WsUrl.factory(port=port, address=address)
-        ):
-            categories.websocket = ws_result
+        kind = kinds.get(port)
+        if kind is None:
+            continue
+        if kind == "http" and categories.http is None:
+            categories.http = HttpUrl.factory(port=port, address=address)
+        elif kind == "https" and categories.https is None:
+            categories.https = HttpUrl.factory(port=port, address=address)
+        elif kind == "websocket" and categories.websocket is None:
+            categories.websocket = WsUrl.factory(port=port, address=address)
         else:
             categories.p2p.append(P2PUrl.factory(port=port, address=address))
-
     return categories
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
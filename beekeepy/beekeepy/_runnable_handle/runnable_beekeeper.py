@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, TypeVar
 
+from beekeepy._communication.url import HttpUrl
 from beekeepy._executable.beekeeper_arguments import BeekeeperArguments
 from beekeepy._executable.beekeeper_config import BeekeeperConfig
 from beekeepy._executable.beekeeper_executable import BeekeeperExecutable
@@ -12,7 +13,6 @@ from beekeepy.exceptions import BeekeeperFailedToStartError, ExecutableError
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from beekeepy._communication.url import HttpUrl
     from beekeepy._runnable_handle.match_ports import PortMatchingResult
     from beekeepy._utilities.key_pair import KeyPair
 
@@ -47,6 +47,12 @@ class RunnableBeekeeper(
     def _unify_config(self, working_directory: Path, http_endpoint: HttpUrl) -> None:  # noqa: ARG002
         self.config.webserver_http_endpoint = http_endpoint
 
+    def _unify_unix_socket(self, working_directory: Path, unix_socket_path: Path) -> None:
+        self.arguments.data_dir = working_directory
+        self.arguments.webserver_http_endpoint = None
+        self.config.webserver_http_endpoint = None
+        self.config.webserver_unix_endpoint = unix_socket_path
+
     def run(self, additional_cli_arguments: BeekeeperArguments | None = None) -> None:
         with self._exec.restore_arguments(additional_cli_arguments):
             try:
@@ -59,6 +65,11 @@ class RunnableBeekeeper(
         self.config.webserver_http_endpoint = ports.http
         self.config.webserver_ws_endpoint = ports.websocket
 
+    def _write_unix_socket(self, editable_settings: RunnableHandleSettings, unix_socket_path: Path) -> None:
+        editable_settings.http_endpoint = HttpUrl("http://localhost")
+        editable_settings.unix_socket_path = unix_socket_path
+        self.config.webserver_unix_endpoint = unix_socket_path
+
     def _close(self) -> None:
         self._close_application()
 
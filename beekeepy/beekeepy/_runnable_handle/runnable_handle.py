@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import socket
 import time
 import warnings
 from abc import ABC, abstractmethod
@@ -105,11 +106,15 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
         settings = self._get_settings().copy()
 
         settings.working_directory = self.__choose_working_directory(settings=settings)
+        unix_socket_path = self.__choose_unix_socket_path(settings=settings)
         settings.http_endpoint = self.__choose_http_endpoint(settings=settings)
 
         if perform_unification:
-            self._unify_cli_arguments(settings.working_directory, settings.http_endpoint)
-            self._unify_config(settings.working_directory, settings.http_endpoint)
+            if unix_socket_path is not None:
+                self._unify_unix_socket(settings.working_directory, unix_socket_path)
+            else:
+                self._unify_cli_arguments(settings.working_directory, settings.http_endpoint)
+                self._unify_config(settings.working_directory, settings.http_endpoint)
 
         timeout = timeout or settings.initialization_timeout.total_seconds()
 
@@ -127,6 +132,15 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
             except SubprocessError as e:
                 raise FailedToStartExecutableError(f"{timeout= :.4f}, wait time={sw.lap:.4f}") from e
             sw.reset()
+            if unix_socket_path is not None:
+                try:
+                    self._wait_for_unix_socket(unix_socket_path)
+                except TimeoutError as e:
+                    raise FailedToStartExecutableError(
+                        f"timeout={settings.initialization_timeout.total_seconds():.4f}, wait time={sw.lap:.4f}"
+                    ) from e
+                self._setup_unix_socket(unix_socket_path)
+                return
             try:
                 ports = self._wait_for_app_to_start()
             except TimeoutError as e:
@@ -179,6 +193,28 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
             http_endpoint -- chosen http endpoint to be set in config.
         """
 
+    def _unify_unix_socket(self, working_directory: Path, unix_socket_path: Path) -> None:  # noqa: ARG002
+        """
+        Writes selected values to cli arguments and config, so executable listens only on unix domain socket.
+
+        Called only if `unix_socket_path` is set, by default such transport is rejected.
+
+        Args:
+            working_directory -- chosen working path to be set in cli arguments.
+            unix_socket_path -- absolute path of socket on which executable should listen on.
+        """
+        raise FailedToStartExecutableError(
+            f"{type(self).__name__} does not support unix domain socket transport, requested: {unix_socket_path}"
+        )
+
+    def _setup_unix_socket(self, unix_socket_path: Path) -> None:
+        """
+        Setup unix domain socket after startup.
+
+        Args:
+            unix_socket_path -- path of socket on which application is listening on.
+        """
+
     def _setup_ports(self, ports: PortMatchingResult) -> None:
         """
         Setup ports after startup.
@@ -201,7 +237,7 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
             ):
                 if not self._exec.is_running():
                     raise FailedToStartExecutableError
-                time.sleep(0.1)
+                time.sleep(0.01)
 
         if discovered_ports is not None and bool(discovered_ports):
             self._logger.debug(f"Discovery of ports took {stopwatch.seconds_delta :2f} seconds")
@@ -209,6 +245,36 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
             return discovered_ports
         raise TimeoutError(f"Timeout after {stopwatch.seconds_delta :2f} waiting for application to start")
 
+    def _wait_for_unix_socket(self, unix_socket_path: Path) -> None:
+        """Waits for application to start accepting connections on unix domain socket."""
+        with Stopwatch() as stopwatch:
+            while stopwatch.lap <= self._get_settings().initialization_timeout.total_seconds():
+                if not self._exec.is_running():
+                    raise FailedToStartExecutableError
+                if self.__is_unix_socket_accepting_connections(unix_socket_path):
+                    self._logger.debug(f"Waiting for unix socket took {stopwatch.lap :2f} seconds")
+                    return
+                time.sleep(0.01)
+        raise TimeoutError(f"Timeout after {stopwatch.seconds_delta :2f} waiting for application to start")
+
+    @classmethod
+    def __is_unix_socket_accepting_connections(cls, unix_socket_path: Path) -> bool:
+        if not unix_socket_path.is_socket():
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(unix_socket_path.as_posix())
+            except OSError:
+                return False
+        return True
+
+    def __choose_unix_socket_path(self, settings: SettingsT) -> Path | None:
+        if settings.unix_socket_path is None:
+            return None
+        if settings.unix_socket_path.is_absolute():
+            return settings.unix_socket_path
+        return settings.ensured_working_directory / settings.unix_socket_path
+
     def __choose_working_directory(self, settings: SettingsT) -> Path:
         return self.__choose_value(
             default_value=Path.cwd(),
@@ -247,7 +313,7 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
 
     def __discover_ports(self) -> PortMatchingResult:
         reserved_ports = self._exec.reserved_ports()
-        matched_ports = match_ports(reserved_ports)
+        matched_ports = match_ports(reserved_ports, stop_at_http=True)
         self._logger.debug(f"Potentially matched ports: {matched_ports}")
         if matched_ports.http is None:
             warnings.warn("Given executable probably does not provide http network access", stacklevel=3)
@@ -269,7 +335,7 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
             self._logger.warning(
                 "HTTP port detected, but cannot obtain further information. app_status_api plugin is not enabled!"
             )
-            return matched_ports
+            return match_ports(reserved_ports)
         except CommunicationError as e:
             raise FailedToStartExecutableError("Cannot communicate with application on detected HTTP port") from e
 
@@ -281,7 +347,7 @@ class RunnableHandle(ABC, Generic[ExecutableT, ConfigT, ArgumentT, SettingsT]):
         ), "Http cannot differ from detected ports, because it is already connected"
 
         ws = status.webservers.WS
-        if ws and matched_ports.websocket and ws.port != matched_ports.websocket.port:
+        if ws and (matched_ports.websocket is None or ws.port != matched_ports.websocket.port):
             matched_ports.websocket = WsUrl.factory(port=ws.port)
 
         p2p = status.webservers.P2P
@@ -6,6 +6,8 @@ from beekeepy._remote_handle.sync_beekeeper import Beekeeper as RemoteBeekeeperT
 from beekeepy._runnable_handle.runnable_beekeeper import RunnableBeekeeper, RunnableSettingsT
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from beekeepy._runnable_handle.match_ports import PortMatchingResult
     from beekeepy._runnable_handle.settings import RunnableHandleSettings
 
@@ -27,5 +29,9 @@ class Beekeeper(RunnableBeekeeper, RemoteBeekeeperTemplate[RunnableSettingsT]):
         with self.update_settings() as settings:
             self._write_ports(settings, ports)
 
+    def _setup_unix_socket(self, unix_socket_path: Path) -> None:
+        with self.update_settings() as settings:
+            self._write_unix_socket(settings, unix_socket_path)
+
 
 BeekeeperTemplate = Beekeeper
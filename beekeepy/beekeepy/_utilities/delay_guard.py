@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import time
-from datetime import datetime, timedelta, timezone
+from contextlib import suppress
+from contextvars import ContextVar
+from datetime import timedelta
+from threading import Condition
 from typing import TYPE_CHECKING, Final
+from weakref import WeakKeyDictionary
 
 from beekeepy._utilities.context import ContextAsync, ContextSync
 from beekeepy.exceptions import UnlockIsNotAccessibleError
@@ -12,53 +16,94 @@ if TYPE_CHECKING:
     from types import TracebackType
 
 
+_EXCEPTION_OCCURED: Final[ContextVar[WeakKeyDictionary[DelayGuardBase, bool]]] = ContextVar(
+    "delay_guard_exception_occured",
+    default=WeakKeyDictionary(),
+)
+"""Outcome of last call of each guard, shared by all guards, as context variables are never garbage collected.
+
+Mapping is replaced (never modified in place) on every change, so threads and tasks do not see outcomes of each other.
+"""
+
+
 class DelayGuardBase:
+    """Serializes calls which beekeeper may reject with `UnlockIsNotAccessibleError` and delays retries.
+
+    Only one caller at a time is inside of guard. After any error all waiting callers are held until
+    `BEEKEEPER_DELAY_TIME` passes (measured with monotonic clock), then they are woken up at once and let in one by one.
+    Result of `error_occured` is tracked separately for each thread and task, so it reports outcome of own call.
+    """
+
     BEEKEEPER_DELAY_TIME: Final[timedelta] = timedelta(seconds=0.6)
 
     def __init__(self) -> None:
-        self._wait_time: Final[float] = 0.1
-        self._next_time_unlock: datetime | None = None
-        self._exception_occured = False
+        self._next_time_unlock: float | None = None
+        """Monotonic time before which guard does not let anyone in."""
+        self._busy = False
+
+    def _remaining_delay(self) -> float:
+        if self._next_time_unlock is None:
+            return 0.0
+        return max(0.0, self._next_time_unlock - time.monotonic())
 
     def _waiting_should_continue(self) -> bool:
-        return self._next_time_unlock is not None and self.__now() < self._next_time_unlock
+        return self._busy or self._remaining_delay() > 0.0
 
     def _handle_exception_impl(self, ex: BaseException, _: TracebackType | None) -> bool:
-        self._exception_occured = isinstance(ex, UnlockIsNotAccessibleError)
-        self._next_time_unlock = self.__now() + self.BEEKEEPER_DELAY_TIME
-        return self._exception_occured  # suppress to retry after delay
+        exception_occured = isinstance(ex, UnlockIsNotAccessibleError)
+        self.__set_exception_occured(value=exception_occured)
+        self._next_time_unlock = time.monotonic() + self.BEEKEEPER_DELAY_TIME.total_seconds()
+        return exception_occured  # suppress to retry after delay
 
     def _handle_no_exception_impl(self) -> None:
-        self._exception_occured = False
+        self.__set_exception_occured(value=False)
         self._next_time_unlock = None
 
     def error_occured(self) -> bool:
-        return self._exception_occured
+        return _EXCEPTION_OCCURED.get().get(self, False)
 
-    def __now(self) -> datetime:
-        return datetime.now(timezone.utc)
+    def __set_exception_occured(self, *, value: bool) -> None:
+        exception_occured = WeakKeyDictionary(_EXCEPTION_OCCURED.get())
+        exception_occured[self] = value
+        _EXCEPTION_OCCURED.set(exception_occured)
 
 
 class SyncDelayGuard(DelayGuardBase, ContextSync["SyncDelayGuard"]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__condition = Condition()
+
     def _enter(self) -> SyncDelayGuard:
-        while self._waiting_should_continue():
-            time.sleep(self._wait_time)
+        with self.__condition:
+            while self._waiting_should_continue():
+                self.__condition.wait(timeout=self._remaining_delay() or None)
+            self._busy = True
         return self
 
     def _handle_exception(self, ex: BaseException, tb: TracebackType | None) -> bool:
-        return self._handle_exception_impl(ex, tb)
+        with self.__condition:
+            return self._handle_exception_impl(ex, tb)
 
     def _handle_no_exception(self) -> None:
-        return self._handle_no_exception_impl()
+        with self.__condition:
+            self._handle_no_exception_impl()
 
     def _finally(self) -> None:
-        return None
+        with self.__condition:
+            self._busy = False
+            self.__condition.notify_all()
 
 
 class AsyncDelayGuard(DelayGuardBase, ContextAsync["AsyncDelayGuard"]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__condition = asyncio.Condition()
+
     async def _aenter(self) -> AsyncDelayGuard:
-        while self._waiting_should_continue():  # noqa: ASYNC110
-            await asyncio.sleep(self._wait_time)
+        async with self.__condition:
+            while self._waiting_should_continue():
+                await self.__wait(timeout=self._remaining_delay() or None)
+            self._busy = True
         return self
 
     async def _ahandle_exception(self, ex: BaseException, tb: TracebackType | None) -> bool:
@@ -68,4 +113,10 @@ class AsyncDelayGuard(DelayGuardBase, ContextAsync["AsyncDelayGuard"]):
         return self._handle_no_exception_impl()
 
     async def _afinally(self) -> None:
-        return None
+        async with self.__condition:
+            self._busy = False
+            self.__condition.notify_all()
+
+    async def __wait(self, *, timeout: float | None) -> None:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self.__condition.wait(), timeout=timeout)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from threading import Event, Lock, Thread, get_ident
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from concurrent.futures import Future
+
+__all__ = ["EventLoopThread"]
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """Owns asyncio event loop running in dedicated daemon thread.
+
+    Allows to submit coroutines from synchronous code (and from other event loops) without creating
+    new thread and event loop for every call. Loop is started lazily, on first submission.
+    """
+
+    def __init__(self, *, name: str = "beekeepy-event-loop") -> None:
+        self.__name = name
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__thread: Thread | None = None
+        self.__lock = Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Returns owned event loop, starts it if it is not running yet."""
+        with self.__lock:
+            if self.__loop is None:
+                self.__loop, self.__thread = self.__start()
+            return self.__loop
+
+    def is_running(self) -> bool:
+        return self.__loop is not None
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedules coroutine in owned event loop and returns future of its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs coroutine in owned event loop and blocks until it is finished."""
+        if self.__is_called_from_loop_thread():
+            coro.close()
+            raise RuntimeError("Cannot block on coroutine from the inside of event loop thread, it would deadlock")
+        return self.submit(coro).result()
+
+    async def async_run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs coroutine in owned event loop and awaits its result from the current event loop."""
+        if self.__is_called_from_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def close(self) -> None:
+        """Stops event loop and joins its thread. Can be safely called multiple times."""
+        with self.__lock:
+            loop, thread = self.__loop, self.__thread
+            self.__loop, self.__thread = None, None
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    def __is_called_from_loop_thread(self) -> bool:
+        thread = self.__thread
+        return thread is not None and thread.ident == get_ident()
+
+    def __start(self) -> tuple[asyncio.AbstractEventLoop, Thread]:
+        loop = asyncio.new_event_loop()
+        started = Event()
+
+        def worker() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            try:
+                loop.run_forever()
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+        thread = Thread(target=worker, name=self.__name, daemon=True)
+        thread.start()
+        started.wait()
+        return loop, thread
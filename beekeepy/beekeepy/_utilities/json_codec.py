@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Final, Literal, cast
+
+import msgspec
+
+from schemas.decoders import dec_hook_hf26, dec_hook_legacy
+from schemas.jsonrpc import ExpectResultT, JSONRPCError, JSONRPCResult, acquire_model
+
+if TYPE_CHECKING:
+    from beekeepy.exceptions import Json
+
+__all__ = ["JSON_DECODE_ERRORS", "json_loads", "build_response_model"]
+
+JSON_DECODE_ERRORS: Final[tuple[type[Exception], ...]] = (json.JSONDecodeError, msgspec.DecodeError)
+"""Exceptions which can be raised by any of supported json decoders."""
+
+_DEC_HOOKS: Final = {"hf26": dec_hook_hf26, "legacy": dec_hook_legacy}
+
+
+def json_loads(data: str | bytes) -> Json | list[Json]:
+    """Decodes json text to builtins, behaves like `json.loads`, but is backed by msgspec."""
+    return msgspec.json.decode(data)  # type: ignore[no-any-return]
+
+
+def build_response_model(
+    expected_type: type[ExpectResultT], response: Json, serialization_type: Literal["hf26", "legacy"]
+) -> JSONRPCResult[ExpectResultT] | JSONRPCError:
+    """
+    Validates already decoded response directly into model.
+
+    Equivalent of `schemas.jsonrpc.get_response_model`, but without serializing response back to json text.
+    """
+    response_cls: type[JSONRPCResult[ExpectResultT] | JSONRPCError] = (
+        acquire_model(expected_type) if "result" in response else JSONRPCError
+    )
+    return cast(
+        JSONRPCResult[ExpectResultT] | JSONRPCError,
+        msgspec.convert(response, type=response_cls, dec_hook=_DEC_HOOKS[serialization_type]),
+    )
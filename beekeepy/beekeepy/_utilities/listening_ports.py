@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Final
+
+import psutil
+
+__all__ = ["listening_ports"]
+
+_TCP_LISTEN_STATE: Final[str] = "0A"
+_SOCKET_LINK_PREFIX: Final[str] = "socket:["
+
+
+def listening_ports(pid: int) -> list[int]:
+    """Returns ports on which process with given pid listens for IPv4 TCP connections.
+
+    On Linux only sockets owned by given process are read from /proc, without scanning all connections in system.
+    On other platforms psutil is asked about connections of given process only.
+    """
+    proc_dir = Path("/proc") / str(pid)
+    if proc_dir.is_dir():
+        return _listening_ports_from_proc(proc_dir)
+    return [
+        connection.laddr[1]
+        for connection in psutil.Process(pid).net_connections("tcp4")
+        if connection.status == psutil.CONN_LISTEN
+    ]
+
+
+def _listening_ports_from_proc(proc_dir: Path) -> list[int]:
+    inodes = _socket_inodes(proc_dir)
+    if not inodes:
+        return []
+
+    ports: list[int] = []
+    with (proc_dir / "net" / "tcp").open() as tcp_table:
+        next(tcp_table, None)  # header
+        for line in tcp_table:
+            # sl local_address rem_address st tx_queue:rx_queue tr:tm->when retrnsmt uid timeout inode ...
+            columns = line.split()
+            if columns[3] == _TCP_LISTEN_STATE and columns[9] in inodes:
+                port = int(columns[1].rsplit(":", maxsplit=1)[1], 16)
+                if port not in ports:
+                    ports.append(port)
+    return ports
+
+
+def _socket_inodes(proc_dir: Path) -> set[str]:
+    inodes: set[str] = set()
+    fd_dir = proc_dir / "fd"
+    try:
+        descriptors = os.listdir(fd_dir)
+    except (FileNotFoundError, PermissionError, ProcessLookupError):
+        return inodes
+
+    for descriptor in descriptors:
+        try:
+            link = os.readlink(fd_dir / descriptor)
+        except OSError:
+            continue  # descriptor has been closed in the meantime
+        if link.startswith(_SOCKET_LINK_PREFIX):
+            inodes.add(link[len(_SOCKET_LINK_PREFIX) : -1])
+    return inodes
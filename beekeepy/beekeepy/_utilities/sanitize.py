@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import json
-from contextlib import suppress
-from copy import deepcopy
+import re
 from typing import TYPE_CHECKING, Final, TypeVar, overload
 
 if TYPE_CHECKING:
@@ -12,46 +10,53 @@ mask: Final[str] = "***"
 sensitive_keywords: Final[list[str]] = ["wif", "password", "private_key"]
 T = TypeVar("T")
 
+_SENSITIVE_STRING_VALUE: Final[re.Pattern[str]] = re.compile(
+    r'("(?:' + "|".join(re.escape(keyword) for keyword in sensitive_keywords) + r')"\s*:\s*)"(?:[^"\\]|\\.)*"'
+)
+"""Matches string value of sensitive key in json text, first group is key with colon."""
 
-def _sanitize_recursively(data: T, *, use_mask_on_str: bool = False) -> T:
-    if isinstance(data, str) and use_mask_on_str:
-        return mask  # type: ignore[return-value]
+
+def _sanitize_text(data: str) -> str:
+    """Masks sensitive values in single pass over raw text, without parsing it."""
+    return _SENSITIVE_STRING_VALUE.sub(rf'\1"{mask}"', data)
+
+
+def _sanitize_object(data: T, *, use_mask_on_str: bool = False) -> T:
+    """Returns given object if there is nothing to mask, otherwise copies only containers on path to masked values."""
+    if isinstance(data, str):
+        return mask if use_mask_on_str else data  # type: ignore[return-value]
 
     if isinstance(data, dict):
-        for key in data:
-            data[key] = _sanitize_recursively(data[key], use_mask_on_str=(key in sensitive_keywords))
+        sanitized: dict[str, Json] | None = None
+        for key, value in data.items():
+            sanitized_value = _sanitize_object(value, use_mask_on_str=(key in sensitive_keywords))
+            if sanitized_value is not value:
+                sanitized = sanitized or dict(data)
+                sanitized[key] = sanitized_value
+        return data if sanitized is None else sanitized  # type: ignore[return-value]
 
     if isinstance(data, list):
-        return [_sanitize_recursively(item) for item in data]  # type: ignore[return-value]
+        sanitized_items = [_sanitize_object(item) for item in data]
+        if any(sanitized is not item for sanitized, item in zip(sanitized_items, data, strict=True)):
+            return sanitized_items  # type: ignore[return-value]
 
     return data
 
 
 @overload
-def _sanitize(data: str) -> str: ...
+def sanitize(data: str) -> str: ...
 
 
 @overload
-def _sanitize(data: list[Json]) -> list[Json]: ...
+def sanitize(data: list[Json]) -> list[Json]: ...
 
 
 @overload
-def _sanitize(data: Json) -> Json: ...
-
-
-def _sanitize(data: Json | list[Json] | str) -> Json | list[Json] | str:
-    if isinstance(data, dict):
-        return _sanitize_recursively(data)
-
-    if isinstance(data, list):
-        return [(_sanitize(item) if isinstance(item, (dict, list)) else item) for item in data]
-
-    if isinstance(data, str):
-        with suppress(json.JSONDecodeError):
-            return json.dumps(_sanitize(json.loads(data)))
-
-    return data
+def sanitize(data: Json) -> Json: ...
 
 
 def sanitize(data: Json | list[Json] | str) -> Json | list[Json] | str:
-    return _sanitize(deepcopy(data))
+    """Returns data with values of sensitive keys replaced with mask, given data is never modified."""
+    if isinstance(data, str):
+        return _sanitize_text(data)
+    return _sanitize_object(data)
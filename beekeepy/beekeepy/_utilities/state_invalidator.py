@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import Any, Callable, Final, TypeVar
+from typing import Any, Callable, ClassVar, Final, TypeVar
+from weakref import WeakSet
 
 from loguru import logger
 
@@ -18,7 +19,7 @@ def empty_call_after_invalidation(return_after_invalidation: T) -> Callable[[Cal
     def empty_call_after_invalidation_impl(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func, assigned=("__module__", "__qualname__", "__doc__", "__annotations__"))
         def empty_call_after_invalidation_impl_wrapper(this: StateInvalidator, *args: Any, **kwargs: Any) -> T:
-            if isinstance(this, StateInvalidator) and getattr(this, EXCLUSIVE_MEMBER_NAME) is not None:
+            if isinstance(this, _Invalidated):
                 logger.warning(f"Ignoring call to {func.__qualname__}")
                 return return_after_invalidation
             return func(*[this, *args], **kwargs)
@@ -28,7 +29,39 @@ def empty_call_after_invalidation(return_after_invalidation: T) -> Callable[[Cal
     return empty_call_after_invalidation_impl
 
 
+class _Invalidated:
+    """Mixin of classes to which invalidated objects are switched, it raises on access to object members.
+
+    Note: Valid objects do not have any hooks on attribute access, so they do not pay for this check.
+    Access to `__class__` is still allowed, so `isinstance` checks work also on invalidated objects.
+    """
+
+    __slots__ = ()
+
+    def __getattribute__(self, name: str) -> Any:
+        attr_to_return = super().__getattribute__(name)
+        if name in (EXCLUSIVE_MEMBER_NAME, "__class__") or _is_wrapper(attr_to_return):
+            return attr_to_return
+        raise super().__getattribute__(EXCLUSIVE_MEMBER_NAME)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != EXCLUSIVE_MEMBER_NAME:
+            raise super().__getattribute__(EXCLUSIVE_MEMBER_NAME)
+        super().__setattr__(name, value)
+
+
+def _is_wrapper(obj: Any) -> bool:
+    return callable(obj) and hasattr(obj, "__name__") and obj.__name__ == "empty_call_after_invalidation_impl_wrapper"
+
+
 class StateInvalidator:
+    """Allows to invalidate object (and all registered ones), after that access to its members raises stored error.
+
+    Invalidation switches class of object to its subclass with `_Invalidated` mixin, created once per class.
+    """
+
+    __invalidated_types: ClassVar[dict[type[StateInvalidator], type[StateInvalidator]]] = {}
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.__invalidated: InvalidatedStateError | None = None
         """This var is set to None if object is valid.
@@ -36,37 +69,34 @@ class StateInvalidator:
         Note: If it set to exception it is thrown on access to object members after invalidation
         """
 
-        self.__objects_to_invalidate: list[StateInvalidator] = []
+        self.__objects_to_invalidate: WeakSet[StateInvalidator] = WeakSet()
+        self.__owner: StateInvalidator | None = None
+        """Object which invalidates this one, it holds this one only weakly so reference is kept here."""
         super().__init__(*args, **kwargs)
 
     @empty_call_after_invalidation(None)
     def invalidate(self, exception: InvalidatedStateError | None = None) -> None:
         exception = exception or InvalidatedStateError()
-        for obj in self.__objects_to_invalidate:
+        for obj in list(self.__objects_to_invalidate):
             obj.invalidate(exception=exception)
         self.__invalidated = exception
+        self.__class__ = StateInvalidator.__invalidated_type(type(self))
 
     def register_invalidable(self, obj: StateInvalidator) -> None:
-        self.__objects_to_invalidate.append(obj)
-
-    def __getattribute__(self, name: str) -> Any:
-        attr_to_return = super().__getattribute__(name)
-        invalidated = super().__getattribute__(EXCLUSIVE_MEMBER_NAME)
-        if name == EXCLUSIVE_MEMBER_NAME or invalidated is None or StateInvalidator.__is_wrapper(attr_to_return):
-            return attr_to_return
-        raise self.__invalidated  # type: ignore[misc]
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        if name != EXCLUSIVE_MEMBER_NAME and self.__invalidated is not None:
-            raise self.__invalidated
-        return super().__setattr__(name, value)
+        """Registers object to be invalidated together with this one, as long as it is alive."""
+        self.__objects_to_invalidate.add(obj)
+        obj.__owner = self
 
     @staticmethod
     def empty_call_after_invalidation(return_after_invalidation: T) -> Callable[[Callable[..., T]], Callable[..., T]]:
         return empty_call_after_invalidation(return_after_invalidation=return_after_invalidation)
 
-    @staticmethod
-    def __is_wrapper(obj: Any) -> bool:
-        return (
-            callable(obj) and hasattr(obj, "__name__") and obj.__name__ == "empty_call_after_invalidation_impl_wrapper"
-        )
+    @classmethod
+    def __invalidated_type(cls, valid_type: type[StateInvalidator]) -> type[StateInvalidator]:
+        if valid_type not in cls.__invalidated_types:
+            cls.__invalidated_types[valid_type] = type(
+                valid_type.__name__,
+                (valid_type, _Invalidated),
+                {"__module__": valid_type.__module__, "__qualname__": valid_type.__qualname__, "__slots__": ()},
+            )
+        return cls.__invalidated_types[valid_type]
@@ -7,6 +7,7 @@ from beekeepy._utilities.smart_lazy_import import aggregate_same_import, lazy_mo
 __all__ = [
     "AbstractCommunicator",
     "AbstractOverseer",
+    "AioHttpBackgroundLoopCommunicator",
     "AioHttpCommunicator",
     "async_is_url_reachable",
     "AsyncCallback",
@@ -15,19 +16,30 @@ __all__ = [
     "AsyncRequestCallback",
     "AsyncResponseCallback",
     "Callbacks",
+    "CircuitBreaker",
+    "CircuitState",
     "CommonOverseer",
     "CommunicationSettings",
     "ErrorCallback",
     "get_communicator_cls",
+    "Histogram",
+    "InMemoryMetrics",
+    "InMemoryTracer",
+    "LoadBalancer",
+    "LoadBalancingStrategy",
+    "MetricsSink",
+    "RecordedSpan",
     "Request",
     "RequestCallback",
     "RequestCommunicator",
     "Response",
     "ResponseCallback",
     "rules",
+    "Span",
     "StrictOverseer",
     "sync_is_url_reachable",
     "SyncCallback",
+    "Tracer",
 ]
 
 if TYPE_CHECKING:
@@ -48,12 +60,17 @@ if TYPE_CHECKING:
         SyncCallback,
     )
     from beekeepy._communication.abc.overseer import AbstractOverseer
+    from beekeepy._communication.aiohttp_background_loop_communicator import AioHttpBackgroundLoopCommunicator
     from beekeepy._communication.aiohttp_communicator import AioHttpCommunicator
+    from beekeepy._communication.circuit_breaker import CircuitBreaker, CircuitState
     from beekeepy._communication.communicator_getter import get_communicator_cls
     from beekeepy._communication.is_url_reachable import async_is_url_reachable, sync_is_url_reachable
+    from beekeepy._communication.load_balancer import LoadBalancer, LoadBalancingStrategy
+    from beekeepy._communication.metrics import Histogram, InMemoryMetrics, MetricsSink
     from beekeepy._communication.overseers import CommonOverseer, StrictOverseer
     from beekeepy._communication.request_communicator import RequestCommunicator
     from beekeepy._communication.settings import CommunicationSettings
+    from beekeepy._communication.tracing import InMemoryTracer, RecordedSpan, Span, Tracer
 
 
 __getattr__ = lazy_module_factory(
@@ -84,11 +101,35 @@ __getattr__ = lazy_module_factory(
         "StrictOverseer",
         module="beekeepy._communication.overseers",
     ),
+    *aggregate_same_import(
+        "LoadBalancer",
+        "LoadBalancingStrategy",
+        module="beekeepy._communication.load_balancer",
+    ),
+    *aggregate_same_import(
+        "Histogram",
+        "InMemoryMetrics",
+        "MetricsSink",
+        module="beekeepy._communication.metrics",
+    ),
+    *aggregate_same_import(
+        "InMemoryTracer",
+        "RecordedSpan",
+        "Span",
+        "Tracer",
+        module="beekeepy._communication.tracing",
+    ),
+    *aggregate_same_import(
+        "CircuitBreaker",
+        "CircuitState",
+        module="beekeepy._communication.circuit_breaker",
+    ),
     ("beekeepy._communication", "rules"),
     ("beekeepy._communication.abc.overseer", "AbstractOverseer"),
     ("beekeepy._communication.abc.communicator", "AbstractCommunicator"),
     ("beekeepy._communication.settings", "CommunicationSettings"),
     ("beekeepy._communication.communicator_getter", "get_communicator_cls"),
     ("beekeepy._communication.aiohttp_communicator", "AioHttpCommunicator"),
+    ("beekeepy._communication.aiohttp_background_loop_communicator", "AioHttpBackgroundLoopCommunicator"),
     ("beekeepy._communication.request_communicator", "RequestCommunicator"),
 )
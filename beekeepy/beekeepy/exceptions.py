@@ -15,6 +15,7 @@ __all__ = [
     "BeekeeperInterfaceError",
     "BeekeeperIsNotRunningError",
     "BeekeepyError",
+    "CircuitOpenError",
     "CommunicationError",
     "CommunicationResponseT",
     "DetachRemoteBeekeeperError",
@@ -91,6 +92,7 @@ if TYPE_CHECKING:
         BeekeeperFailedToStartDuringProcessSpawnError,
         BeekeeperFailedToStartNotReadyOnTimeError,
         BeekeeperIsNotRunningError,
+        CircuitOpenError,
         DetachRemoteBeekeeperError,
         InvalidatedStateByClosingBeekeeperError,
         InvalidatedStateByClosingSessionError,
@@ -168,6 +170,7 @@ __getattr__ = lazy_module_factory(
         "BeekeeperFailedToStartDuringProcessSpawnError",
         "BeekeeperFailedToStartNotReadyOnTimeError",
         "BeekeeperIsNotRunningError",
+        "CircuitOpenError",
         "DetachRemoteBeekeeperError",
         "InvalidatedStateByClosingBeekeeperError",
         "InvalidatedStateByClosingSessionError",
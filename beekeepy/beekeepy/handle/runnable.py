@@ -18,6 +18,7 @@ __all__ = [
     "Config",
     "ConfigT",
     "Executable",
+    "async_match_ports",
     "match_ports",
     "PortMatchingResult",
     "RunnableHandle",
@@ -33,7 +34,7 @@ if TYPE_CHECKING:
     from beekeepy._executable.beekeeper_executable import BeekeeperExecutable
     from beekeepy._runnable_handle._async_additional_definition import AsyncBeekeeper
     from beekeepy._runnable_handle._sync_additional_definition import Beekeeper
-    from beekeepy._runnable_handle.match_ports import PortMatchingResult, match_ports
+    from beekeepy._runnable_handle.match_ports import PortMatchingResult, async_match_ports, match_ports
     from beekeepy._runnable_handle.runnable_async_beekeeper import AsyncBeekeeperTemplate
     from beekeepy._runnable_handle.runnable_handle import RunnableHandle
     from beekeepy._runnable_handle.runnable_sync_beekeeper import BeekeeperTemplate
@@ -44,6 +45,7 @@ __getattr__ = lazy_module_factory(
     # Translations
     *aggregate_same_import(
         "PortMatchingResult",
+        "async_match_ports",
         "match_ports",
         module="beekeepy._runnable_handle.match_ports",
     ),
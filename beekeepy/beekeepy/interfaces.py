@@ -12,6 +12,7 @@ __all__ = [
     "ContextSync",
     "DelayGuardBase",
     "ErrorLogger",
+    "EventLoopThread",
     "HttpUrl",
     "KeyPair",
     "mask",
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
     from beekeepy._utilities.context_settings_updater import ContextSettingsUpdater
     from beekeepy._utilities.delay_guard import AsyncDelayGuard, DelayGuardBase, SyncDelayGuard
     from beekeepy._utilities.error_logger import ErrorLogger
+    from beekeepy._utilities.event_loop_thread import EventLoopThread
     from beekeepy._utilities.key_pair import KeyPair
     from beekeepy._utilities.sanitize import mask, sanitize
     from beekeepy._utilities.settings_holder import SharedSettingsHolder, UniqueSettingsHolder
@@ -82,6 +84,7 @@ __getattr__ = lazy_module_factory(
     ),
     ("beekeepy._utilities.context_settings_updater", "ContextSettingsUpdater"),
     ("beekeepy._utilities.error_logger", "ErrorLogger"),
+    ("beekeepy._utilities.event_loop_thread", "EventLoopThread"),
     ("beekeepy._utilities.key_pair", "KeyPair"),
     ("beekeepy._utilities.suppress_api_not_found", "SuppressApiNotFound"),
 )
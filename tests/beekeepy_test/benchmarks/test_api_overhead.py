@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING, Any, Final, Literal, get_type_hints
+
+from loguru import logger
+
+import beekeepy._apis.abc.api as api_module
+from beekeepy.handle.remote import AbstractSyncApi, SyncSendable
+from schemas.apis import beekeeper_api
+from schemas.jsonrpc import ExpectResultT, JSONRPCResult
+
+if TYPE_CHECKING:
+    import pytest
+
+    from beekeepy._communication.abc.communicator_models import Callbacks, Methods
+    from beekeepy.interfaces import HttpUrl
+
+AMOUNT_OF_CALLS: Final[int] = 10_000
+SIGNATURE: Final[str] = (
+    "1f69e091fc79b0e8d1812fc662f12076561f9e38ffc212b901ae90fe559f863a"
+    "d266fe459a8e946cff9bbe7e56ce253bbfab0cccdde944edc1d05161c61ae86340"
+)
+
+
+class NoNetworkSendable(SyncSendable):
+    """Returns prepared response immediately, so only api layer is measured."""
+
+    def is_testnet(self) -> bool:
+        return False
+
+    def _send(  # noqa: PLR0913
+        self,
+        *,
+        method: Methods,  # noqa: ARG002
+        expected_type: type[ExpectResultT],  # noqa: ARG002
+        serialization_type: Literal["hf26", "legacy"],  # noqa: ARG002
+        data: str | None = None,  # noqa: ARG002
+        url: HttpUrl | None = None,  # noqa: ARG002
+        callbacks: Callbacks | None = None,  # noqa: ARG002
+    ) -> JSONRPCResult[ExpectResultT]:
+        return RESPONSE  # type: ignore[no-any-return]
+
+
+class BenchmarkedApi(AbstractSyncApi):
+    api = AbstractSyncApi.endpoint_jsonrpc
+
+    @classmethod
+    def _register_api(cls) -> bool:
+        """This is test api, no need to register it."""
+        return False
+
+    @api
+    def sign_digest(self, *, sig_digest: str, public_key: str) -> beekeeper_api.SignDigest:
+        raise NotImplementedError
+
+
+RESPONSE: Final[Any] = JSONRPCResult(result=beekeeper_api.SignDigest(signature=SIGNATURE))
+
+
+def call_sign_digest(api: BenchmarkedApi) -> None:
+    api.sign_digest(sig_digest="9b29ba0710af3918e81d7b935556d7ab205d8a8f5ca2e2427535980c2e8bdaff", public_key="key")
+
+
+def test_return_type_is_resolved_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    resolutions: list[Any] = []
+
+    def counting_get_type_hints(obj: Any) -> dict[str, Any]:
+        resolutions.append(obj)
+        return get_type_hints(obj)
+
+    monkeypatch.setattr(api_module, "get_type_hints", counting_get_type_hints)
+    api = BenchmarkedApi(owner=NoNetworkSendable())
+
+    # ACT
+    for _ in range(100):
+        call_sign_digest(api)
+
+    # ASSERT
+    assert len(resolutions) <= 1, "Return type should be resolved only on first call"
+
+
+def test_json_dumps_is_reused() -> None:
+    # ARRANGE
+    api = BenchmarkedApi(owner=NoNetworkSendable())
+
+    # ACT & ASSERT
+    assert api.json_dumps() is api.json_dumps()
+
+
+def test_api_layer_per_call_overhead() -> None:
+    """Only logs measurement, wall-clock comparisons are too unstable to be asserted on shared machines."""
+    # ARRANGE
+    api = BenchmarkedApi(owner=NoNetworkSendable())
+    call_sign_digest(api)  # warm up caches
+
+    # ACT
+    total_seconds = timeit.timeit(lambda: call_sign_digest(api), number=AMOUNT_OF_CALLS)
+    reflection_seconds = timeit.timeit(lambda: get_type_hints(BenchmarkedApi.sign_digest), number=AMOUNT_OF_CALLS)
+
+    # ASSERT
+    per_call_us = total_seconds / AMOUNT_OF_CALLS * 1_000_000
+    reflection_per_call_us = reflection_seconds / AMOUNT_OF_CALLS * 1_000_000
+    logger.info(f"api layer: {per_call_us:.2f}us per call, avoided reflection: {reflection_per_call_us:.2f}us per call")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import gc
+import timeit
+import weakref
+from typing import Any, Final
+
+import pytest
+from loguru import logger
+
+from beekeepy._utilities.state_invalidator import StateInvalidator
+from beekeepy.exceptions import InvalidatedStateByClosingSessionError, InvalidatedStateError
+
+AMOUNT_OF_ACCESSES: Final[int] = 200_000
+
+
+class Plain:
+    def __init__(self) -> None:
+        self.name = "wallet"
+
+
+class Invalidable(StateInvalidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.name = "wallet"
+
+    @StateInvalidator.empty_call_after_invalidation(None)
+    def teardown(self) -> None:
+        self.invalidate(InvalidatedStateByClosingSessionError())
+
+
+class PerAccessHook(Plain):
+    """Replica of previous implementation of invalidation, which checked state on every attribute access."""
+
+    def __init__(self) -> None:
+        self.invalidated: InvalidatedStateError | None = None
+        super().__init__()
+
+    def __getattribute__(self, name: str) -> Any:
+        attr_to_return = super().__getattribute__(name)
+        invalidated = super().__getattribute__("invalidated")
+        if name == "invalidated" or invalidated is None or callable(attr_to_return):
+            return attr_to_return
+        raise invalidated
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != "invalidated" and getattr(self, "invalidated", None) is not None:
+            raise self.invalidated  # type: ignore[misc]
+        super().__setattr__(name, value)
+
+
+def measure_attribute_access(obj: Plain | Invalidable) -> float:
+    return timeit.timeit(lambda: obj.name, number=AMOUNT_OF_ACCESSES)
+
+
+def test_invalidation_after_class_swap() -> None:
+    # ARRANGE
+    parent = Invalidable()
+    child = Invalidable()
+    parent.register_invalidable(child)
+
+    # ACT
+    parent.teardown()
+
+    # ASSERT
+    assert isinstance(child, Invalidable)
+    for obj in (parent, child):
+        with pytest.raises(InvalidatedStateByClosingSessionError):
+            obj.name  # noqa: B018
+        with pytest.raises(InvalidatedStateByClosingSessionError):
+            obj.name = "other"
+    parent.teardown()  # NO RAISE
+
+
+def test_attribute_access_overhead_of_valid_object() -> None:
+    # ARRANGE
+    plain, invalidable, per_access_hook = Plain(), Invalidable(), PerAccessHook()
+
+    # ACT
+    plain_seconds = measure_attribute_access(plain)
+    invalidable_seconds = measure_attribute_access(invalidable)
+    per_access_hook_seconds = measure_attribute_access(per_access_hook)
+
+    # ASSERT
+    logger.info(
+        f"attribute access per {AMOUNT_OF_ACCESSES}: plain {plain_seconds:.4f}s, "
+        f"state invalidator {invalidable_seconds:.4f}s, per access hook {per_access_hook_seconds:.4f}s"
+    )
+    assert type(invalidable).__getattribute__ is object.__getattribute__, "Valid objects should not hook access"
+    assert type(invalidable).__setattr__ is object.__setattr__, "Valid objects should not hook assignment"
+
+
+def test_children_are_held_weakly() -> None:
+    # ARRANGE
+    parent = Invalidable()
+    child = Invalidable()
+    grandchild = Invalidable()
+    parent.register_invalidable(child)
+    child.register_invalidable(grandchild)
+    temporary = Invalidable()
+    parent.register_invalidable(temporary)
+    dropped = weakref.ref(temporary)
+
+    # ACT
+    del temporary, child
+    gc.collect()
+    parent.teardown()
+
+    # ASSERT
+    assert dropped() is None, "Registered object should not be kept alive by its owner"
+    with pytest.raises(InvalidatedStateByClosingSessionError):
+        grandchild.name  # noqa: B018
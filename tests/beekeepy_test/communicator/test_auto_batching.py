@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any, Final
+
+import pytest
+from local_tools.beekeepy.simple_api import AsyncEchoCaller
+from local_tools.beekeepy.testing_server import run_jsonrpc_echo_server, run_simple_server
+
+from beekeepy.handle.remote import RemoteHandleSettings
+from beekeepy.interfaces import HttpUrl
+
+RESOLVE_TIMEOUT: Final[float] = 10.0
+
+
+async def test_concurrent_calls_are_sent_as_single_batch() -> None:
+    # ARRANGE
+    amount_of_calls = 20
+    with run_jsonrpc_echo_server() as (url, server):
+        caller = AsyncEchoCaller(
+            settings=RemoteHandleSettings(http_endpoint=url, auto_batch_window=timedelta(milliseconds=50))
+        )
+
+        # ACT
+        try:
+            results = await asyncio.gather(*[caller.api.echo_api.echo(value=i) for i in range(amount_of_calls)])
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == list(range(amount_of_calls))
+    assert len(server.received) == 1, "All calls should be coalesced into single request"
+    assert len(server.received[0]) == amount_of_calls
+
+
+async def test_batch_is_sent_when_max_size_is_reached() -> None:
+    # ARRANGE
+    with run_jsonrpc_echo_server() as (url, server):
+        caller = AsyncEchoCaller(
+            settings=RemoteHandleSettings(
+                http_endpoint=url, auto_batch_window=timedelta(seconds=60), auto_batch_max_size=5
+            )
+        )
+
+        # ACT
+        try:
+            results = await asyncio.gather(*[caller.api.echo_api.echo(value=i) for i in range(10)])
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == list(range(10))
+    assert [len(body) for body in server.received] == [5, 5]
+
+
+async def test_auto_batching_is_disabled_by_default() -> None:
+    # ARRANGE
+    with run_jsonrpc_echo_server() as (url, server):
+        caller = AsyncEchoCaller(settings=RemoteHandleSettings(http_endpoint=url))
+
+        # ACT
+        try:
+            results = await asyncio.gather(*[caller.api.echo_api.echo(value=i) for i in range(3)])
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == [0, 1, 2]
+    assert all(isinstance(body, dict) for body in server.received)
+
+
+@pytest.mark.parametrize("response_id", ["null", '"abc"', "7"])
+async def test_calls_are_resolved_when_response_has_unknown_id(response_id: str) -> None:
+    # ARRANGE
+    response = f'[{{"jsonrpc": "2.0", "id": {response_id}, "result": {{"value": 1}}}}]'
+    with run_simple_server(response) as url:
+        caller = AsyncEchoCaller(
+            settings=RemoteHandleSettings(
+                http_endpoint=url, auto_batch_window=timedelta(milliseconds=10), max_retries=0
+            )
+        )
+
+        # ACT
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(caller.api.echo_api.echo(value=1), return_exceptions=True), timeout=RESOLVE_TIMEOUT
+            )
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    assert len(results) == 1
+    assert isinstance(results[0], Exception)
+
+
+async def test_teardown_cancels_calls_waiting_for_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    sent = asyncio.Event()
+    caller = AsyncEchoCaller(
+        settings=RemoteHandleSettings(
+            http_endpoint=HttpUrl("http://127.0.0.1:1"), auto_batch_window=timedelta(milliseconds=10)
+        )
+    )
+
+    async def never_responding_send_raw(**_: Any) -> None:
+        sent.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(caller, "_async_send_raw", never_responding_send_raw)
+    call = asyncio.ensure_future(caller.api.echo_api.echo(value=1))
+    await asyncio.wait_for(sent.wait(), timeout=RESOLVE_TIMEOUT)
+
+    # ACT
+    caller.teardown()
+
+    # ASSERT
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(call, timeout=RESOLVE_TIMEOUT)
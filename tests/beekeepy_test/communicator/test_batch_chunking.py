@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+import requests
+from local_tools.beekeepy.simple_api import EchoApiCollection, SyncEchoApiCollection
+from local_tools.beekeepy.testing_server import run_jsonrpc_echo_server
+
+from beekeepy.communication import CommonOverseer, CommunicationSettings, get_communicator_cls
+from beekeepy.handle.remote import AsyncBatchHandle, SyncBatchHandle
+
+if TYPE_CHECKING:
+    import pytest
+
+AMOUNT_OF_CALLS: Final[int] = 10
+MAX_BATCH_SIZE: Final[int] = 3
+
+
+def test_sync_batch_is_split_into_chunks() -> None:
+    # ARRANGE
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=CommunicationSettings()))
+    try:
+        # ACT
+        with run_jsonrpc_echo_server() as (url, server), SyncBatchHandle(
+            url=url,
+            overseer=overseer,
+            api=lambda o: SyncEchoApiCollection(owner=o),
+            max_batch_size=MAX_BATCH_SIZE,
+            max_in_flight=2,
+        ) as batch:
+            results = [batch.api.echo_api.echo(value=i) for i in range(AMOUNT_OF_CALLS)]
+    finally:
+        overseer.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == list(range(AMOUNT_OF_CALLS))
+    assert sorted(len(body) for body in server.received) == [1, 3, 3, 3]
+
+
+def test_sync_chunks_share_single_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    created: list[requests.Session] = []
+
+    class SlowlyCreatedSession(requests.Session):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            time.sleep(0.05)  # widens window in which other threads could create their own session
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(requests, "Session", SlowlyCreatedSession)
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=CommunicationSettings()))
+    try:
+        # ACT
+        with run_jsonrpc_echo_server() as (url, _), SyncBatchHandle(
+            url=url,
+            overseer=overseer,
+            api=lambda o: SyncEchoApiCollection(owner=o),
+            max_batch_size=MAX_BATCH_SIZE,
+            max_in_flight=AMOUNT_OF_CALLS,
+        ) as batch:
+            results = [batch.api.echo_api.echo(value=i) for i in range(AMOUNT_OF_CALLS)]
+    finally:
+        overseer.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == list(range(AMOUNT_OF_CALLS))
+    assert len(created) == 1, "every chunk should be sent with the same session, so none of them is leaked"
+
+
+async def test_async_batch_is_split_into_chunks() -> None:
+    # ARRANGE
+    overseer = CommonOverseer(communicator=get_communicator_cls("async")(settings=CommunicationSettings()))
+    try:
+        with run_jsonrpc_echo_server() as (url, server):
+            # ACT
+            async with AsyncBatchHandle(
+                url=url,
+                overseer=overseer,
+                api=lambda o: EchoApiCollection(owner=o),
+                max_batch_size=MAX_BATCH_SIZE,
+                max_in_flight=2,
+            ) as batch:
+                results = [await batch.api.echo_api.echo(value=i) for i in range(AMOUNT_OF_CALLS)]
+    finally:
+        overseer.teardown()
+
+    # ASSERT
+    assert [result.value for result in results] == list(range(AMOUNT_OF_CALLS))
+    assert sorted(len(body) for body in server.received) == [1, 3, 3, 3]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Final
+
+import pytest
+from local_tools.beekeepy.testing_server import run_simple_server
+
+from beekeepy.communication import (
+    CircuitBreaker,
+    CircuitState,
+    CommonOverseer,
+    CommunicationSettings,
+    get_communicator_cls,
+)
+from beekeepy.exceptions import CircuitOpenError, CommunicationError
+from beekeepy.handle.remote import RemoteHandleSettings
+from beekeepy.interfaces import HttpUrl
+
+UNREACHABLE_URL: Final[HttpUrl] = HttpUrl("http://127.0.0.1:1")
+REQUEST: Final[str] = """{"method": "aaa", "id": 1, "jsonrpc": "2.0"}"""
+RESPONSE: Final[str] = """{"jsonrpc": "2.0", "result": {}, "id": 1}"""
+FAILURE_THRESHOLD: Final[int] = 3
+
+
+def create_overseer(circuit_breaker: CircuitBreaker) -> CommonOverseer:
+    settings = CommunicationSettings(timeout=timedelta(seconds=1))
+    return CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings), circuit_breaker=circuit_breaker)
+
+
+def test_circuit_opens_after_failures() -> None:
+    # ARRANGE
+    circuit_breaker = CircuitBreaker(failure_threshold=FAILURE_THRESHOLD, probe_interval=timedelta(hours=1))
+    overseer = create_overseer(circuit_breaker)
+
+    # ACT
+    for _ in range(FAILURE_THRESHOLD):
+        with pytest.raises(CommunicationError) as error:
+            overseer.send(url=UNREACHABLE_URL, method="POST", data=REQUEST)
+        assert not isinstance(error.value, CircuitOpenError)
+
+    # ASSERT
+    assert circuit_breaker.state(UNREACHABLE_URL) == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        overseer.send(url=UNREACHABLE_URL, method="POST", data=REQUEST)
+    overseer.teardown()
+
+
+def test_circuit_is_closed_after_successful_probe() -> None:
+    # ARRANGE
+    circuit_breaker = CircuitBreaker(failure_threshold=1, probe_interval=timedelta(seconds=0))
+    overseer = create_overseer(circuit_breaker)
+
+    try:
+        with run_simple_server(RESPONSE) as url:
+            circuit_breaker.record_failure(url)
+            assert circuit_breaker.state(url) == CircuitState.OPEN
+
+            # ACT
+            overseer.send(url=url, method="POST", data=REQUEST)
+
+            # ASSERT
+            assert circuit_breaker.state(url) == CircuitState.CLOSED
+    finally:
+        overseer.teardown()
+
+
+def test_circuit_breaker_is_shared_between_copies_of_settings() -> None:
+    # ARRANGE
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    settings = RemoteHandleSettings(circuit_breaker=circuit_breaker)
+
+    # ACT
+    copied = settings.copy()
+    overseer = copied.get_overseer(communicator=get_communicator_cls("sync")(settings=copied))
+
+    # ASSERT
+    assert copied.circuit_breaker is circuit_breaker
+    assert overseer.circuit_breaker is circuit_breaker
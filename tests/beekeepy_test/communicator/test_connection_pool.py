@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+from beekeepy.communication import (
+    AioHttpCommunicator,
+    CircuitBreaker,
+    CommunicationSettings,
+    InMemoryMetrics,
+    LoadBalancer,
+    RequestCommunicator,
+)
+from beekeepy.handle.remote import RemoteHandleSettings
+from beekeepy.interfaces import HttpUrl
+
+SETTINGS = CommunicationSettings(
+    max_connections=250,
+    max_connections_per_host=200,
+    keepalive_timeout=timedelta(seconds=30),
+    dns_cache_ttl=timedelta(seconds=60),
+    pool_connections=4,
+    pool_maxsize=200,
+)
+
+
+def test_settings_export_import() -> None:
+    # ARRANGE & ACT
+    imported = CommunicationSettings.import_settings(SETTINGS.export_settings())
+
+    # ASSERT
+    assert imported == SETTINGS
+
+
+def test_settings_export_skips_shared_objects() -> None:
+    # ARRANGE
+    circuit_breaker = CircuitBreaker()
+    settings = RemoteHandleSettings(
+        max_connections=SETTINGS.max_connections,
+        circuit_breaker=circuit_breaker,
+        load_balancer=LoadBalancer([HttpUrl("http://127.0.0.1:1")]),
+        metrics=InMemoryMetrics(),
+    )
+
+    # ACT
+    exported = json.loads(settings.export_settings())
+
+    # ASSERT
+    assert exported["max_connections"] == SETTINGS.max_connections
+    assert {"circuit_breaker", "load_balancer", "metrics"}.isdisjoint(exported)
+    assert settings.circuit_breaker is circuit_breaker, "Exporting should not modify settings"
+
+
+def test_request_communicator_pool_limits() -> None:
+    # ARRANGE
+    communicator = RequestCommunicator(settings=SETTINGS)
+
+    # ACT
+    adapter = communicator.session.get_adapter("http://127.0.0.1")
+
+    # ASSERT
+    try:
+        assert adapter._pool_connections == SETTINGS.pool_connections  # type: ignore[attr-defined]
+        assert adapter._pool_maxsize == SETTINGS.pool_maxsize  # type: ignore[attr-defined]
+    finally:
+        communicator.teardown()
+
+
+async def test_aiohttp_communicator_pool_limits() -> None:
+    # ARRANGE
+    communicator = AioHttpCommunicator(settings=SETTINGS)
+
+    # ACT
+    session = await communicator.session
+    connector = session.connector
+
+    # ASSERT
+    try:
+        assert connector is not None
+        assert connector.limit == SETTINGS.max_connections
+        assert connector.limit_per_host == SETTINGS.max_connections_per_host
+    finally:
+        await session.close()
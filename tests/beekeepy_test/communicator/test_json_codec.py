@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Final
+
+import pytest
+
+from beekeepy._utilities.json_codec import build_response_model, json_loads
+from schemas.apis.beekeeper_api import GetInfo, ListWallets, SignDigest
+from schemas.jsonrpc import JSONRPCError, get_response_model
+
+SIGNATURE: Final[str] = (
+    "1f69e091fc79b0e8d1812fc662f12076561f9e38ffc212b901ae90fe559f863a"
+    "d266fe459a8e946cff9bbe7e56ce253bbfab0cccdde944edc1d05161c61ae86340"
+)
+RESPONSES: Final[dict[str, tuple[type[Any], dict[str, Any]]]] = {
+    "get_info": (
+        GetInfo,
+        {"jsonrpc": "2.0", "result": {"now": "2024-01-01T00:00:00", "timeout_time": "2024-01-01T00:15:00"}, "id": 1},
+    ),
+    "list_wallets": (
+        ListWallets,
+        {"jsonrpc": "2.0", "result": {"wallets": [{"name": "a", "unlocked": True}]}, "id": 2},
+    ),
+    "sign_digest": (
+        SignDigest,
+        {"jsonrpc": "2.0", "result": {"signature": SIGNATURE}, "id": 3},
+    ),
+    "error": (
+        ListWallets,
+        {"jsonrpc": "2.0", "error": {"code": -32003, "message": "some error"}, "id": 4},
+    ),
+}
+
+
+@pytest.mark.parametrize("response_name", RESPONSES.keys())
+def test_build_response_model_matches_get_response_model(response_name: str) -> None:
+    # ARRANGE
+    expected_type, response = RESPONSES[response_name]
+    reference = get_response_model(expected_type, json.dumps(response), "hf26")
+
+    # ACT
+    result = build_response_model(expected_type, response, "hf26")
+
+    # ASSERT
+    assert isinstance(result, JSONRPCError) == isinstance(reference, JSONRPCError)
+    assert result.json() == reference.json()
+
+
+def test_json_loads_matches_stdlib() -> None:
+    # ARRANGE
+    response = json.dumps({"jsonrpc": "2.0", "result": {"a": [1, 2.5, "x", None, True]}, "id": 10**30})
+
+    # ACT & ASSERT
+    assert json_loads(response) == json.loads(response)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import Any, Final
+
+import pytest
+from local_tools.beekeepy.testing_server import run_jsonrpc_echo_server
+
+from beekeepy.communication import CommonOverseer, CommunicationSettings, LoadBalancer, get_communicator_cls
+from beekeepy.exceptions import CommunicationError
+from beekeepy.interfaces import HttpUrl
+
+UNREACHABLE_URL: Final[HttpUrl] = HttpUrl("http://127.0.0.1:1")
+AMOUNT_OF_CALLS: Final[int] = 4
+SESSION_ID: Final[str] = "session-1"
+
+
+def request(method: str, **params: Any) -> str:
+    return json.dumps({"jsonrpc": "2.0", "id": 0, "method": method, "params": params})
+
+
+def create_overseer(load_balancer: LoadBalancer) -> CommonOverseer:
+    settings = CommunicationSettings(timeout=timedelta(seconds=1))
+    return CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings), load_balancer=load_balancer)
+
+
+def test_requests_are_distributed_with_round_robin() -> None:
+    with run_jsonrpc_echo_server() as (first_url, first), run_jsonrpc_echo_server() as (second_url, second):
+        # ARRANGE
+        overseer = create_overseer(LoadBalancer([first_url, second_url]))
+
+        # ACT
+        for _ in range(AMOUNT_OF_CALLS):
+            overseer.send(url=first_url, method="POST", data=request("beekeeper_api.get_version"))
+        overseer.teardown()
+
+    # ASSERT
+    assert len(first.received) == len(second.received) == AMOUNT_OF_CALLS // 2
+
+
+def test_session_is_pinned_to_endpoint_which_created_it() -> None:
+    with run_jsonrpc_echo_server() as (first_url, first), run_jsonrpc_echo_server() as (second_url, second):
+        # ARRANGE
+        load_balancer = LoadBalancer([first_url, second_url])
+        overseer = create_overseer(load_balancer)
+        overseer.send(url=first_url, method="POST", data=request("beekeeper_api.create_session", token=SESSION_ID))
+        pinned = load_balancer.pinned(SESSION_ID)
+
+        # ACT
+        for _ in range(AMOUNT_OF_CALLS):
+            overseer.send(url=first_url, method="POST", data=request("beekeeper_api.get_info", token=SESSION_ID))
+        overseer.send(url=first_url, method="POST", data=request("beekeeper_api.close_session", token=SESSION_ID))
+        overseer.teardown()
+
+    # ASSERT
+    assert pinned is not None
+    servers = {first_url: first, second_url: second}
+    assert len(servers[pinned].received) == AMOUNT_OF_CALLS + 2
+    assert load_balancer.pinned(SESSION_ID) is None
+
+
+def test_unreachable_endpoint_is_skipped() -> None:
+    with run_jsonrpc_echo_server() as (url, server):
+        # ARRANGE
+        load_balancer = LoadBalancer([UNREACHABLE_URL, url], health_check_interval=timedelta(hours=1))
+        overseer = create_overseer(load_balancer)
+        with pytest.raises(CommunicationError):
+            overseer.send(url=url, method="POST", data=request("beekeeper_api.get_version"))
+
+        # ACT
+        for _ in range(AMOUNT_OF_CALLS):
+            overseer.send(url=url, method="POST", data=request("beekeeper_api.get_version"))
+        overseer.teardown()
+
+    # ASSERT
+    assert load_balancer.healthy_endpoints() == [url]
+    assert len(server.received) == AMOUNT_OF_CALLS
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Final
+
+import pytest
+from local_tools.beekeepy.simple_api import AsyncEchoCaller
+from local_tools.beekeepy.testing_server import run_jsonrpc_echo_server, run_simple_server
+
+from beekeepy._communication.metrics import REQUEST_DURATION_SECONDS, RETRIES_TOTAL
+from beekeepy.communication import CommonOverseer, Histogram, InMemoryMetrics, get_communicator_cls
+from beekeepy.exceptions import UnableToAcquireDatabaseLockError
+from beekeepy.handle.remote import RemoteHandleSettings
+
+REQUEST: Final[str] = """{"method": "aaa", "id": 1, "jsonrpc": "2.0"}"""
+DATABASE_LOCK_RESPONSE: Final[str] = (
+    """{"jsonrpc": "2.0", "error": {"code": -32003, "message": "Unable to acquire database lock"}, "id": 1}"""
+)
+MAX_RELATIVE_ERROR: Final[float] = 0.01
+AMOUNT_OF_SAMPLES: Final[int] = 100_000
+MAX_INFINITE_RETRIES: Final[int] = 2
+
+
+@pytest.mark.parametrize("quantile", [0.5, 0.9, 0.99])
+def test_histogram_percentiles_have_bounded_error(quantile: float) -> None:
+    # ARRANGE
+    histogram = Histogram()
+
+    # ACT
+    for microseconds in range(1, AMOUNT_OF_SAMPLES + 1):
+        histogram.record(microseconds / 1_000_000)
+
+    # ASSERT
+    assert histogram.count == AMOUNT_OF_SAMPLES
+    assert histogram.percentile(quantile) == pytest.approx(
+        quantile * AMOUNT_OF_SAMPLES / 1_000_000, rel=MAX_RELATIVE_ERROR
+    )
+
+
+def test_prometheus_export() -> None:
+    # ARRANGE
+    metrics = InMemoryMetrics()
+
+    # ACT
+    metrics.increment(RETRIES_TOTAL, labels={"endpoint": 'http://"quoted"', "reason": "NullResultError"})
+    metrics.observe(REQUEST_DURATION_SECONDS, 0.25, labels={"method": "a"})
+
+    # ASSERT
+    assert metrics.export_prometheus().splitlines() == [
+        f"# TYPE {RETRIES_TOTAL} counter",
+        f'{RETRIES_TOTAL}{{endpoint="http://\\"quoted\\"",reason="NullResultError"}} 1.0',
+        f"# TYPE {REQUEST_DURATION_SECONDS} summary",
+        f'{REQUEST_DURATION_SECONDS}{{method="a",quantile="0.5"}} 0.25',
+        f'{REQUEST_DURATION_SECONDS}{{method="a",quantile="0.9"}} 0.25',
+        f'{REQUEST_DURATION_SECONDS}{{method="a",quantile="0.99"}} 0.25',
+        f'{REQUEST_DURATION_SECONDS}_sum{{method="a"}} 0.25',
+        f'{REQUEST_DURATION_SECONDS}_count{{method="a"}} 1',
+    ]
+
+
+async def test_request_duration_is_observed_per_method() -> None:
+    # ARRANGE
+    metrics = InMemoryMetrics()
+    amount_of_calls = 3
+
+    with run_jsonrpc_echo_server() as (url, _):
+        caller = AsyncEchoCaller(settings=RemoteHandleSettings(http_endpoint=url, metrics=metrics))
+
+        # ACT
+        try:
+            for value in range(amount_of_calls):
+                await caller.api.echo_api.echo(value=value)
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    histogram = metrics.histogram(
+        REQUEST_DURATION_SECONDS, endpoint=url.as_string(), method="echo_api.echo", outcome="ok"
+    )
+    assert histogram is not None
+    assert histogram.count == amount_of_calls
+
+
+def test_overseer_counts_retries() -> None:
+    # ARRANGE
+    metrics = InMemoryMetrics()
+    settings = RemoteHandleSettings(
+        period_between_retries=timedelta(seconds=0), max_infinite_retries=MAX_INFINITE_RETRIES
+    )
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings), metrics=metrics)
+
+    # ACT
+    try:
+        with run_simple_server(DATABASE_LOCK_RESPONSE) as url, pytest.raises(UnableToAcquireDatabaseLockError):
+            overseer.send(url=url, method="POST", data=REQUEST)
+    finally:
+        overseer.teardown()
+
+    # ASSERT
+    retries = metrics.counter(RETRIES_TOTAL, endpoint=url.as_string(), reason="UnableToAcquireDatabaseLockError")
+    assert retries == MAX_INFINITE_RETRIES
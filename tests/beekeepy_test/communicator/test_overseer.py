@@ -6,6 +6,7 @@ import pytest
 from local_tools.beekeepy.testing_server import run_simple_server
 
 from beekeepy.communication import (
+    AioHttpBackgroundLoopCommunicator,
     CommonOverseer,
     CommunicationSettings,
     StrictOverseer,
@@ -45,9 +46,11 @@ ERRORS_TO_DETECT: Final[list[tuple[type[OverseerError], str]]] = [
 
 SYNC_COMMUNICATORS: Final[list[type[AbstractCommunicator]]] = [
     get_communicator_cls("sync"),
+    AioHttpBackgroundLoopCommunicator,
 ]
 ASYNC_COMMUNICATORS: Final[list[type[AbstractCommunicator]]] = [
     get_communicator_cls("async"),
+    AioHttpBackgroundLoopCommunicator,
 ]
 OVERSEERS: Final[list[type[AbstractOverseer]]] = [CommonOverseer, StrictOverseer]
 
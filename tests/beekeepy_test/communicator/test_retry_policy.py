@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Final
+
+import pytest
+from local_tools.beekeepy.testing_server import run_simple_server
+
+from beekeepy._communication.retry_policy import RetryPolicy
+from beekeepy.communication import CommonOverseer, CommunicationSettings, get_communicator_cls
+from beekeepy.exceptions import NullResultError, UnableToAcquireDatabaseLockError
+
+REQUEST: Final[str] = """{"method": "aaa", "id": 1, "jsonrpc": "2.0"}"""
+DATABASE_LOCK_RESPONSE: Final[str] = (
+    """{"jsonrpc": "2.0", "error": {"code": -32003, "message": "Unable to acquire database lock"}, "id": 1}"""
+)
+
+
+def test_period_grows_exponentially_up_to_limit() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(
+        period_between_retries=timedelta(seconds=0.1),
+        max_period_between_retries=timedelta(seconds=1),
+        backoff_factor=2.0,
+        retry_jitter=0.0,
+    )
+    policy = RetryPolicy()
+
+    # ACT
+    periods = [policy.period(settings, retry_number).total_seconds() for retry_number in range(6)]
+
+    # ASSERT
+    assert periods == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+
+def test_full_jitter_stays_within_period() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(period_between_retries=timedelta(seconds=1), backoff_factor=1.0, retry_jitter=1.0)
+    policy = RetryPolicy()
+
+    # ACT
+    periods = [policy.period(settings, 0).total_seconds() for _ in range(100)]
+
+    # ASSERT
+    assert all(0.0 <= period <= 1.0 for period in periods)
+    assert len(set(periods)) > 1
+
+
+def test_retry_budget_is_exhausted() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(retry_budget=3, retry_budget_refill_rate=0.0)
+    policy = RetryPolicy()
+
+    # ACT
+    acquired = [policy.acquire(settings) for _ in range(5)]
+
+    # ASSERT
+    assert acquired == [True, True, True, False, False]
+
+
+def test_infinite_retries_are_limited() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(period_between_retries=timedelta(seconds=0), max_infinite_retries=2)
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings))
+
+    # ACT & ASSERT
+    try:
+        with run_simple_server(DATABASE_LOCK_RESPONSE) as url, pytest.raises(UnableToAcquireDatabaseLockError):
+            overseer.send(url=url, method="POST", data=REQUEST)
+    finally:
+        overseer.teardown()
+
+
+def test_retries_are_stopped_after_max_retry_time() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(
+        period_between_retries=timedelta(seconds=0.1),
+        retry_jitter=0.0,
+        max_retries=1_000,
+        max_retry_time=timedelta(seconds=0.5),
+    )
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings))
+
+    # ACT & ASSERT
+    try:
+        with run_simple_server("""{"jsonrpc": "2.0", "result": null, "id": 1}""") as url, pytest.raises(
+            NullResultError
+        ):
+            overseer.send(url=url, method="POST", data=REQUEST)
+    finally:
+        overseer.teardown()
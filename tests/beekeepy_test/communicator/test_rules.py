@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Final
+
+from beekeepy._communication.rules import (
+    JussiResponse,
+    NullResult,
+    UnableToAcquireDatabaseLock,
+    UnlockIsNotAccessible,
+)
+from beekeepy.communication import CommonOverseer, CommunicationSettings, get_communicator_cls
+from beekeepy.interfaces import HttpUrl
+
+URL: Final[HttpUrl] = HttpUrl("http://127.0.0.1:1")
+AMOUNT_OF_REQUESTS: Final[int] = 5_000
+
+
+def test_rules_share_request_index() -> None:
+    # ARRANGE
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=CommunicationSettings()))
+    request = [{"jsonrpc": "2.0", "id": i, "method": "database_api.get_config"} for i in range(AMOUNT_OF_REQUESTS)]
+
+    # ACT
+    rules = overseer._rules().instantiate(url=URL, request=request)
+
+    # ASSERT
+    indexes = {id(rule._request_index) for rule, _ in rules.resolved_rules()}
+    assert len(indexes) == 1
+
+
+def test_null_result_uses_matching_request_from_batch() -> None:
+    # ARRANGE
+    excluded_method, regular_method = "wallet_bridge_api.get_account", "database_api.get_config"
+    request = [
+        {"jsonrpc": "2.0", "id": i, "method": excluded_method if i % 2 else regular_method}
+        for i in range(AMOUNT_OF_REQUESTS)
+    ]
+    response = [{"jsonrpc": "2.0", "id": i, "result": None} for i in reversed(range(AMOUNT_OF_REQUESTS))]
+    rule = NullResult(url=URL, request=request)
+
+    # ACT
+    errors = rule.check(response=response, response_raw="")
+
+    # ASSERT
+    assert sorted(error.request_id or 0 for error in errors) == list(range(0, AMOUNT_OF_REQUESTS, 2))
+
+
+def test_lookups_are_not_scanned_without_error() -> None:
+    # ARRANGE
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=CommunicationSettings()))
+    rules = overseer._rules().instantiate(url=URL, request=None)
+    response = [
+        {"jsonrpc": "2.0", "id": i, "result": {"message": "Unable to acquire database lock"}} for i in range(10)
+    ]
+
+    # ACT
+    matched = rules.matched_lookups(response)
+
+    # ASSERT
+    assert matched == set()
+
+
+def test_lookups_are_matched_in_single_pass() -> None:
+    # ARRANGE
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=CommunicationSettings()))
+    rules = overseer._rules().instantiate(url=URL, request=None)
+    response = [
+        {"jsonrpc": "2.0", "id": 0, "result": {}},
+        {"jsonrpc": "2.0", "id": 1, "error": {"message": "Unable to acquire database lock"}},
+        {"jsonrpc": "2.0", "id": 2, "error": {"message": "unlock is not accessible", "data": {"jussi_request_id": 2}}},
+    ]
+
+    # ACT
+    matched = rules.matched_lookups(response)
+
+    # ASSERT
+    assert matched == {UnableToAcquireDatabaseLock, UnlockIsNotAccessible, JussiResponse}
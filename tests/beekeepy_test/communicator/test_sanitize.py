@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from local_tools.beekeepy.simple_api import TestCaller as Caller
+from loguru import logger
+
+from beekeepy.handle.remote import RemoteHandleSettings
+from beekeepy.interfaces import HttpUrl, mask, sanitize
+
+if TYPE_CHECKING:
+    import pytest
+
+    from beekeepy.exceptions import Json
+
+URL: Final[HttpUrl] = HttpUrl("http://127.0.0.1:1")
+REQUEST: Final[str] = (
+    '{"jsonrpc": "2.0", "id": 0, "method": "beekeeper_api.unlock",'
+    ' "params": {"wallet_name": "alice", "password" : "se\\"cret", "token": "abc"}}'
+)
+
+
+def test_sensitive_values_are_masked_in_text() -> None:
+    # ACT
+    sanitized = sanitize(REQUEST)
+
+    # ASSERT
+    assert sanitized == REQUEST.replace('"se\\"cret"', f'"{mask}"')
+
+
+def test_sensitive_values_are_masked_without_modifying_given_data() -> None:
+    # ARRANGE
+    untouched: Json = {"wallets": [{"name": "alice"}]}
+    response: list[Json] = [{"result": {"password": "secret", "private_key": "5K"}}, untouched]
+
+    # ACT
+    sanitized = sanitize(response)
+
+    # ASSERT
+    assert sanitized == [{"result": {"password": mask, "private_key": mask}}, untouched]
+    assert response[0] == {"result": {"password": "secret", "private_key": "5K"}}
+    assert sanitized[1] is untouched, "Parts without sensitive values should not be copied"
+
+
+def test_data_is_not_sanitized_when_trace_is_not_logged(monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    sanitized: list[Json | list[Json] | str] = []
+    messages: list[str] = []
+    caller = Caller(settings=RemoteHandleSettings(http_endpoint=URL))
+
+    def recording_sanitize(data: Json | list[Json] | str) -> Json | list[Json] | str:
+        sanitized.append(data)
+        return sanitize(data)
+
+    monkeypatch.setattr(caller, "_sanitize_data", recording_sanitize)
+
+    # ACT
+    caller._log_request(URL, REQUEST)
+    handler_id = logger.add(messages.append, level="TRACE", format="{message}")
+    try:
+        caller._log_request(URL, REQUEST)
+    finally:
+        logger.remove(handler_id)
+        caller.teardown()
+
+    # ASSERT
+    assert sanitized == [REQUEST], "Only request logged with TRACE sink should be sanitized"
+    assert len(messages) == 1
+    assert "se\\" not in messages[0]
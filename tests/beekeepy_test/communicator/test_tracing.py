@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from datetime import timedelta
+from typing import Final
+
+import pytest
+from local_tools.beekeepy.simple_api import AsyncEchoCaller
+from local_tools.beekeepy.testing_server import run_jsonrpc_echo_server, run_simple_server
+
+from beekeepy._communication.tracing import (
+    COMMUNICATOR_SEND_SPAN,
+    ERROR_TRANSLATION_SPAN,
+    OVERSEER_SEND_SPAN,
+    RESPONSE_PARSE_SPAN,
+    RESPONSE_VALIDATION_SPAN,
+    RETRY_EVENT,
+    trace,
+)
+from beekeepy.communication import (
+    CommonOverseer,
+    CommunicationSettings,
+    InMemoryTracer,
+    RecordedSpan,
+    get_communicator_cls,
+)
+from beekeepy.exceptions import DetectableError, UnableToAcquireDatabaseLockError
+from beekeepy.handle.remote import RemoteHandleSettings
+
+REQUEST: Final[str] = """{"method": "aaa", "id": 1, "jsonrpc": "2.0"}"""
+DATABASE_LOCK_RESPONSE: Final[str] = (
+    """{"jsonrpc": "2.0", "error": {"code": -32003, "message": "Unable to acquire database lock"}, "id": 1}"""
+)
+MAX_INFINITE_RETRIES: Final[int] = 2
+
+
+class DatabaseIsLockedError(DetectableError):
+    def _is_exception_handled(self, ex: BaseException) -> bool:
+        return isinstance(ex, UnableToAcquireDatabaseLockError)
+
+
+def spans_named(tracer: InMemoryTracer, name: str) -> list[RecordedSpan]:
+    return [span for span in tracer.spans if span.name == name]
+
+
+async def test_stages_of_call_are_traced() -> None:
+    # ARRANGE
+    tracer = InMemoryTracer()
+
+    with run_jsonrpc_echo_server() as (url, _):
+        caller = AsyncEchoCaller(settings=RemoteHandleSettings(http_endpoint=url, tracer=tracer))
+
+        # ACT
+        try:
+            await caller.api.echo_api.echo(value=1)
+        finally:
+            caller.teardown()
+
+    # ASSERT
+    (overseer_span,) = spans_named(tracer, OVERSEER_SEND_SPAN)
+    (communicator_span,) = spans_named(tracer, COMMUNICATOR_SEND_SPAN)
+    (parse_span,) = spans_named(tracer, RESPONSE_PARSE_SPAN)
+    (validation_span,) = spans_named(tracer, RESPONSE_VALIDATION_SPAN)
+
+    assert communicator_span.parent is overseer_span
+    assert parse_span.parent is overseer_span
+    assert validation_span.parent is None
+    for span in (overseer_span, communicator_span):
+        assert span.attributes["rpc.method"] == "echo_api.echo"
+        assert span.attributes["rpc.jsonrpc.request_id"] == validation_span.attributes["rpc.jsonrpc.request_id"]
+        assert isinstance(span.attributes["http.request.body.size"], int)
+        assert span.attributes["http.request.body.size"] > 0
+    assert communicator_span.attributes["http.response.body.size"] == parse_span.attributes["http.response.body.size"]
+    assert communicator_span.duration <= overseer_span.duration
+
+
+def test_retries_and_error_translation_are_traced() -> None:
+    # ARRANGE
+    tracer = InMemoryTracer()
+    settings = RemoteHandleSettings(
+        period_between_retries=timedelta(seconds=0), max_infinite_retries=MAX_INFINITE_RETRIES, tracer=tracer
+    )
+    overseer = CommonOverseer(communicator=get_communicator_cls("sync")(settings=settings))
+
+    # ACT
+    try:
+        with (
+            run_simple_server(DATABASE_LOCK_RESPONSE) as url,
+            pytest.raises(DatabaseIsLockedError),
+            DatabaseIsLockedError("database is locked"),
+        ):
+            overseer.send(url=url, method="POST", data=REQUEST)
+    finally:
+        overseer.teardown()
+
+    # ASSERT
+    (overseer_span,) = spans_named(tracer, OVERSEER_SEND_SPAN)
+    (translation_span,) = spans_named(tracer, ERROR_TRANSLATION_SPAN)
+
+    assert [name for name, _ in overseer_span.events] == [RETRY_EVENT] * MAX_INFINITE_RETRIES
+    assert isinstance(overseer_span.exception, UnableToAcquireDatabaseLockError)
+    assert len(spans_named(tracer, COMMUNICATOR_SEND_SPAN)) == MAX_INFINITE_RETRIES + 1
+    assert translation_span.attributes["beekeepy.source_error"] == UnableToAcquireDatabaseLockError.__name__
+    assert translation_span.attributes["beekeepy.translated"] is True
+    assert translation_span.exception is None, "Successful translation should not be recorded as failure"
+
+
+def test_nested_detectors_trace_only_original_error() -> None:
+    # ARRANGE
+    tracer = InMemoryTracer()
+    source_error = UnableToAcquireDatabaseLockError("http://127.0.0.1:1", b"", message="locked", request_id=None)
+
+    # ACT
+    with (
+        pytest.raises(DatabaseIsLockedError),
+        DatabaseIsLockedError("outer"),
+        DatabaseIsLockedError("inner"),
+        trace(tracer, OVERSEER_SEND_SPAN, {}),
+    ):
+        raise source_error
+
+    # ASSERT
+    (translation_span,) = spans_named(tracer, ERROR_TRANSLATION_SPAN)
+    assert translation_span.attributes["beekeepy.source_error"] == UnableToAcquireDatabaseLockError.__name__
+
+
+def test_settings_with_tracer_can_be_exported() -> None:
+    # ARRANGE
+    settings = CommunicationSettings(max_retries=1, tracer=InMemoryTracer())
+
+    # ACT
+    imported = CommunicationSettings.import_settings(settings.export_settings())
+
+    # ASSERT
+    assert imported == settings.copy(exclude={"tracer"})
+
+
+def test_tracer_is_shared_by_copies_of_settings() -> None:
+    # ARRANGE
+    tracer = InMemoryTracer()
+
+    # ACT
+    copied = RemoteHandleSettings(tracer=tracer).copy()
+
+    # ASSERT
+    assert copied.tracer is tracer
+
+
+def test_tracer_is_not_kept_alive_by_its_spans() -> None:
+    # ARRANGE
+    tracer = InMemoryTracer()
+    with trace(tracer, OVERSEER_SEND_SPAN, {}):
+        pass
+    dropped = weakref.ref(tracer)
+
+    # ACT
+    del tracer
+    gc.collect()
+
+    # ASSERT
+    assert dropped() is None
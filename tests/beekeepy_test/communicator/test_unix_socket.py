@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from local_tools.beekeepy.testing_server import run_simple_unix_server
+
+from beekeepy.communication import (
+    AioHttpBackgroundLoopCommunicator,
+    CommunicationSettings,
+    get_communicator_cls,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from beekeepy.communication import AbstractCommunicator
+
+
+RESPONSE: Final[str] = """{"jsonrpc": "2.0", "result": {}, "id": 1}"""
+REQUEST: Final[str] = """{"method": "aaa", "id": 1, "jsonrpc": "2.0"}"""
+
+
+@pytest.mark.parametrize("communicator_cls", [get_communicator_cls("sync"), AioHttpBackgroundLoopCommunicator])
+def test_sync_send_over_unix_socket(communicator_cls: type[AbstractCommunicator], tmp_path: Path) -> None:
+    # ARRANGE
+    socket_path = tmp_path / "server.sock"
+    communicator = communicator_cls(settings=CommunicationSettings(unix_socket_path=socket_path))
+
+    # ACT
+    try:
+        with run_simple_unix_server(RESPONSE, socket_path) as url:
+            response = communicator.post(url=url, data=REQUEST)
+    finally:
+        communicator.teardown()
+
+    # ASSERT
+    assert response == RESPONSE
+
+
+async def test_async_send_over_unix_socket(tmp_path: Path) -> None:
+    # ARRANGE
+    socket_path = tmp_path / "server.sock"
+    communicator = get_communicator_cls("async")(settings=CommunicationSettings(unix_socket_path=socket_path))
+
+    # ACT
+    try:
+        with run_simple_unix_server(RESPONSE, socket_path) as url:
+            response = await communicator.async_post(url=url, data=REQUEST)
+    finally:
+        communicator.teardown()
+
+    # ASSERT
+    assert response == RESPONSE
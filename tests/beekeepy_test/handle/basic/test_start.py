@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from beekeepy.handle.runnable import Beekeeper
+
 if TYPE_CHECKING:
-    from beekeepy.handle.runnable import Beekeeper
+    from local_tools.beekeepy.models import SettingsLoggerFactory
 
 
 def test_proper_closing(beekeeper: Beekeeper) -> None:
@@ -18,3 +21,19 @@ def test_clean_dirs(beekeeper: Beekeeper, wallet_name: str) -> None:
     test_file = beekeeper.settings.ensured_working_directory / f"{wallet_name}.wallet"
     assert not test_file.exists()
     test_file.touch()
+
+
+def test_start_on_unix_socket(settings_with_logger: SettingsLoggerFactory) -> None:
+    # ARRANGE
+    incoming_settings, logger = settings_with_logger()
+    incoming_settings.unix_socket_path = Path("beekeeper.sock")
+
+    # ACT
+    with Beekeeper(settings=incoming_settings, logger=logger) as bk:
+        bk.api.create(wallet_name="unix", password="password")  # noqa: S106
+        wallets = bk.api.list_wallets().wallets
+
+    # ASSERT
+    assert bk.settings.unix_socket_path == incoming_settings.ensured_working_directory / "beekeeper.sock"
+    assert bk.config.webserver_http_endpoint is None
+    assert [wallet.name for wallet in wallets] == ["unix"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+import socket
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import TYPE_CHECKING
+
+import pytest
+
+from beekeepy._utilities.listening_ports import listening_ports
+from beekeepy.handle.runnable import async_match_ports, match_ports
+from beekeepy.interfaces import WsUrl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from beekeepy.handle.runnable import Beekeeper
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    STATUS: int = 200
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(self.STATUS)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silences logging to stderr."""
+
+
+class _UpgradeRequiredHandler(_OkHandler):
+    STATUS: int = 426
+
+
+def _serve(handler: type[BaseHTTPRequestHandler]) -> Iterator[int]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def http_server() -> Iterator[int]:
+    yield from _serve(_OkHandler)
+
+
+@pytest.fixture
+def websocket_server() -> Iterator[int]:
+    yield from _serve(_UpgradeRequiredHandler)
+
+
+@pytest.fixture
+def silent_socket() -> Iterator[int]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def test_listening_ports_of_current_process(http_server: int, silent_socket: int) -> None:
+    # ACT
+    ports = listening_ports(os.getpid())
+
+    # ASSERT
+    assert {http_server, silent_socket} <= set(ports)
+
+
+def test_match_ports_finds_http_endpoint_among_other_ports(http_server: int, silent_socket: int) -> None:
+    # ACT
+    result = match_ports([silent_socket, http_server])
+
+    # ASSERT
+    assert result.http is not None
+    assert result.http.port == http_server
+    assert [url.port for url in result.p2p] == [silent_socket]
+
+
+def test_match_ports_classifies_websocket_endpoint(http_server: int, websocket_server: int) -> None:
+    # ACT
+    result = match_ports([websocket_server, http_server])
+
+    # ASSERT
+    assert result.http is not None
+    assert result.http.port == http_server
+    assert result.websocket is not None
+    assert result.websocket.port == websocket_server
+    assert result.p2p == []
+
+
+async def test_async_match_ports_stops_at_http(http_server: int, silent_socket: int) -> None:
+    # ARRANGE
+    started_at = time.perf_counter()
+
+    # ACT
+    result = await async_match_ports([silent_socket, http_server], stop_at_http=True)
+
+    # ASSERT
+    assert result.http is not None
+    assert result.http.port == http_server
+    assert result.p2p == [], "silent port should not be classified before http endpoint is found"
+    assert time.perf_counter() - started_at < 1.0
+
+
+def test_websocket_endpoint_is_written_to_config_after_run(beekeeper_not_started: Beekeeper) -> None:
+    # ARRANGE
+    beekeeper_not_started.config.webserver_ws_endpoint = WsUrl.factory(port=0)
+
+    # ACT
+    beekeeper_not_started.run()
+
+    # ASSERT
+    ws_endpoint = beekeeper_not_started.config.webserver_ws_endpoint
+    assert ws_endpoint is not None, "Websocket endpoint should be filled from app status when probes stopped at http"
+    assert ws_endpoint.port not in (None, 0)
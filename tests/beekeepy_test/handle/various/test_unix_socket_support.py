@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from beekeepy.exceptions import FailedToStartExecutableError
+from beekeepy.handle.runnable import RunnableHandle, RunnableHandleSettings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class HandleWithoutUnixSocket(RunnableHandle[Any, Any, Any, RunnableHandleSettings]):
+    def _construct_executable(self) -> Any:
+        return None
+
+    def _get_settings(self) -> RunnableHandleSettings:
+        return RunnableHandleSettings()
+
+    def _unify_cli_arguments(self, working_directory: Path, http_endpoint: Any) -> None:
+        pass
+
+    def _unify_config(self, working_directory: Path, http_endpoint: Any) -> None:
+        pass
+
+
+def test_unix_socket_is_rejected_by_handle_without_its_support(tmp_path: Path) -> None:
+    # ARRANGE
+    handle = HandleWithoutUnixSocket()
+
+    # ACT & ASSERT
+    with pytest.raises(FailedToStartExecutableError):
+        handle._unify_unix_socket(tmp_path, tmp_path / "handle.sock")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Final
+
+import pytest
+from local_tools.beekeepy.account_credentials import AccountCredentials
+from local_tools.beekeepy.constants import DIGEST_TO_SIGN
+from local_tools.beekeepy.generators import default_wallet_credentials
+
+from beekeepy import Beekeeper, BeekeeperPool
+from beekeepy._interface.synchronous import beekeeper_pool
+
+if TYPE_CHECKING:
+    from local_tools.beekeepy.models import SettingsFactory
+
+    from beekeepy.settings import InterfaceSettings
+
+POOL_SIZE: Final[int] = 4
+FAILING_WORKER: Final[str] = "beekeeper-1"
+
+
+def test_pool_signs_with_wallets_copied_from_directory(settings: SettingsFactory) -> None:
+    # ARRANGE
+    wallet_name, wallet_password = default_wallet_credentials()
+    accounts = AccountCredentials.create_multiple(3)
+    source_settings = settings()
+    with Beekeeper.factory(settings=source_settings) as bk, bk.create_session() as session:
+        wallet = session.create_wallet(name=wallet_name, password=wallet_password)
+        wallet.import_keys(private_keys=[account.private_key for account in accounts])
+        expected = [wallet.sign_digest(sig_digest=DIGEST_TO_SIGN, key=account.public_key) for account in accounts]
+
+    # ACT
+    with BeekeeperPool(
+        size=2,
+        wallets={wallet_name: wallet_password},
+        wallets_directory=source_settings.ensured_working_directory,
+        settings=settings(),
+    ) as pool:
+        signatures = pool.sign_digests(
+            [(DIGEST_TO_SIGN, account.public_key) for account in accounts], wallet_name=wallet_name
+        )
+
+    # ASSERT
+    assert signatures == expected
+
+
+def test_pool_imports_keys_to_every_beekeeper(settings: SettingsFactory) -> None:
+    # ARRANGE
+    wallet_name, wallet_password = default_wallet_credentials()
+    account = AccountCredentials.create()
+
+    with BeekeeperPool(size=2, wallets={wallet_name: wallet_password}, settings=settings()) as pool:
+        # ACT
+        pool.import_keys(wallet_name=wallet_name, private_keys=[account.private_key])
+        signatures = pool.sign_digests([(DIGEST_TO_SIGN, account.public_key)] * pool.size * 2)
+
+    # ASSERT
+    assert len(set(signatures)) == 1
+
+
+class FakeBeekeeper:
+    started: ClassVar[list[FakeBeekeeper]] = []
+    torn_down: ClassVar[list[FakeBeekeeper]] = []
+
+    @classmethod
+    def factory(cls, *, settings: InterfaceSettings) -> FakeBeekeeper:
+        if settings.ensured_working_directory.name == FAILING_WORKER:
+            raise FailedToStartError
+        beekeeper = cls()
+        cls.started.append(beekeeper)
+        return beekeeper
+
+    def create_session(self) -> FakeBeekeeper:
+        return self
+
+    def create_wallet(self, *, name: str, password: str) -> FakeBeekeeper:  # noqa: ARG002
+        return self
+
+    def teardown(self) -> None:
+        self.torn_down.append(self)
+
+
+class FailedToStartError(Exception):
+    pass
+
+
+def test_pool_tears_down_started_beekeepers_when_any_fails(
+    settings: SettingsFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # ARRANGE
+    monkeypatch.setattr(beekeeper_pool, "Beekeeper", FakeBeekeeper)
+    monkeypatch.setattr(FakeBeekeeper, "started", [])
+    monkeypatch.setattr(FakeBeekeeper, "torn_down", [])
+
+    # ACT
+    with pytest.raises(FailedToStartError):
+        BeekeeperPool(size=POOL_SIZE, wallets={"alice": "password"}, settings=settings())
+
+    # ASSERT
+    assert len(FakeBeekeeper.started) == POOL_SIZE - 1
+    assert sorted(map(id, FakeBeekeeper.torn_down)) == sorted(map(id, FakeBeekeeper.started))
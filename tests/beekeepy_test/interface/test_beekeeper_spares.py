@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, NoReturn
+
+import pytest
+
+from beekeepy import Beekeeper, BeekeeperSpares
+from beekeepy._runnable_handle import runnable_sync_beekeeper
+
+if TYPE_CHECKING:
+    from local_tools.beekeepy.models import SettingsFactory
+
+WAIT_TIMEOUT: Final[float] = 30.0
+
+
+class SpareFailedToStartError(Exception):
+    pass
+
+
+def test_factory_takes_spare_and_refills(settings: SettingsFactory) -> None:
+    # ARRANGE
+    template = settings()
+    spares_directory = template.ensured_working_directory / "spares"
+    template.working_directory = None
+
+    with BeekeeperSpares(count=1, settings=template, directory=spares_directory) as spares:
+        assert spares.wait_until_ready(timeout=30)
+
+        # ACT
+        with Beekeeper.factory(settings=template) as bk:
+            # ASSERT
+            assert bk.settings.working_directory is not None
+            assert bk.settings.working_directory.parent == spares_directory
+            assert bk.create_session().get_info() is not None
+            assert spares.wait_until_ready(timeout=30)
+            assert spares.ready == 1
+
+
+def test_factory_ignores_spares_for_other_working_directory(settings: SettingsFactory) -> None:
+    # ARRANGE
+    template = settings()
+    spares_directory = template.ensured_working_directory / "spares"
+    requested = template.copy()
+    template.working_directory = None
+
+    with BeekeeperSpares(count=1, settings=template, directory=spares_directory) as spares:
+        assert spares.wait_until_ready(timeout=30)
+
+        # ACT
+        with Beekeeper.factory(settings=requested) as bk:
+            # ASSERT
+            assert bk.settings.working_directory == requested.working_directory
+            assert spares.ready == 1
+
+
+def test_failed_spare_is_reported_and_deactivated(settings: SettingsFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    # ARRANGE
+    def failing_handle(*_: object, **__: object) -> NoReturn:
+        raise SpareFailedToStartError
+
+    monkeypatch.setattr(runnable_sync_beekeeper, "Beekeeper", failing_handle)
+    template = settings()
+    spares_directory = template.ensured_working_directory / "spares"
+    template.working_directory = None
+
+    with BeekeeperSpares(count=1, settings=template, directory=spares_directory) as spares:
+        # ACT & ASSERT
+        with pytest.raises(SpareFailedToStartError):
+            spares.wait_until_ready(timeout=WAIT_TIMEOUT)
+        assert spares.ready == 0
+
+        with BeekeeperSpares(count=1, settings=template, directory=spares_directory / "next"):
+            assert BeekeeperSpares.take_active(template) is None
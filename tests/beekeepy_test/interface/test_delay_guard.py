@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
+
+from beekeepy.exceptions import UnlockIsNotAccessibleError
+from beekeepy.interfaces import AsyncDelayGuard, DelayGuardBase, SyncDelayGuard
+
+DELAY: Final[float] = DelayGuardBase.BEEKEEPER_DELAY_TIME.total_seconds()
+AMOUNT_OF_WAITERS: Final[int] = 5
+
+
+def unlock_is_not_accessible() -> UnlockIsNotAccessibleError:
+    return UnlockIsNotAccessibleError("http://127.0.0.1:1", b"", message="unlock is not accessible", request_id=None)
+
+
+async def test_waiters_are_let_in_one_by_one_after_delay() -> None:
+    # ARRANGE
+    guard = AsyncDelayGuard()
+    inside = 0
+    max_inside = 0
+    entered_at: list[float] = []
+
+    async def attempt() -> None:
+        nonlocal inside, max_inside
+        async with guard:
+            entered_at.append(time.monotonic())
+            inside += 1
+            max_inside = max(max_inside, inside)
+            await asyncio.sleep(0)
+            inside -= 1
+
+    async with guard:
+        failed_at = time.monotonic()
+        raise unlock_is_not_accessible()
+
+    # ACT
+    await asyncio.gather(*(attempt() for _ in range(AMOUNT_OF_WAITERS)))
+
+    # ASSERT
+    assert guard.error_occured(), "error of first attempt should be reported in its task"
+    assert max_inside == 1
+    assert len(entered_at) == AMOUNT_OF_WAITERS
+    assert min(entered_at) - failed_at >= DELAY
+    assert max(entered_at) - failed_at < DELAY * 3, "waiters should be woken up once delay passes"
+
+
+def test_error_is_reported_only_to_failing_thread() -> None:
+    # ARRANGE
+    guard = SyncDelayGuard()
+
+    def attempt(should_fail: bool) -> bool:
+        with guard:
+            if should_fail:
+                raise unlock_is_not_accessible()
+        return guard.error_occured()
+
+    # ACT
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(attempt, [True, False]))
+
+    # ASSERT
+    assert results == [True, False]
+
+
+def test_guard_is_not_kept_alive_by_its_outcome() -> None:
+    # ARRANGE
+    guard = SyncDelayGuard()
+    with guard:
+        raise unlock_is_not_accessible()
+    assert guard.error_occured()
+    dropped = weakref.ref(guard)
+
+    # ACT
+    del guard
+    gc.collect()
+
+    # ASSERT
+    assert dropped() is None
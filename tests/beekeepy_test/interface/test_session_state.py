@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import gc
+from datetime import timedelta
+
+from beekeepy._interface.session_state import ALL_WALLETS, SessionState
+from beekeepy._interface.wallets_common import ContainsWalletName
+from schemas.apis.beekeeper_api import GetInfo
+from schemas.apis.beekeeper_api.fundaments_of_responses import WalletDetails
+from schemas.fields.basic import PublicKey
+from schemas.fields.hive_datetime import HiveDateTime
+
+WALLET_NAME = "wallet-0"
+KEY_1 = PublicKey("STM6LLegbAgLAy28EHrffBVuANFWcFgmqRMW13wBmTExqFE9SCkg4")
+KEY_2 = PublicKey("STM5RqVBAVNp5ufMCetQtvLGLJo7unX9nyCBMMrTXRWQ9i1Zzzizh")
+KEY_3 = PublicKey("STM8GC13uCZbP44HzMLV6zPZGwVQ8Nt4Kji8PapsPiNq1BK153XTX")
+
+
+class FakeBeekeeper:
+    def __init__(self, *, timeout: timedelta = timedelta(minutes=15)) -> None:
+        self.timeout = timeout
+        self.wallets = [WalletDetails(name=WALLET_NAME, unlocked=False)]
+        self.keys: dict[str | None, list[PublicKey]] = {WALLET_NAME: [KEY_1], ALL_WALLETS: [KEY_1, KEY_3]}
+        self.calls: list[str] = []
+
+    def get_info(self) -> GetInfo:
+        self.calls.append("get_info")
+        now = HiveDateTime.now()
+        return GetInfo(now=now, timeout_time=HiveDateTime(now + self.timeout))
+
+    def list_wallets(self) -> list[WalletDetails]:
+        self.calls.append("list_wallets")
+        return list(self.wallets)
+
+    def wallet_public_keys(self) -> list[PublicKey]:
+        self.calls.append("get_public_keys")
+        return list(self.keys[WALLET_NAME])
+
+    def all_public_keys(self) -> list[PublicKey]:
+        self.calls.append("get_public_keys_all")
+        return list(self.keys[ALL_WALLETS])
+
+
+def test_wallets_are_fetched_once() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+
+    # ACT
+    for _ in range(3):
+        state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert beekeeper.calls == ["list_wallets", "get_info"], "deadline should be fetched once, on first reuse"
+
+
+def test_cold_access_fetches_only_requested_state() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+
+    # ACT
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+    state.public_keys(WALLET_NAME, beekeeper.get_info, beekeeper.wallet_public_keys)
+
+    # ASSERT
+    assert beekeeper.calls == ["list_wallets", "get_public_keys"]
+
+
+def test_known_deadline_is_not_fetched_again() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.update_info(beekeeper.get_info())
+
+    # ACT
+    for _ in range(3):
+        state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert beekeeper.calls == ["get_info", "list_wallets"]
+
+
+def test_lock_state_is_updated_locally() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ACT
+    state.on_unlock(WALLET_NAME)
+    after_unlock = state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+    state.on_lock_all()
+    after_lock_all = state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert after_unlock == [WalletDetails(name=WALLET_NAME, unlocked=True)]
+    assert after_lock_all == [WalletDetails(name=WALLET_NAME, unlocked=False)]
+    assert beekeeper.calls == ["list_wallets", "get_info"]
+
+
+def test_state_expires_with_unlock_timeout() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper(timeout=timedelta(seconds=0))
+    state = SessionState()
+
+    # ACT
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert beekeeper.calls == ["list_wallets", "get_info", "list_wallets"]
+
+
+def test_unknown_wallet_forces_refetch() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ACT
+    state.on_open("other-wallet")
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert beekeeper.calls == ["list_wallets", "list_wallets"]
+
+
+def test_timeout_change_refreshes_deadline_only() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.update_info(beekeeper.get_info())
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ACT
+    state.on_timeout_changed()
+    state.wallets(beekeeper.get_info, beekeeper.list_wallets)
+
+    # ASSERT
+    assert beekeeper.calls == ["get_info", "list_wallets", "get_info"]
+
+
+def test_keys_are_fetched_again_after_import() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.public_keys(WALLET_NAME, beekeeper.get_info, beekeeper.wallet_public_keys)
+    state.public_keys(ALL_WALLETS, beekeeper.get_info, beekeeper.all_public_keys)
+    beekeeper.keys = {WALLET_NAME: [KEY_2, KEY_1], ALL_WALLETS: [KEY_2, KEY_1, KEY_3]}
+
+    # ACT
+    state.on_keys_imported(WALLET_NAME)
+    after_import = list(state.public_keys(WALLET_NAME, beekeeper.get_info, beekeeper.wallet_public_keys))
+    all_after_import = list(state.public_keys(ALL_WALLETS, beekeeper.get_info, beekeeper.all_public_keys))
+
+    # ASSERT
+    assert after_import == [KEY_2, KEY_1], "keys should be listed in order given by beekeeper"
+    assert all_after_import == [KEY_2, KEY_1, KEY_3], "keys should be listed in order given by beekeeper"
+    assert beekeeper.calls == [
+        "get_public_keys",
+        "get_public_keys_all",
+        "get_public_keys",
+        "get_public_keys_all",
+    ]
+
+
+def test_removed_key_is_forgotten_locally() -> None:
+    # ARRANGE
+    beekeeper = FakeBeekeeper()
+    state = SessionState()
+    state.public_keys(WALLET_NAME, beekeeper.get_info, beekeeper.wallet_public_keys)
+    state.public_keys(ALL_WALLETS, beekeeper.get_info, beekeeper.all_public_keys)
+
+    # ACT
+    state.on_key_removed(WALLET_NAME, KEY_1)
+    after_removal = state.public_keys(WALLET_NAME, beekeeper.get_info, beekeeper.wallet_public_keys)
+    state.public_keys(ALL_WALLETS, beekeeper.get_info, beekeeper.all_public_keys)
+
+    # ASSERT
+    assert KEY_1 not in after_removal
+    assert beekeeper.calls == [
+        "get_public_keys",
+        "get_public_keys_all",
+        "get_info",
+        "get_public_keys_all",
+    ], "removed key could be present in other wallet, so only keys of all wallets should be fetched again"
+
+
+class WalletObject(ContainsWalletName):
+    def __init__(self, name: str) -> None:
+        self.__name = name
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+
+def test_wallet_objects_are_interned_while_alive() -> None:
+    # ARRANGE
+    state = SessionState()
+    wallet = state.intern_wallet(WalletObject(WALLET_NAME))
+
+    # ACT
+    is_reused = state.interned_wallet(WalletObject, WALLET_NAME) is wallet
+    del wallet
+    gc.collect()
+
+    # ASSERT
+    assert is_reused, "Wallet should be reused as long as anyone holds it"
+    assert state.interned_wallet(WalletObject, WALLET_NAME) is None, "Interned wallets should be held weakly"
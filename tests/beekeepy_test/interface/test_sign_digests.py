@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from local_tools.beekeepy.account_credentials import AccountCredentials
+from local_tools.beekeepy.constants import DIGEST_TO_SIGN
+from local_tools.beekeepy.generators import default_wallet_credentials
+
+from beekeepy import AsyncBeekeeper, Beekeeper
+from beekeepy.exceptions import InvalidSchemaHexError, NotExistingKeyError
+
+if TYPE_CHECKING:
+    from local_tools.beekeepy.models import SettingsFactory
+
+
+def test_sign_digests_returns_signatures_in_order(settings: SettingsFactory) -> None:
+    # ARRANGE
+    wallet_name, wallet_password = default_wallet_credentials()
+    accounts = AccountCredentials.create_multiple(3)
+    with Beekeeper.factory(settings=settings()) as bk, bk.create_session() as session:
+        wallet = session.create_wallet(name=wallet_name, password=wallet_password)
+        wallet.import_keys(private_keys=[account.private_key for account in accounts])
+        expected = [wallet.sign_digest(sig_digest=DIGEST_TO_SIGN, key=account.public_key) for account in accounts]
+        pairs = [(DIGEST_TO_SIGN, account.public_key) for account in accounts]
+
+        # ACT
+        from_wallet = wallet.sign_digests(sig_digests_and_keys=pairs)
+        from_session = session.sign_digests(sig_digests_and_keys=pairs)
+
+    # ASSERT
+    assert from_wallet == expected
+    assert from_session == expected
+
+
+def test_sign_digests_returns_errors_of_single_items(settings: SettingsFactory) -> None:
+    # ARRANGE
+    wallet_name, wallet_password = default_wallet_credentials()
+    imported, not_imported = AccountCredentials.create_multiple(2)
+    with Beekeeper.factory(settings=settings()) as bk, bk.create_session() as session:
+        wallet = session.create_wallet(name=wallet_name, password=wallet_password)
+        wallet.import_key(private_key=imported.private_key)
+
+        # ACT
+        results = wallet.sign_digests(
+            sig_digests_and_keys=[(DIGEST_TO_SIGN, not_imported.public_key), (DIGEST_TO_SIGN, imported.public_key)]
+        )
+
+    # ASSERT
+    assert isinstance(results[0], NotExistingKeyError)
+    assert isinstance(results[1], str)
+
+
+def test_sign_digests_validates_input_before_sending(settings: SettingsFactory) -> None:
+    # ARRANGE
+    account = AccountCredentials.create()
+    pairs = [(DIGEST_TO_SIGN, account.public_key), ("xyz", account.public_key)]
+
+    # ACT & ASSERT
+    with Beekeeper.factory(settings=settings()) as bk, bk.create_session() as session, pytest.raises(
+        InvalidSchemaHexError
+    ):
+        session.sign_digests(sig_digests_and_keys=pairs)
+
+
+async def test_async_sign_digests(settings: SettingsFactory) -> None:
+    # ARRANGE
+    wallet_name, wallet_password = default_wallet_credentials()
+    accounts = AccountCredentials.create_multiple(2)
+    async with await AsyncBeekeeper.factory(settings=settings()) as bk, await bk.create_session() as session:
+        wallet = await session.create_wallet(name=wallet_name, password=wallet_password)
+        await wallet.import_keys(private_keys=[account.private_key for account in accounts])
+        expected = [await wallet.sign_digest(sig_digest=DIGEST_TO_SIGN, key=account.public_key) for account in accounts]
+
+        # ACT
+        results = await wallet.sign_digests(
+            sig_digests_and_keys=[(DIGEST_TO_SIGN, account.public_key) for account in accounts]
+        )
+
+    # ASSERT
+    assert results == expected
@@ -3,9 +3,13 @@ from __future__ import annotations
 from typing import Any
 
 from beekeepy.handle.remote import (
+    AbstractAsyncApi,
+    AbstractAsyncApiCollection,
+    AbstractAsyncHandle,
     AbstractSyncApi,
     AbstractSyncApiCollection,
     AbstractSyncHandle,
+    AsyncSendable,
     RemoteHandleSettings,
     SyncSendable,
 )
@@ -73,3 +77,64 @@ class TestCaller(AbstractSyncHandle[RemoteHandleSettings, TestApiCollection]):
 
     def batch(self, *, delay_error_on_data_access: bool = False) -> Any:
         raise NotImplementedError
+
+
+class EchoSchema(PreconfiguredBaseModel):
+    value: int
+
+
+class SyncEchoApi(AbstractSyncApi):
+    api = AbstractSyncApi.endpoint_jsonrpc
+
+    @classmethod
+    def _api_name(cls) -> str:
+        return "echo_api"
+
+    @classmethod
+    def _register_api(cls) -> bool:
+        """This is test api, no need to register it."""
+        return False
+
+    @api
+    def echo(self, *, value: int) -> EchoSchema:
+        raise NotImplementedError
+
+
+class SyncEchoApiCollection(AbstractSyncApiCollection):
+    def __init__(self, owner: SyncSendable) -> None:
+        super().__init__(owner)
+
+        self.echo_api = SyncEchoApi(owner=self._owner)
+
+
+class EchoApi(AbstractAsyncApi):
+    api = AbstractAsyncApi.endpoint_jsonrpc
+
+    @classmethod
+    def _register_api(cls) -> bool:
+        """This is test api, no need to register it."""
+        return False
+
+    @api
+    async def echo(self, *, value: int) -> EchoSchema:
+        raise NotImplementedError
+
+
+class EchoApiCollection(AbstractAsyncApiCollection):
+    def __init__(self, owner: AsyncSendable) -> None:
+        super().__init__(owner)
+
+        self.echo_api = EchoApi(owner=self._owner)
+
+
+class AsyncEchoCaller(AbstractAsyncHandle[RemoteHandleSettings, EchoApiCollection]):
+    def _construct_api(self) -> EchoApiCollection:
+        """Return api collection."""
+        return EchoApiCollection(owner=self)
+
+    def _target_service(self) -> str:
+        """Returns name of service that following handle is connecting to."""
+        return "echo_service"
+
+    async def batch(self, *, delay_error_on_data_access: bool = False) -> Any:
+        raise NotImplementedError
@@ -13,6 +13,7 @@ from aiohttp import web
 from beekeepy.interfaces import HttpUrl, SelfContextAsync
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from socket import socket
     from typing import Any, Iterator
 
@@ -54,10 +55,17 @@ class HttpServerObserver(ABC):
 class AsyncHttpServer(SelfContextAsync):
     __ADDRESS = HttpUrl("0.0.0.0:0")
 
-    def __init__(self, observer: HttpServerObserver, notification_endpoint: HttpUrl | None) -> None:
+    def __init__(
+        self,
+        observer: HttpServerObserver,
+        notification_endpoint: HttpUrl | None,
+        *,
+        unix_socket_path: Path | None = None,
+    ) -> None:
         self.__observer = observer
         self._app = web.Application()
-        self.__site: web.TCPSite | None = None
+        self.__site: web.TCPSite | web.UnixSite | None = None
+        self.__unix_socket_path = unix_socket_path
         self.__running: bool = False
         self.__notification_endpoint = notification_endpoint
         self._setup_routes()
@@ -95,8 +103,11 @@ class AsyncHttpServer(SelfContextAsync):
 
         runner = web.AppRunner(self._app, access_log=False)
         await runner.setup()
-        address = self.__notification_endpoint or self.__ADDRESS
-        self.__site = web.TCPSite(runner, address.address, address.port)
+        if self.__unix_socket_path is not None:
+            self.__site = web.UnixSite(runner, self.__unix_socket_path.as_posix())
+        else:
+            address = self.__notification_endpoint or self.__ADDRESS
+            self.__site = web.TCPSite(runner, address.address, address.port)
         await self.__site.start()
         self.__running = True
         try:
@@ -125,9 +136,9 @@ class DummyObserver(HttpServerObserver):
 
 
 class TestAsyncHttpServer(AsyncHttpServer):
-    def __init__(self, response: str) -> None:
+    def __init__(self, response: str, *, unix_socket_path: Path | None = None) -> None:
         self.__response = response
-        super().__init__(DummyObserver(), None)
+        super().__init__(DummyObserver(), None, unix_socket_path=unix_socket_path)
 
     def _setup_routes(self) -> None:
         async def handle_post_method(request: web.Request) -> web.Response:  # noqa: ARG001
@@ -136,8 +147,27 @@ class TestAsyncHttpServer(AsyncHttpServer):
         self._app.router.add_route("POST", "/", handle_post_method)
 
 
-def create_simple_server(response: str) -> TestAsyncHttpServer:
-    return TestAsyncHttpServer(response=response)
+class JsonRpcEchoServer(AsyncHttpServer):
+    """Responds to every jsonrpc request (also batched) with its params as result, records received bodies."""
+
+    def __init__(self) -> None:
+        self.received: list[Any] = []
+        super().__init__(DummyObserver(), None)
+
+    def _setup_routes(self) -> None:
+        def echo(request: dict[str, Any]) -> dict[str, Any]:
+            return {"jsonrpc": "2.0", "id": request["id"], "result": request.get("params", {})}
+
+        async def handle_post_method(request: web.Request) -> web.Response:
+            body = await request.json()
+            self.received.append(body)
+            return web.json_response([echo(item) for item in body] if isinstance(body, list) else echo(body))
+
+        self._app.router.add_route("POST", "/", handle_post_method)
+
+
+def create_simple_server(response: str, *, unix_socket_path: Path | None = None) -> TestAsyncHttpServer:
+    return TestAsyncHttpServer(response=response, unix_socket_path=unix_socket_path)
 
 
 @contextmanager
@@ -153,3 +183,33 @@ def run_simple_server(response: str) -> Iterator[HttpUrl]:
     finally:
         server.close()
         worker.join()
+
+
+@contextmanager
+def run_simple_unix_server(response: str, unix_socket_path: Path) -> Iterator[HttpUrl]:
+    server = create_simple_server(response, unix_socket_path=unix_socket_path)
+
+    worker = Thread(target=asyncio.run, args=(server.run(),))
+    worker.start()
+    time.sleep(0.5)
+
+    try:
+        yield HttpUrl("http://localhost")
+    finally:
+        server.close()
+        worker.join()
+
+
+@contextmanager
+def run_jsonrpc_echo_server() -> Iterator[tuple[HttpUrl, JsonRpcEchoServer]]:
+    server = JsonRpcEchoServer()
+
+    worker = Thread(target=asyncio.run, args=(server.run(),))
+    worker.start()
+    time.sleep(0.5)
+
+    try:
+        yield HttpUrl(f"http://127.0.0.1:{server.port}"), server
+    finally:
+        server.close()
+        worker.join()